@@ -15,6 +15,8 @@ class action_pop_mpls(ofp_action_pop_mpls):
     @arg ethertype
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_pop_mpls.__init__(self)
         self.type = OFPAT_POP_MPLS
@@ -35,6 +37,8 @@ class action_push_vlan(ofp_action_push):
     @arg ethertype
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_push.__init__(self)
         self.type = OFPAT_PUSH_VLAN
@@ -55,6 +59,8 @@ class action_experimenter(ofp_action_experimenter_header):
     @arg experimenter
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_experimenter_header.__init__(self)
         self.type = OFPAT_EXPERIMENTER
@@ -74,6 +80,8 @@ class action_dec_mpls_ttl(ofp_action_header):
     @arg len
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_header.__init__(self)
         self.type = OFPAT_DEC_MPLS_TTL
@@ -94,6 +102,8 @@ class action_set_nw_ttl(ofp_action_nw_ttl):
     @arg nw_ttl
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_nw_ttl.__init__(self)
         self.type = OFPAT_SET_NW_TTL
@@ -113,6 +123,8 @@ class action_copy_ttl_in(ofp_action_header):
     @arg len
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_header.__init__(self)
         self.type = OFPAT_COPY_TTL_IN
@@ -133,6 +145,8 @@ class action_group(ofp_action_group):
     @arg group_id
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_group.__init__(self)
         self.type = OFPAT_GROUP
@@ -155,6 +169,8 @@ class action_set_queue(ofp_action_set_queue):
     @arg queue_id
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_set_queue.__init__(self)
         self.type = OFPAT_SET_QUEUE
@@ -175,6 +191,8 @@ class action_push_mpls(ofp_action_push):
     @arg ethertype
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_push.__init__(self)
         self.type = OFPAT_PUSH_MPLS
@@ -194,6 +212,8 @@ class action_copy_ttl_out(ofp_action_header):
     @arg len
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_header.__init__(self)
         self.type = OFPAT_COPY_TTL_OUT
@@ -214,6 +234,8 @@ class action_set_field(ofp_action_set_field):
     @arg field
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_set_field.__init__(self)
         self.type = OFPAT_SET_FIELD
@@ -235,16 +257,15 @@ class action_set_field(ofp_action_set_field):
         return packed
     
     def unpack(self, binary_string):
-        if len(binary_string) <= 8:
-            binary_string = ofp_action_set_field.unpack(self)
-        else: 
-            (self.type, self.len) = struct.unpack("!HH",  binary_string[0:4])
-            binary_string = binary_string[4:]
-            binary_string = self.field.unpack(binary_string, bytes = self.len - 4)
-            padding_size = roundup(len(self.field) -4,8) -  (len(self.field) -4) 
-            if padding_size:
-                binary_string = binary_string[padding_size:]
-        return binary_string
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        if len(buffer) - offset <= 8:
+            return ofp_action_set_field.unpack_from(self, buffer, offset)
+        (self.type, self.len) = struct.unpack_from("!HH", buffer, offset)
+        offset = self.field.unpack_from(buffer, offset + 4, bytes = self.len - 4)
+        padding_size = roundup(len(self.field) -4,8) -  (len(self.field) -4) 
+        return offset + padding_size
         
     def show(self, prefix=''):
         outstr = prefix + "action_set_field\n"
@@ -265,6 +286,8 @@ class action_set_mpls_ttl(ofp_action_mpls_ttl):
     @arg mpls_ttl
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_mpls_ttl.__init__(self)
         self.type = OFPAT_SET_MPLS_TTL
@@ -284,6 +307,8 @@ class action_pop_vlan(ofp_action_header):
     @arg len
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_header.__init__(self)
         self.type = OFPAT_POP_VLAN
@@ -303,6 +328,8 @@ class action_dec_nw_ttl(ofp_action_header):
     @arg len
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_header.__init__(self)
         self.type = OFPAT_DEC_NW_TTL
@@ -324,6 +351,8 @@ class action_output(ofp_action_output):
     @arg max_len
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_action_output.__init__(self)
         self.type = OFPAT_OUTPUT
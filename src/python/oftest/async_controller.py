@@ -0,0 +1,1038 @@
+"""
+OpenFlow Test Framework
+
+AsyncController class
+
+Event driven alternative to the threaded Controller class.  All switch
+connections are serviced from a single asyncore loop: there is no
+per-connection thread, no select timeout to wait out on shutdown and
+no lock on the receive path.
+
+Each connection is a SwitchConnection protocol object which frames
+the incoming stream, completes pending transactions, answers echo
+requests and queues everything else.  Requests such as transact and
+poll return a Future which completes from the loop when the answer
+arrives; callbacks may be chained on it or, from another thread, the
+result may be waited on.
+
+Other threads hand work to the loop with call_soon, which wakes the
+loop through a pipe.  ThreadedController runs the loop in a thread
+of its own and provides the blocking connect, message_send, transact,
+poll and register calls of Controller on top of it.
+
+MultiController accepts any number of switches on one listening
+socket, identifies each by the datapath ID in its features reply and
+services them all from the same loop, so a rack of switches may be
+tested in parallel.  ThreadedMultiController gives each switch a
+blocking SwitchHandle.
+
+"""
+
+import os
+import sys
+import errno
+import fcntl
+import socket
+import asyncore
+import logging
+import time
+import traceback
+from collections import deque
+from threading import Thread
+from threading import Event
+from threading import Lock
+from message import *
+from parse import *
+from ofutils import *
+from controller import MessageQueue
+from controller import MessageBatch
+from controller import message_pack
+from controller import BATCH_BYTES_DEFAULT
+from controller import _transact_merge
+from controller import RCV_SIZE_DEFAULT
+from controller import LISTEN_QUEUE_SIZE
+
+MULTI_LISTEN_QUEUE_SIZE = 128
+
+class Future(object):
+    """
+    Pending result of an asynchronous request
+
+    A future is completed exactly once, either with the (msg, pkt)
+    pair answering the request or by cancel.  Callbacks run in the
+    thread completing the future, normally the loop thread.
+
+    @var xid The transaction ID of the request, if any
+    """
+
+    def __init__(self, xid=None):
+        self.xid = xid
+        self._result = None
+        self._done = Event()
+        self._lock = Lock()
+        self._callbacks = []
+
+    def done(self):
+        """
+        @return True if the future was completed or cancelled
+        """
+        return self._done.is_set()
+
+    def set_result(self, result):
+        """
+        Complete the future
+
+        @param result The (msg, pkt) pair
+        @return False if the future was already complete (e.g. the
+        waiter gave up and cancelled it), True otherwise
+        """
+        self._lock.acquire()
+        if self._done.is_set():
+            self._lock.release()
+            return False
+        self._result = result
+        self._done.set()
+        callbacks = self._callbacks
+        self._callbacks = []
+        self._lock.release()
+        for callback in callbacks:
+            callback(self)
+        return True
+
+    def cancel(self):
+        """
+        Complete the future with no result
+        @return True if the future was cancelled, False if a result
+        arrived first
+        """
+        return self.set_result(None)
+
+    def add_callback(self, callback):
+        """
+        Call callback(future) once the future completes; immediately if
+        it is already complete
+        """
+        self._lock.acquire()
+        if not self._done.is_set():
+            self._callbacks.append(callback)
+            self._lock.release()
+            return
+        self._lock.release()
+        callback(self)
+
+    def result(self, timeout=None):
+        """
+        Wait for the future to complete
+
+        Must not be called from the loop thread unless the future is
+        already done; use AsyncController.run_until there.
+
+        @param timeout If None, block until complete.  Otherwise block
+        for up to timeout seconds
+        @return The (msg, pkt) pair, or (None, None) if the future is not
+        complete or was cancelled
+        """
+        self._done.wait(timeout)
+        if self._result is None:
+            return (None, None)
+        return self._result
+
+class SwitchConnection(asyncore.dispatcher):
+    """
+    Protocol object for one switch connection
+
+    Messages received are handled in the same order of precedence as
+    in Controller: pending transactions, pending polls, keep alive
+    echo replies, registered handlers, then the receive queue.
+
+    All methods must be called from the loop thread.
+
+    @var engine The AsyncController owning this connection
+    @var packets The receive queue, a MessageQueue
+    @var handlers Map from message type (or "all") to handler for this
+    connection only; handlers are called as handler(connection, msg, pkt).
+    Handlers registered with the engine apply when none is set here
+    @var datapath_id The switch datapath ID if known
+    """
+
+    def __init__(self, engine, sock=None, addr=None):
+        asyncore.dispatcher.__init__(self, sock, map=engine.map)
+        self.engine = engine
+        self.logger = engine.logger
+        if addr is not None:
+            self.addr = addr
+        self.rcv_buf = bytearray()
+        self.snd_buf = bytearray()
+        self.packets = MessageQueue(engine.max_pkts)
+        self.handlers = {}
+        self.xid_pending = {}
+        self.pollers = deque()
+        self.datapath_id = None
+
+        # Counters
+        self.parse_errors = 0
+        self.packets_total = 0
+        self.packets_expired = 0
+        self.packets_handled = 0
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return self.connecting or len(self.snd_buf) > 0
+
+    def handle_connect(self):
+        self.engine._connection_up(self)
+
+    def handle_read(self):
+        pkt = self.recv(self.engine.rcv_size)
+        if not pkt:
+            return   # Closed; recv already called handle_close
+        self.rcv_buf.extend(pkt)
+        rawmsgs = of_message_split(self.rcv_buf)
+        if rawmsgs is None:
+            self.logger.info("Bad header length in received stream")
+            self.parse_errors += 1
+            return
+        for rawmsg in rawmsgs:
+            if not self._msg_handle(rawmsg):
+                return
+
+    def handle_write(self):
+        if len(self.snd_buf) == 0:
+            return
+        sent = self.send(buffer(self.snd_buf))
+        del self.snd_buf[:sent]
+
+    def handle_close(self):
+        self.logger.info("Switch connection closed: " + str(self.addr))
+        self.close()
+        for (future, _) in self.xid_pending.values():
+            future.cancel()
+        self.xid_pending = {}
+        for (_, future) in self.pollers:
+            future.cancel()
+        self.pollers.clear()
+        self.engine._connection_down(self)
+
+    def handle_error(self):
+        (etype, info, tb) = sys.exc_info()
+        self.logger.error("Error on switch connection %s: %s::%s\n%s" %
+                          (str(self.addr), str(etype), info,
+                           "\n".join(traceback.format_tb(tb))))
+        self.handle_close()
+
+    def _msg_handle(self, rawmsg):
+        """
+        Dispatch one received message
+        @return False if the connection was closed
+        """
+        msg = of_message_parse(rawmsg)
+        if not msg:
+            self.parse_errors += 1
+            self.logger.warn("Could not parse message")
+            return True
+        hdr = msg.header
+        if hdr.version != OFP_VERSION:
+            self.logger.error("Version %d does not match OFTest version %d"
+                              % (hdr.version, OFP_VERSION))
+            self.handle_close()
+            return False
+
+        # Check if transaction is waiting
+        if hdr.xid and hdr.xid in self.xid_pending:
+            (future, responses) = self.xid_pending[hdr.xid]
+            if not future.done():
+                responses.append((msg, rawmsg))
+                # Multipart replies complete with the last segment
+                if (hdr.type == OFPT_STATS_REPLY and
+                        msg.flags & OFPSF_REPLY_MORE):
+                    return True
+                del self.xid_pending[hdr.xid]
+                future.set_result(_transact_merge(responses))
+                return True
+            # Waiter gave up; handle the message as unsolicited
+            del self.xid_pending[hdr.xid]
+
+        # Check if anyone waiting on this type of message
+        for entry in list(self.pollers):
+            (exp_msg, future) = entry
+            if future.done():
+                self.pollers.remove(entry)   # Cancelled by the waiter
+            elif exp_msg is None or exp_msg == hdr.type:
+                self.pollers.remove(entry)
+                if future.set_result((msg, rawmsg)):
+                    return True
+
+        # Check if keep alive is set; if so, respond to echo requests
+        if self.engine.keep_alive and hdr.type == OFPT_ECHO_REQUEST:
+            rep = echo_reply()
+            rep.header.xid = hdr.xid
+            self.message_send(rep, zero_xid=True)
+            return True
+
+        handled = False
+        handler = self._handler_get(hdr.type)
+        if handler:
+            handled = handler(self, msg, rawmsg)
+        if not handled:
+            handler = self._handler_get("all")
+            if handler:
+                handled = handler(self, msg, rawmsg)
+
+        if not handled:
+            self.packets_expired += self.packets.put(hdr.type, msg, rawmsg)
+            self.packets_total += 1
+        else:
+            self.packets_handled += 1
+        return True
+
+    def _handler_get(self, msg_type):
+        if msg_type in self.handlers:
+            return self.handlers[msg_type]
+        return self.engine.handlers.get(msg_type)
+
+    def message_send(self, msg, zero_xid=False):
+        """
+        Queue a message for sending to the switch
+
+        @param msg A string or OpenFlow message object
+        @param zero_xid If msg is an object with a 0 XID, keep the 0
+        rather than generating an XID
+        @return -1 if error, 0 on success
+        """
+        if not self.connected and not self.connecting:
+            self.logger.info("message_send: not connected")
+            return -1
+        if type(msg) != type(""):
+            if msg.header.xid == 0 and not zero_xid:
+                msg.header.xid = gen_xid()
+            msg = msg.pack()
+        self.snd_buf.extend(msg)
+        if self.connected:
+            self.handle_write()
+        return 0
+
+    def transact(self, msg, zero_xid=False, future=None, prefix=""):
+        """
+        Send a message and return a future for the reply
+
+        Multipart stats replies are collected as in Controller.transact.
+
+        @param msg The message object to send; must not be a string
+        @param zero_xid Do not generate an XID for a 0 XID
+        @param future If given, the future to complete
+        @param prefix Packed messages to send ahead of msg in the same
+        write
+        @return A Future completed with the (msg, pkt) reply
+        """
+        if not zero_xid and msg.header.xid == 0:
+            msg.header.xid = gen_xid()
+        if future is None:
+            future = Future()
+        future.xid = msg.header.xid
+        if future.xid in self.xid_pending:
+            self.logger.error("Transaction already pending for xid " +
+                              str(future.xid))
+            future.cancel()
+            return future
+        self.xid_pending[future.xid] = (future, [])
+        if self.message_send(prefix + msg.pack()) < 0:
+            del self.xid_pending[future.xid]
+            future.cancel()
+        return future
+
+    def forget(self, future):
+        """
+        Drop a cancelled transaction or poll so it holds no state
+        """
+        entry = self.xid_pending.get(future.xid)
+        if entry is not None and entry[0] is future:
+            del self.xid_pending[future.xid]
+        for entry in self.pollers:
+            if entry[1] is future:
+                self.pollers.remove(entry)
+                break
+
+    def poll(self, exp_msg=None, future=None, wait=True):
+        """
+        Return a future for the next message of the given type
+
+        @param exp_msg If set, the type of message wanted
+        @param future If given, the future to complete
+        @param wait If False and no message is queued, complete the
+        future with (None, None) at once
+        @return A Future completed with the (msg, pkt) pair
+        """
+        if future is None:
+            future = Future()
+        (msg, pkt) = self.packets.get(exp_msg)
+        if msg is not None:
+            future.set_result((msg, pkt))
+        elif not wait:
+            future.set_result((None, None))
+        else:
+            self.pollers.append((exp_msg, future))
+        return future
+
+    def register(self, msg_type, handler):
+        """
+        Register a callback for a message type on this connection only;
+        see Controller.register
+        """
+        if not handler and msg_type in self.handlers:
+            del self.handlers[msg_type]
+            return
+        self.handlers[msg_type] = handler
+
+class _Listener(asyncore.dispatcher):
+    """
+    Listening socket accepting switch connections
+    """
+
+    def __init__(self, engine, backlog):
+        asyncore.dispatcher.__init__(self, map=engine.map)
+        self.engine = engine
+        self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.set_reuse_addr()
+        self.bind(('', engine.port))
+        self.listen(backlog)
+
+    def handle_accept(self):
+        pair = self.accept()
+        if pair is None:
+            return
+        (sock, addr) = pair
+        self.engine.logger.info("Got connection from %s:%d" %
+                                (addr[0], addr[1]))
+        conn = SwitchConnection(self.engine, sock, addr)
+        self.engine._connection_up(conn)
+
+    def handle_error(self):
+        self.engine.logger.error("Error on listen socket", exc_info=True)
+
+class _Wakeup(asyncore.file_dispatcher):
+    """
+    Pipe used by other threads to interrupt the loop
+    """
+
+    def __init__(self, engine):
+        (rfd, self.wfd) = os.pipe()
+        asyncore.file_dispatcher.__init__(self, rfd, map=engine.map)
+        os.close(rfd)   # file_dispatcher keeps a dup
+        flags = fcntl.fcntl(self.wfd, fcntl.F_GETFL)
+        fcntl.fcntl(self.wfd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        self.engine = engine
+
+    def writable(self):
+        return False
+
+    def handle_read(self):
+        self.recv(4096)
+
+    def notify(self):
+        if self.wfd is None:
+            return   # Loop has exited
+        try:
+            os.write(self.wfd, "x")
+        except OSError, e:
+            # A full pipe already guarantees a wakeup
+            if e.errno != errno.EAGAIN:
+                raise
+
+    def close(self):
+        asyncore.file_dispatcher.close(self)
+        if self.wfd is not None:
+            os.close(self.wfd)
+            self.wfd = None
+
+class AsyncController(object):
+    """
+    Event driven control channel to the switch under test
+
+    Call run() to service the connection from the current thread, or
+    use ThreadedController.  The request methods (message_send,
+    transact, poll, register) apply to the switch connection and must
+    be called from the loop thread; other threads use call_soon.
+
+    @var host The host to connect to; if None, listen on port instead
+    @var port The port to connect or listen on; if 0 when listening,
+    set to the port chosen by the system once started
+    @var switch The SwitchConnection to the switch, once connected
+    @var keep_alive If true, answer echo requests
+    @var initial_hello If true, send a hello upon connecting
+    """
+
+    def __init__(self, host='127.0.0.1', port=6633, max_pkts=1024):
+        self.host = host
+        self.port = port
+        self.max_pkts = max_pkts
+        self.rcv_size = RCV_SIZE_DEFAULT
+        self.keep_alive = False
+        self.initial_hello = True
+        self.logger = logging.getLogger("async_controller")
+
+        self.map = {}
+        self.handlers = {}
+        self.switch = None
+        self.listener = None
+        self.connect_waiters = []
+        self.calls = deque()
+        self.wakeup = _Wakeup(self)
+        self.listen_queue_size = LISTEN_QUEUE_SIZE
+        self.started = False
+        self.running = False
+
+    def start(self):
+        """
+        Start connecting (if host is set) or listening for the switch
+
+        Called by run if not called before.
+        """
+        self.started = True
+        if self.host:
+            conn = SwitchConnection(self)
+            conn.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.logger.info("Connecting to %s:%d" % (self.host, self.port))
+            conn.connect((self.host, self.port))
+        else:
+            self.listener = _Listener(self, self.listen_queue_size)
+            self.port = self.listener.socket.getsockname()[1]
+            self.logger.info("Listening on port %d" % self.port)
+
+    def _socket_setup(self, conn):
+        try:
+            conn.socket.setsockopt(socket.IPPROTO_TCP,
+                                   socket.TCP_NODELAY, 1)
+        except socket.error, e:
+            self.logger.error("Failed to set TCP_NODELAY: " + str(e))
+
+    def _connection_up(self, conn):
+        self._socket_setup(conn)
+        if self.switch is not None:
+            self.logger.warning("Already connected; closing " +
+                                str(conn.addr))
+            conn.close()
+            return
+        self.switch = conn
+        if self.initial_hello:
+            conn.message_send(hello())
+        waiters = self.connect_waiters
+        self.connect_waiters = []
+        for future in waiters:
+            future.set_result((conn, None))
+
+    def _connection_down(self, conn):
+        if self.switch is conn:
+            self.switch = None
+
+    def call_soon(self, fn, *args):
+        """
+        Have the loop thread call fn(*args); safe from any thread
+        """
+        self.calls.append((fn, args))
+        self.wakeup.notify()
+
+    def _calls_run(self):
+        while self.calls:
+            (fn, args) = self.calls.popleft()
+            try:
+                fn(*args)
+            except StandardError:
+                self.logger.error("Error in loop call", exc_info=True)
+
+    def loop_once(self, timeout=None):
+        """
+        Wait for and handle one round of socket events
+
+        @param timeout If None, block until an event.  Otherwise, block
+        for up to timeout seconds
+        """
+        self._calls_run()
+        asyncore.loop(timeout=timeout, use_poll=True, map=self.map, count=1)
+        self._calls_run()
+
+    def run(self):
+        """
+        Service connections until stop is called
+        """
+        self.running = True
+        if not self.started:
+            self.start()
+        while self.running:
+            self.loop_once()
+        self.close()
+
+    def run_until(self, future, timeout=None):
+        """
+        Service connections from this thread until future completes
+
+        @param timeout If not None, give up after timeout seconds
+        @return The result of the future; see Future.result
+        """
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+        while not future.done():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+            self.loop_once(remaining)
+        return future.result(0)
+
+    def stop(self):
+        """
+        Make run return; safe from any thread and takes effect at once
+        """
+        self.running = False
+        self.wakeup.notify()
+
+    def close(self):
+        """
+        Close all sockets
+        """
+        for obj in self.map.values():
+            obj.close()
+        self.switch = None
+        self.listener = None
+
+    def connect(self, future=None):
+        """
+        @return A Future completed when the switch is connected
+        """
+        if future is None:
+            future = Future()
+        if self.switch is not None:
+            future.set_result((self.switch, None))
+        else:
+            self.connect_waiters.append(future)
+        return future
+
+    def forget(self, future):
+        """
+        Drop a cancelled request; see SwitchConnection.forget
+        """
+        if self.switch is not None:
+            self.switch.forget(future)
+
+    def message_send(self, msg, zero_xid=False):
+        """
+        Send a message to the switch; see SwitchConnection.message_send
+        """
+        if self.switch is None:
+            self.logger.info("message_send: no switch connection")
+            return -1
+        return self.switch.message_send(msg, zero_xid=zero_xid)
+
+    def transact(self, msg, zero_xid=False, future=None, prefix=""):
+        """
+        Run a transaction with the switch; see SwitchConnection.transact
+        """
+        if self.switch is None:
+            if future is None:
+                future = Future()
+            future.cancel()
+            return future
+        return self.switch.transact(msg, zero_xid=zero_xid, future=future,
+                                    prefix=prefix)
+
+    def poll(self, exp_msg=None, future=None, wait=True):
+        """
+        Poll for a message from the switch; see SwitchConnection.poll
+        """
+        if self.switch is None:
+            if future is None:
+                future = Future()
+            future.cancel()
+            return future
+        return self.switch.poll(exp_msg, future=future, wait=wait)
+
+    def register(self, msg_type, handler):
+        """
+        Register a message handler; see Controller.register
+        """
+        if not handler and msg_type in self.handlers:
+            del self.handlers[msg_type]
+            return
+        self.handlers[msg_type] = handler
+
+class MultiController(AsyncController):
+    """
+    Event driven control channel to many switches at once
+
+    Listens on port and accepts any number of switch connections,
+    all serviced from the one loop.  Each new connection is sent a
+    features request; once the reply arrives the connection is
+    entered in switches under its datapath ID.  A switch reconnecting
+    with a known datapath ID replaces its old connection.
+
+    Each SwitchConnection has its own receive queue and handlers, so
+    requests are made on the connection: switches[dpid].transact(...).
+
+    @var switches Map from datapath ID to SwitchConnection
+    @var max_switches If set, refuse connections beyond this number
+    """
+
+    def __init__(self, host=None, port=6633, max_pkts=1024,
+                 max_switches=None):
+        AsyncController.__init__(self, host, port, max_pkts)
+        self.listen_queue_size = MULTI_LISTEN_QUEUE_SIZE
+        self.max_switches = max_switches
+        self.switches = {}
+        self.pending = set()
+
+    def start(self):
+        """
+        Start listening for switches
+        """
+        self.started = True
+        self.listener = _Listener(self, self.listen_queue_size)
+        self.port = self.listener.socket.getsockname()[1]
+        self.logger.info("Listening on port %d" % self.port)
+
+    def _connection_up(self, conn):
+        self._socket_setup(conn)
+        if (self.max_switches is not None and
+                len(self.switches) + len(self.pending) >= self.max_switches):
+            self.logger.warning("Switch limit reached; closing " +
+                                str(conn.addr))
+            conn.close()
+            return
+        self.pending.add(conn)
+        if self.initial_hello:
+            conn.message_send(hello())
+        future = conn.transact(features_request())
+        future.add_callback(lambda f: self._features_handle(conn, f))
+
+    def _features_handle(self, conn, future):
+        (reply, pkt) = future.result(0)
+        self.pending.discard(conn)
+        if reply is None:
+            self.logger.warning("No features reply from " + str(conn.addr))
+            if conn.connected:
+                conn.close()
+            return
+        dpid = reply.datapath_id
+        conn.datapath_id = dpid
+        old = self.switches.get(dpid)
+        if old is not None:
+            self.logger.warning("Datapath %x reconnected from %s" %
+                                (dpid, str(conn.addr)))
+            old.handle_close()
+        self.switches[dpid] = conn
+        self.logger.info("Datapath %x connected from %s" %
+                         (dpid, str(conn.addr)))
+        self._connect_waiters_check()
+
+    def _connection_down(self, conn):
+        self.pending.discard(conn)
+        if self.switches.get(conn.datapath_id) is conn:
+            del self.switches[conn.datapath_id]
+
+    def _connect_waiters_check(self):
+        waiters = []
+        for (count, future) in self.connect_waiters:
+            if len(self.switches) >= count:
+                future.set_result((sorted(self.switches.keys()), None))
+            elif not future.done():
+                waiters.append((count, future))
+        self.connect_waiters = waiters
+
+    def close(self):
+        AsyncController.close(self)
+        self.switches = {}
+        self.pending = set()
+
+    def connect(self, count=1, future=None):
+        """
+        @param count The number of switches to wait for
+        @return A Future completed with (datapath IDs, None) once at least
+        count switches have been identified
+        """
+        if future is None:
+            future = Future()
+        self.connect_waiters.append((count, future))
+        self._connect_waiters_check()
+        return future
+
+    def forget(self, future):
+        """
+        Drop a cancelled request; see SwitchConnection.forget
+        """
+        for conn in self.switches.values():
+            conn.forget(future)
+
+class SwitchHandle(object):
+    """
+    Blocking Controller API for a connection serviced by another thread
+
+    Provides message_send, transact, poll and register with the same
+    arguments and results as Controller, carrying each request over to
+    the loop thread.  Handlers are called from the loop thread with the
+    SwitchConnection as their first argument.
+
+    @var engine The AsyncController servicing the connection
+    @var target The SwitchConnection (or single switch AsyncController)
+    the requests apply to
+    """
+
+    def __init__(self, engine, target):
+        self.engine = engine
+        self.target = target
+        self.logger = engine.logger
+
+    def _connected(self):
+        return self.target.connected
+
+    def _wait(self, fn, args, timeout, **kwargs):
+        """
+        Call fn(*args, future=f, **kwargs) in the loop and wait for f
+        """
+        future = Future()
+        if self.engine.wakeup.wfd is None:
+            return (None, None)   # Loop has exited
+        kwargs['future'] = future
+        self.engine.call_soon(lambda: fn(*args, **kwargs))
+        result = future.result(timeout)
+        if future.cancel():
+            self.engine.call_soon(self.target.forget, future)
+        return result
+
+    def message_send(self, msg, zero_xid=False):
+        """
+        Send a message to the switch; see Controller.message_send
+        """
+        if not self._connected():
+            self.logger.info("message_send: no switch connection")
+            return -1
+        outpkt = message_pack(msg, zero_xid, self.logger)
+        if outpkt is None:
+            return -1
+        self.engine.call_soon(self.target.message_send, outpkt)
+        return 0
+
+    def message_send_many(self, msgs, zero_xid=False, barrier=False,
+                          timeout=5):
+        """
+        Send messages with a single write; see Controller.message_send_many
+        """
+        outpkts = []
+        for msg in msgs:
+            outpkt = message_pack(msg, zero_xid, self.logger)
+            if outpkt is None:
+                return -1
+            outpkts.append(outpkt)
+        if not barrier:
+            if not outpkts:
+                return 0
+            return self.message_send("".join(outpkts))
+        if not self._connected():
+            self.logger.info("message_send_many: no switch connection")
+            return -1
+        # The barrier goes in the same write, its XID registered first
+        request = barrier_request()
+        request.header.xid = gen_xid()
+        (resp, pkt) = self._wait(self.target.transact, (request,), timeout,
+                                 zero_xid=True, prefix="".join(outpkts))
+        if resp is None:
+            return -1
+        return 0
+
+    def batch(self, barrier=False, timeout=5, max_bytes=BATCH_BYTES_DEFAULT):
+        """
+        Return a MessageBatch; see Controller.batch
+        """
+        return MessageBatch(self, barrier=barrier, timeout=timeout,
+                            max_bytes=max_bytes)
+
+    def transact(self, msg, timeout=5, zero_xid=False):
+        """
+        Run a transaction with the switch; see Controller.transact
+        """
+        if not zero_xid and msg.header.xid == 0:
+            msg.header.xid = gen_xid()
+        (resp, pkt) = self._wait(self.target.transact, (msg,), timeout,
+                                 zero_xid=True)
+        if resp is None:
+            self.logger.warning("No response for xid " + str(msg.header.xid))
+        return (resp, pkt)
+
+    def poll(self, exp_msg=None, timeout=None):
+        """
+        Wait for a message from the switch; see Controller.poll
+        """
+        if not exp_msg:
+            exp_msg = None
+        if timeout is None or timeout <= 0:
+            return self._wait(self.target.poll, (exp_msg,), None, wait=False)
+        return self._wait(self.target.poll, (exp_msg,), timeout)
+
+    def messages(self, exp_msg=None, timeout=1):
+        """
+        Iterate over messages from the switch as they arrive
+
+        @param exp_msg If set, only yield messages of this type
+        @param timeout Stop when no message arrives for this many seconds
+        @return A generator of (msg, pkt) pairs
+        """
+        while True:
+            (msg, pkt) = self.poll(exp_msg, timeout)
+            if msg is None:
+                return
+            yield (msg, pkt)
+
+    def register(self, msg_type, handler):
+        """
+        Register a message handler; see Controller.register
+        """
+        self.engine.call_soon(self.target.register, msg_type, handler)
+
+    @property
+    def switch_addr(self):
+        return self.target.addr
+
+class ThreadedController(SwitchHandle, Thread):
+    """
+    Blocking Controller API running an AsyncController in a thread
+
+    Provides connect, kill and shutdown as in Controller, in addition
+    to the requests of SwitchHandle.
+
+    @var engine The AsyncController run by this thread
+    """
+
+    def __init__(self, host='127.0.0.1', port=6633, max_pkts=1024):
+        Thread.__init__(self)
+        engine = AsyncController(host, port, max_pkts)
+        SwitchHandle.__init__(self, engine, engine)
+
+    def start(self):
+        """
+        Start connecting or listening, then start the loop thread
+        """
+        self.engine.start()
+        Thread.start(self)
+
+    def run(self):
+        self.engine.run()
+
+    def _connected(self):
+        return self.engine.switch is not None
+
+    def connect(self, timeout=None):
+        """
+        Wait for the switch connection
+        @return Boolean, True if connected
+        """
+        if self.engine.switch is not None:
+            return True
+        if timeout == 0:
+            return False
+        (conn, _) = self._wait(self.engine.connect, (), timeout)
+        return conn is not None
+
+    def kill(self):
+        """
+        Force the controller thread to quit; takes effect at once
+        """
+        self.engine.stop()
+
+    def shutdown(self):
+        """
+        Stop the loop, which closes all sockets on exit
+        """
+        self.engine.stop()
+
+    @property
+    def active(self):
+        return self.engine.running
+
+    @property
+    def switch_addr(self):
+        if self.engine.switch is None:
+            return None
+        return self.engine.switch.addr
+
+class ThreadedMultiController(Thread):
+    """
+    Run a MultiController in a thread, with blocking access per switch
+
+        ctrl = ThreadedMultiController(port=6633)
+        ctrl.start()
+        for dpid in ctrl.connect(count=4, timeout=30):
+            switch = ctrl.switch(dpid)
+            switch.transact(message.echo_request())
+
+    @var engine The MultiController run by this thread
+    """
+
+    def __init__(self, port=6633, max_pkts=1024, max_switches=None):
+        Thread.__init__(self)
+        self.engine = MultiController(port=port, max_pkts=max_pkts,
+                                      max_switches=max_switches)
+        self.logger = self.engine.logger
+
+    def start(self):
+        """
+        Start listening, then start the loop thread
+        """
+        self.engine.start()
+        Thread.start(self)
+
+    def run(self):
+        self.engine.run()
+
+    def connect(self, count=1, timeout=None):
+        """
+        Wait for count switches to connect and be identified
+        @return The sorted list of connected datapath IDs, which has
+        fewer than count entries on timeout
+        """
+        future = Future()
+        self.engine.call_soon(self.engine.connect, count, future)
+        (dpids, _) = future.result(timeout)
+        if future.cancel():
+            self.engine.call_soon(self.engine.forget, future)
+        if dpids is None:
+            return self.datapath_ids()
+        return dpids
+
+    def datapath_ids(self):
+        """
+        @return The sorted list of connected datapath IDs
+        """
+        return sorted(self.engine.switches.keys())
+
+    def switch(self, dpid):
+        """
+        @return A SwitchHandle for the switch with the given datapath ID,
+        or None if no such switch is connected
+        """
+        conn = self.engine.switches.get(dpid)
+        if conn is None:
+            return None
+        return SwitchHandle(self.engine, conn)
+
+    def register(self, msg_type, handler):
+        """
+        Register a message handler for all switches; see Controller.register
+        """
+        self.engine.call_soon(self.engine.register, msg_type, handler)
+
+    def kill(self):
+        """
+        Force the controller thread to quit; takes effect at once
+        """
+        self.engine.stop()
+
+    def shutdown(self):
+        """
+        Stop the loop, which closes all sockets on exit
+        """
+        self.engine.stop()
+
+    @property
+    def active(self):
+        return self.engine.running
@@ -7,6 +7,17 @@ is left pure virtual.
 
 import copy
 
+def buffer_bytes(buffer, start, end):
+    """
+    Return the bytes from start to end of buffer as a string
+
+    @param buffer A string or other object supporting the buffer
+    interface, such as a bytearray or memoryview
+    """
+    if isinstance(buffer, memoryview):
+        return buffer[start:end].tobytes()
+    return str(buffer[start:end])
+
 class ofp_base_list(object):
     """
     Container type to maintain a list of ofp objects
@@ -25,7 +36,13 @@ class ofp_base_list(object):
     is of the right type.
     @arg extend Add the items for another list to this list
 
+    Items are added as deep copies, so the caller may go on changing
+    and reusing the objects it added.  Pass owned=True to add or extend
+    to hand the objects over to the list instead, which saves the copy;
+    the caller must not change them afterwards.
+
     """
+    __slots__ = ['items', 'class_list', 'name']
 
     def __init__(self):
         self.items = []
@@ -45,26 +62,43 @@ class ofp_base_list(object):
 
     def unpack(self, binary_string, bytes=None):
         """
-        Pure virtual function for a list of items
-
         Unpack items from a binary string, creating an array
         of objects of the appropriate type
 
         @param binary_string The string to be unpacked
 
         @param bytes The total length of the list in bytes.  
-        Ignored if decode is True.  If None and decode is false, the
-        list is assumed to extend through the entire string.
+        If None, the list is assumed to extend through the entire string.
 
         @return The remainder of binary_string that was not parsed
         """
+        return binary_string[self.unpack_from(binary_string, 0, bytes):]
+
+    def unpack_from(self, buffer, offset=0, bytes=None):
+        """
+        Pure virtual function for a list of items
+
+        Unpack items from a buffer at an offset, creating an array
+        of objects of the appropriate type, without copying the buffer
+
+        @param buffer A string or other object supporting the buffer
+        interface, such as a memoryview, holding the list
+
+        @param offset The offset of the list in buffer
+
+        @param bytes The total length of the list in bytes.  
+        If None, the list is assumed to extend through the entire buffer.
+
+        @return The offset in buffer just past the parsed items
+        """
         pass
 
-    def add(self, item):
+    def add(self, item, owned=False):
         """
         Add an item to a list
 
         @param item The item to add
+        @param owned If True, add item itself rather than a copy of it
         @return True if successful, False if not proper type object
 
         """
@@ -75,8 +109,9 @@ class ofp_base_list(object):
                 not isinstance(item, tuple(self.class_list)):
             return False
 
-        tmp = copy.deepcopy(item)
-        self.items.append(tmp)
+        if not owned:
+            item = copy.deepcopy(item)
+        self.items.append(item)
         return True
 
     def remove_type(self, target):
@@ -107,22 +142,29 @@ class ofp_base_list(object):
                 return self.items[index]
         return None
 
-    def extend(self, other):
+    def extend(self, other, owned=False):
         """
         Add the items in other to this list
 
-        @param other An object of the same type of list whose
-        entries are to be merged into this list
+        The items are checked, then copied together in one deep copy.
 
-        @return True if successful.  If not successful, the list
-        may have been modified.
+        @param other An object of the same type of list, or a sequence
+        of items, whose entries are to be merged into this list
+        @param owned If True, add the items themselves rather than copies
 
-        @todo Check if this is proper deep copy or not
+        @return True if successful.  If not successful, the list
+        is not modified.
 
         """
-        for act in other.items:
-            if not self.add(act):
-                return False
+        items = list(getattr(other, "items", other))
+        if self.class_list is not None:
+            classes = tuple(self.class_list)
+            for item in items:
+                if not isinstance(item, classes):
+                    return False
+        if not owned:
+            items = copy.deepcopy(items)
+        self.items.extend(items)
         return True
 
     def __len__(self):
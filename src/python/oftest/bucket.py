@@ -1,7 +1,7 @@
 
 # Python OpenFlow bucket wrapper class
 
-from oftest.cstruct import ofp_bucket
+from oftest.cstruct import ofp_bucket, OFP_BUCKET_BYTES
 from oftest.action_list import action_list
 
 
@@ -28,9 +28,12 @@ class bucket(ofp_bucket):
         outstr += self.actions.show()
         return outstr
     def unpack(self, binary_string):
-        binary_string = ofp_bucket.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        offset = ofp_bucket.unpack_from(self, buffer, offset)
         self.actions = action_list()
-        return self.actions.unpack(binary_string)
+        return self.actions.unpack_from(buffer, offset,
+                                        self.len - OFP_BUCKET_BYTES)
     def pack(self):
         self.len = len(self)
         packed = ""
@@ -17,6 +17,7 @@ class bucket_list(ofp_base_list):
     is an action.
 
     """
+    __slots__ = ['buckets']
 
     def __init__(self):
         ofp_base_list.__init__(self)
@@ -24,29 +25,31 @@ class bucket_list(ofp_base_list):
         self.name = "buckets"
         self.class_list = (bucket,)
 
-    def unpack(self, binary_string, bytes=None):
+    def unpack_from(self, buffer, offset=0, bytes=None):
         """
         Unpack a list of buckets
         
-        Unpack buckets from a binary string, creating an array
+        Unpack buckets from a buffer at an offset, creating an array
         of objects of the appropriate type
 
-        @param binary_string The string to be unpacked
+        @param buffer The string or buffer to be unpacked
 
-        @param bytes The total length of the instruction list in bytes.  
-        Ignored if decode is True.  If bytes is None and decode is false, the
-        list is assumed to extend through the entire string.
+        @param offset The offset of the bucket list in buffer
 
-        @return The remainder of binary_string that was not parsed
+        @param bytes The total length of the bucket list in bytes.  
+        If None, the list is assumed to extend through the entire buffer.
+
+        @return The offset in buffer just past the parsed buckets
 
         """
         if bytes == None:
-            bytes = len(binary_string)
-        bytes_done = 0
-        cur_string = binary_string
-        while bytes_done < bytes:
+            bytes = len(buffer) - offset
+        end = offset + bytes
+        while offset < end:
             b = bucket()
-            cur_string = b.unpack(cur_string)
+            next = b.unpack_from(buffer, offset)
+            if next == offset:
+                break   # Truncated bucket
             self.buckets.append(b)
-            bytes_done += len(b)
-        return cur_string
+            offset = next
+        return offset
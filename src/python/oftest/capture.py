@@ -0,0 +1,488 @@
+"""
+Packet capture backends for dataplane ports
+
+A capture backend opens an interface for receiving and sending frames.
+The port thread selects on the backend's fileno() and calls recv_batch,
+which returns every frame received so far rather than one per wakeup.
+
+RingCapture reads a TPACKET_V3 receive ring of a raw AF_PACKET socket
+mapped into the process, so that a burst of frames is taken a block at
+a time without a system call per frame.  PcapCapture uses pypcap.
+capture_open picks the ring where it can be set up (Linux, with
+CAP_NET_RAW) and falls back to pcap otherwise.
+
+Either backend may be given a CaptureFilter, run by the kernel, so that
+background traffic such as neighbor discovery or LLDP from the host
+stack is dropped before it reaches Python.
+"""
+
+import mmap
+import ctypes
+import socket
+import struct
+import subprocess
+try:
+    import pcap
+except ImportError:
+    pcap = None
+import netutils
+
+##@var CAPTURE_BACKENDS
+# Values of the capture argument of capture_open
+CAPTURE_BACKENDS = ["auto", "ring", "pcap"]
+
+# From linux/if_ether.h
+ETH_P_ALL = 0x0003
+
+# From linux/if_packet.h
+PACKET_RX_RING = 5
+PACKET_STATISTICS = 6
+PACKET_VERSION = 10
+TPACKET_V3 = 2
+TP_STATUS_KERNEL = 0
+TP_STATUS_USER = 1
+TP_STATUS_VLAN_VALID = 0x10
+TP_STATUS_VLAN_TPID_VALID = 0x40
+
+# From linux/if_vlan.h
+ETH_P_8021Q = 0x8100
+
+# From asm-generic/socket.h
+SO_ATTACH_FILTER = 26
+
+# struct tpacket_req3
+TPACKET_REQ3 = struct.Struct("7I")
+# struct tpacket_stats_v3: packets, drops, freeze_q_cnt
+TPACKET_STATS_V3 = struct.Struct("III")
+# block_status, num_pkts and offset_to_first_pkt of struct
+# tpacket_block_desc, found at TPACKET_BLOCK_HDR_OFFSET in the block
+TPACKET_BLOCK_HDR = struct.Struct("III")
+TPACKET_BLOCK_HDR_OFFSET = 8
+TPACKET_BLOCK_STATUS = struct.Struct("I")
+# tp_next_offset, tp_sec, tp_nsec, tp_snaplen, tp_len, tp_status,
+# tp_mac, tp_net and hv1 (tp_rxhash, tp_vlan_tci, tp_vlan_tpid) of
+# struct tpacket3_hdr
+TPACKET3_HDR = struct.Struct("IIIIIIHHIIH")
+# The 802.1Q tag re-inserted after the MAC addresses
+VLAN_TAG = struct.Struct("!HH")
+
+# struct sock_filter and struct sock_fprog
+BPF_INSN = struct.Struct("HBBI")
+BPF_FPROG = struct.Struct("HL")
+
+# Classic BPF opcodes, from linux/filter.h
+BPF_LD_W_ABS = 0x20
+BPF_LD_H_ABS = 0x28
+BPF_JEQ_K = 0x15
+BPF_JA = 0x05
+BPF_RET_K = 0x06
+
+# Ancillary data offsets of BPF loads, from linux/filter.h
+SKF_AD_OFF = 0xfffff000
+SKF_AD_VLAN_TAG_PRESENT = 48
+SKF_AD_VLAN_TPID = 60
+
+##@var BPF_KEEP
+# The number of bytes of a frame kept by a filter program
+BPF_KEEP = 262144
+
+##@var RING_BLOCK_SIZE
+# Bytes per ring block; a power of 2 multiple of the page size
+RING_BLOCK_SIZE = 1 << 18
+RING_BLOCK_NR = 16
+RING_FRAME_SIZE = 2048
+##@var RING_BLOCK_TIMEOUT
+# Milliseconds after which the kernel hands over a block that is not
+# full; this bounds the delay before a frame can be received
+RING_BLOCK_TIMEOUT = 1
+
+class CaptureFilter(object):
+    """
+    Frames dropped by the kernel before they reach a dataplane port
+
+    A frame is kept if it matches expression, when one is given, and
+    neither its ethertype is one of ethertypes nor its source or
+    destination address one of macs.  Without an expression the filter
+    is compiled here; an expression needs tcpdump for the ring backend.
+
+    The ethertype of a VLAN tagged frame is the TPID, like 0x8100, as
+    for "ether proto" in an expression.  The kernel runs the filter
+    after taking the tag out of received frames, so the program reads
+    the TPID from the tag it kept aside.
+
+        CaptureFilter(ethertypes=[0x86dd, 0x88cc])
+        CaptureFilter("not ip6", macs=["01:00:5e:00:00:fb"])
+
+    @var expression A BPF expression, in tcpdump syntax, of the frames
+    to keep or None
+    @var ethertypes A list of ethertypes of frames to drop
+    @var macs A list of MAC addresses, like "33:33:00:00:00:01", of
+    frames to drop
+    """
+
+    def __init__(self, expression=None, ethertypes=[], macs=[]):
+        self.expression = expression
+        self.ethertypes = list(ethertypes)
+        self.macs = list(macs)
+
+    def tcpdump_expression(self):
+        """
+        Return the filter as a single BPF expression
+        """
+        parts = []
+        if self.expression:
+            parts.append("(" + self.expression + ")")
+        if self.ethertypes:
+            parts.append("not (" + " or ".join(["ether proto 0x%04x" % ethertype
+                                               for ethertype in self.ethertypes])
+                         + ")")
+        if self.macs:
+            parts.append("not (" + " or ".join(["ether host " + mac
+                                               for mac in self.macs]) + ")")
+        return " and ".join(parts)
+
+    def program(self, interface_name):
+        """
+        Return the filter as a list of (code, jt, jf, k) BPF instructions
+        @param interface_name The interface the filter is for
+        @raise EnvironmentError if an expression cannot be compiled
+        """
+        if self.expression:
+            return bpf_compile(self.tcpdump_expression(), interface_name)
+
+        # Each match jumps to the final drop instruction
+        prog = []
+        drops = []
+        if self.ethertypes:
+            # The TPID if the kernel took out a tag, else the ethertype
+            prog.append((BPF_LD_W_ABS, 0, 0,
+                         SKF_AD_OFF + SKF_AD_VLAN_TAG_PRESENT))
+            prog.append((BPF_JEQ_K, 2, 0, 0))
+            prog.append((BPF_LD_W_ABS, 0, 0, SKF_AD_OFF + SKF_AD_VLAN_TPID))
+            prog.append((BPF_JA, 0, 0, 1))
+            prog.append((BPF_LD_H_ABS, 0, 0, 12))
+            for ethertype in self.ethertypes:
+                prog.append((BPF_JEQ_K, 0, 1, ethertype))
+                drops.append(len(prog))
+                prog.append(None)
+        for mac in self.macs:
+            (high, low) = struct.unpack("!HL", "".join(
+                    [chr(int(byte, 16)) for byte in mac.split(":")]))
+            # Destination, then source address
+            for offset in [0, 6]:
+                prog.append((BPF_LD_W_ABS, 0, 0, offset + 2))
+                prog.append((BPF_JEQ_K, 0, 3, low))
+                prog.append((BPF_LD_H_ABS, 0, 0, offset))
+                prog.append((BPF_JEQ_K, 0, 1, high))
+                drops.append(len(prog))
+                prog.append(None)
+        prog.append((BPF_RET_K, 0, 0, BPF_KEEP))
+        for idx in drops:
+            prog[idx] = (BPF_JA, 0, 0, len(prog) - idx - 1)
+        prog.append((BPF_RET_K, 0, 0, 0))
+        return prog
+
+def filter_create(spec):
+    """
+    Return the CaptureFilter given by spec
+    @param spec None, a BPF expression string or a CaptureFilter
+    """
+    if spec is None or isinstance(spec, CaptureFilter):
+        return spec
+    return CaptureFilter(expression=spec)
+
+def bpf_compile(expression, interface_name):
+    """
+    Compile a BPF expression with tcpdump
+    @return A list of (code, jt, jf, k) BPF instructions
+    @raise EnvironmentError if tcpdump is missing or rejects expression
+    """
+    try:
+        proc = subprocess.Popen(["tcpdump", "-p", "-i", interface_name,
+                                 "-ddd", expression],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError, e:
+        raise EnvironmentError("Need tcpdump to compile filters: " + str(e))
+    (out, err) = proc.communicate()
+    if proc.returncode:
+        raise EnvironmentError("Cannot compile filter " + expression + ": " +
+                               err.strip())
+    lines = out.split("\n")
+    return [tuple([int(field) for field in line.split()])
+            for line in lines[1:int(lines[0]) + 1]]
+
+def filter_attach(sock, program):
+    """
+    Attach a BPF program to a socket
+    @param program A list of (code, jt, jf, k) BPF instructions
+    """
+    insns = "".join([BPF_INSN.pack(*insn) for insn in program])
+    buf = ctypes.create_string_buffer(insns, len(insns))
+    sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER,
+                    BPF_FPROG.pack(len(program), ctypes.addressof(buf)))
+
+class Capture(object):
+    """
+    Counters common to the capture backends
+
+    @var interface_name The name of the interface
+    @var sent The number of frames sent
+    @var if_base The packet counters of the interface when opened,
+    as returned by netutils.get_if_counters, or None if unknown
+    """
+
+    def counters_start(self, interface_name):
+        self.interface_name = interface_name
+        self.sent = 0
+        try:
+            self.if_base = netutils.get_if_counters(interface_name)
+        except EnvironmentError:
+            self.if_base = None
+
+    def filter_stats(self):
+        """
+        Return the frames dropped and passed by the filter since opened
+
+        The kernel only counts the frames a filter passes; the frames
+        it drops are the frames the interface received or sent, less
+        those sent through this backend (which the backend does not
+        see) and those passed.  As the counters are not read at once,
+        the number of dropped frames is only exact when the interface
+        is idle.
+
+        @return The pair (hits, misses) of frames dropped by the filter
+        and passed by it (none dropped without a filter); hits is None
+        if the interface counters are not available
+        """
+        misses = self.passed()
+        if self.if_base is None:
+            return (None, misses)
+        (rx, tx) = netutils.get_if_counters(self.interface_name)
+        seen = rx + tx - sum(self.if_base) - self.sent
+        return (max(seen - misses, 0), misses)
+
+class RingCapture(Capture):
+    """
+    Capture through a TPACKET_V3 ring of a raw AF_PACKET socket
+
+    The kernel fills the blocks of the ring in turn and hands each one
+    over when it is full or after RING_BLOCK_TIMEOUT.  recv_batch takes
+    the frames of the blocks handed over and gives the blocks back.
+    The kernel moves the 802.1Q tag of received frames into the frame
+    header of the ring; recv_batch puts it back in the frame.
+
+    @var name The name of the backend, "ring"
+    @var socket The AF_PACKET socket bound to the interface
+    @var ring The mmap of the receive ring
+    @var block The index of the next block to read
+    """
+
+    name = "ring"
+
+    def __init__(self, interface_name, block_size=RING_BLOCK_SIZE,
+                 block_nr=RING_BLOCK_NR, timeout=RING_BLOCK_TIMEOUT,
+                 capture_filter=None):
+        """
+        Open the interface
+        @param interface_name The name of the interface like eth1
+        @param block_size The bytes per ring block
+        @param block_nr The number of ring blocks
+        @param timeout The block timeout in milliseconds
+        @param capture_filter A CaptureFilter or None
+        @raise EnvironmentError if the ring cannot be set up
+        """
+        if not hasattr(socket, "AF_PACKET"):
+            raise EnvironmentError("AF_PACKET sockets are not supported")
+        # No protocol until bound, so frames of other interfaces are
+        # not received meanwhile
+        self.socket = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, 0)
+        self.ring = None
+        self.drops = 0
+        self.packets = 0
+        try:
+            self.socket.setsockopt(netutils.SOL_PACKET, PACKET_VERSION,
+                                   TPACKET_V3)
+            req = TPACKET_REQ3.pack(block_size, block_nr, RING_FRAME_SIZE,
+                                    block_size * block_nr / RING_FRAME_SIZE,
+                                    timeout, 0, 0)
+            self.socket.setsockopt(netutils.SOL_PACKET, PACKET_RX_RING, req)
+            self.ring = mmap.mmap(self.socket.fileno(), block_size * block_nr,
+                                  mmap.MAP_SHARED,
+                                  mmap.PROT_READ | mmap.PROT_WRITE)
+            if capture_filter is not None:
+                filter_attach(self.socket,
+                              capture_filter.program(interface_name))
+            self.socket.bind((interface_name, ETH_P_ALL))
+            netutils.set_promisc(self.socket, interface_name)
+        except EnvironmentError:
+            self.close()
+            raise
+        self.counters_start(interface_name)
+        self.block_size = block_size
+        self.block_nr = block_nr
+        self.block = 0
+
+    def fileno(self):
+        return self.socket.fileno()
+
+    def recv_batch(self):
+        """
+        Take the frames of the blocks handed over by the kernel
+        @return A list of (frame, timestamp) pairs, possibly empty
+        """
+        pkts = []
+        ring = self.ring
+        # At most one pass over the ring, so a flood cannot hold us here
+        for _ in xrange(self.block_nr):
+            block = self.block * self.block_size
+            (status, count, offset) = TPACKET_BLOCK_HDR.unpack_from(
+                ring, block + TPACKET_BLOCK_HDR_OFFSET)
+            if not status & TP_STATUS_USER:
+                break
+            offset += block
+            for _ in xrange(count):
+                (next_offset, sec, nsec, snaplen, length, pkt_status, mac,
+                 net, rxhash, vlan_tci, vlan_tpid) = \
+                    TPACKET3_HDR.unpack_from(ring, offset)
+                start = offset + mac
+                frame = ring[start:start + snaplen]
+                if pkt_status & TP_STATUS_VLAN_VALID:
+                    # The kernel took the tag out of received frames;
+                    # put it back as libpcap does
+                    if not pkt_status & TP_STATUS_VLAN_TPID_VALID:
+                        vlan_tpid = ETH_P_8021Q
+                    frame = (frame[:12] + VLAN_TAG.pack(vlan_tpid, vlan_tci) +
+                             frame[12:])
+                pkts.append((frame, sec + nsec * 1e-9))
+                offset += next_offset
+            TPACKET_BLOCK_STATUS.pack_into(
+                ring, block + TPACKET_BLOCK_HDR_OFFSET, TP_STATUS_KERNEL)
+            self.block = (self.block + 1) % self.block_nr
+        return pkts
+
+    def send(self, packet):
+        """
+        Send a frame out of the interface
+        @return The number of bytes sent
+        """
+        sent = self.socket.send(packet)
+        self.sent += 1
+        return sent
+
+    def _stats_read(self):
+        if self.ring is None:
+            return
+        # The kernel clears its counters when they are read
+        stats = self.socket.getsockopt(netutils.SOL_PACKET, PACKET_STATISTICS,
+                                       TPACKET_STATS_V3.size)
+        (packets, drops, freeze_q_cnt) = TPACKET_STATS_V3.unpack(stats)
+        self.packets += packets
+        self.drops += drops
+
+    def dropped(self):
+        """
+        Return the number of frames dropped as the ring was full
+        """
+        self._stats_read()
+        return self.drops
+
+    def passed(self):
+        """
+        Return the number of frames passed by the filter, if any
+        """
+        self._stats_read()
+        return self.packets
+
+    def close(self):
+        if self.ring is not None:
+            self._stats_read()
+            self.ring.close()
+            self.ring = None
+        self.socket.close()
+
+class PcapCapture(Capture):
+    """
+    Capture through pypcap
+
+    @var name The name of the backend, "pcap"
+    @var pcap The pcap object
+    """
+
+    name = "pcap"
+
+    def __init__(self, interface_name, snaplen, timeout, capture_filter=None):
+        """
+        Open the interface
+        @param interface_name The name of the interface like eth1
+        @param snaplen The maximum number of bytes captured per frame
+        @param timeout The pcap read timeout in milliseconds
+        @param capture_filter A CaptureFilter or None
+        @raise EnvironmentError if pypcap is missing or cannot open it
+        """
+        if pcap is None:
+            raise EnvironmentError("Need to install pypcap "
+                                   "(apt-get install python-pypcap).")
+        self.pcap = pcap.pcap(interface_name, snaplen, True, timeout)
+        if capture_filter is not None:
+            self.pcap.setfilter(capture_filter.tcpdump_expression())
+        self.counters_start(interface_name)
+        self.pkts = []
+
+    def fileno(self):
+        return self.pcap.fd
+
+    def _pcap_cb(self, ts, pkt):
+        self.pkts.append((pkt, ts))
+
+    def recv_batch(self):
+        """
+        Take the frames of one pcap buffer
+        @return A list of (frame, timestamp) pairs, possibly empty
+        """
+        self.pcap.dispatch(-1, self._pcap_cb)
+        (pkts, self.pkts) = (self.pkts, [])
+        return pkts
+
+    def send(self, packet):
+        self.sent += 1
+        return self.pcap.inject(packet, len(packet))
+
+    def dropped(self):
+        return self.pcap.stats()[1]
+
+    def passed(self):
+        return self.pcap.stats()[0]
+
+    def close(self):
+        self.pcap.close()
+
+def capture_open(interface_name, capture="auto", snaplen=4096,
+                 timeout=10000, logger=None, capture_filter=None):
+    """
+    Open an interface with a capture backend
+
+    @param interface_name The name of the interface like eth1
+    @param capture "ring" or "pcap" for that backend; "auto" for the
+    ring if it can be set up, otherwise pcap
+    @param snaplen As for PcapCapture
+    @param timeout As for PcapCapture
+    @param logger If set, where to report falling back to pcap
+    @param capture_filter None, a BPF expression of the frames to keep
+    or a CaptureFilter
+    @return The capture backend object
+    @raise EnvironmentError if the interface cannot be opened
+    """
+    if capture not in CAPTURE_BACKENDS:
+        raise ValueError("Unknown capture backend " + str(capture))
+    capture_filter = filter_create(capture_filter)
+    if capture != "pcap":
+        try:
+            return RingCapture(interface_name, capture_filter=capture_filter)
+        except EnvironmentError, e:
+            if capture == "ring":
+                raise
+            if logger:
+                logger.info("No capture ring on " + interface_name + ": " +
+                            str(e) + "; using pcap")
+    return PcapCapture(interface_name, snaplen, timeout,
+                       capture_filter=capture_filter)
@@ -23,11 +23,14 @@ Currently only one connection is accepted during the life of
 the controller.   There seems
 to be no clean way to interrupt an accept call.  Using select that also listens
 on an administrative socket and can shut down the socket might work.
+See async_controller.MultiController for a controller accepting many
+switch connections, keyed by datapath ID.
 
 """
 
 import os
 import socket
+import struct
 import time
 import sys
 from threading import Thread
@@ -42,10 +45,136 @@ from oftest.message import *
 import select #@UnresolvedImport
 import logging
 import traceback
+import heapq
+from collections import deque
 
 ##@todo Find a better home for these identifiers (controller)
 RCV_SIZE_DEFAULT = 32768
 LISTEN_QUEUE_SIZE = 1
+BATCH_BYTES_DEFAULT = 65536
+
+# Flags of a stats reply, read from the raw message
+STATS_REPLY_FLAGS = struct.Struct("!H")
+STATS_REPLY_FLAGS_OFFSET = OFP_HEADER_BYTES + 2
+
+class MessageQueue(object):
+    """
+    Queue of received messages, indexed by message type
+
+    Messages are kept in one deque per message type so a poll for a
+    given type is O(1).  A second deque of (seq, type) pairs records
+    the global arrival order so that polls for any type and eviction
+    of the oldest message are O(1) amortized.  Entries taken through
+    a typed get stay in the arrival index and are skipped lazily.
+
+    @var max_pkts The max number of messages held in total
+    @var max_pkts_per_type Map from message type to the max number of
+    messages of that type held; types not in the map are only bounded
+    by max_pkts
+    @var expired Number of messages evicted because a limit was hit
+    @var expired_by_type Map from message type to number evicted
+    """
+
+    def __init__(self, max_pkts=1024, max_pkts_per_type=None):
+        self.max_pkts = max_pkts
+        if max_pkts_per_type is None:
+            max_pkts_per_type = {}
+        self.max_pkts_per_type = max_pkts_per_type
+        self.expired = 0
+        self.expired_by_type = {}
+        self.by_type = {}
+        self.order = deque()
+        self.seq = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def put(self, msg_type, msg, pkt):
+        """
+        Append a message, evicting the oldest one if a limit is hit
+
+        @param msg_type The OpenFlow message type
+        @param msg The parsed message object, or None if pkt has not
+        been parsed yet
+        @param pkt The raw message string
+        @return The number of messages evicted (0 or 1)
+        """
+        queue = self.by_type.get(msg_type)
+        if queue is None:
+            queue = self.by_type[msg_type] = deque()
+
+        evicted = 0
+        limit = self.max_pkts_per_type.get(msg_type)
+        if limit is not None and len(queue) >= limit:
+            queue.popleft()
+            self.count -= 1
+            self._expire(msg_type)
+            evicted = 1
+        elif self.count >= self.max_pkts:
+            (old_type, _, _) = self._oldest_pop()
+            self._expire(old_type)
+            evicted = 1
+
+        queue.append((self.seq, msg, pkt))
+        self.order.append((self.seq, msg_type))
+        self.seq += 1
+        self.count += 1
+        if len(self.order) > 2 * self.count + 64:
+            self._order_compact()
+        return evicted
+
+    def get(self, msg_type=None):
+        """
+        Remove and return the oldest message of a type
+
+        @param msg_type If set, the type of message to get; otherwise
+        the oldest message of any type is returned
+        @return The pair (msg, pkt) as put, or (None, None) if none
+        is queued
+        """
+        if msg_type is None:
+            (_, msg, pkt) = self._oldest_pop()
+            return (msg, pkt)
+        queue = self.by_type.get(msg_type)
+        if not queue:
+            return (None, None)
+        (_, msg, pkt) = queue.popleft()
+        self.count -= 1
+        return (msg, pkt)
+
+    def flush(self):
+        """
+        Drop all queued messages
+        @return The number of messages dropped
+        """
+        count = self.count
+        self.by_type = {}
+        self.order = deque()
+        self.count = 0
+        return count
+
+    def _oldest_pop(self):
+        while self.order:
+            (seq, msg_type) = self.order.popleft()
+            queue = self.by_type.get(msg_type)
+            # Stale if already taken by a typed get or eviction
+            if queue and queue[0][0] == seq:
+                (_, msg, pkt) = queue.popleft()
+                self.count -= 1
+                return (msg_type, msg, pkt)
+        return (None, None, None)
+
+    def _expire(self, msg_type):
+        self.expired += 1
+        self.expired_by_type[msg_type] = \
+            self.expired_by_type.get(msg_type, 0) + 1
+
+    def _order_compact(self):
+        # Rebuild the arrival index from the live entries only
+        runs = [[(seq, msg_type) for (seq, _, _) in queue]
+                for (msg_type, queue) in self.by_type.items()]
+        self.order = deque(heapq.merge(*runs))
 
 class Controller(Thread):
     """
@@ -65,6 +194,9 @@ class Controller(Thread):
 
     @var rcv_size The receive size to use for receive calls
     @var max_pkts The max size of the receive queue
+    @var max_pkts_per_type Map from message type to the max number of
+    messages of that type kept in the receive queue
+    @var packets The receive queue, a MessageQueue
     @var keep_alive If true, listen for echo requests and respond w/
     @var keep_alive If true, listen for echo requests and respond w/
     echo replies
@@ -74,18 +206,21 @@ class Controller(Thread):
     @var host The host to use for connect
     @var port The port to connect on 
     @var packets_total Total number of packets received
-    @var packets_expired Number of packets popped from queue as queue full
+    @var packets_expired Number of packets popped from queue as queue full;
+    see packets.expired_by_type for the count by message type
     @var packets_handled Number of packets handled by something
     @var dbg_state Debug indication of state
     """
 
-    def __init__(self, host='127.0.0.1', port=6633, max_pkts=1024):
+    def __init__(self, host='127.0.0.1', port=6633, max_pkts=1024,
+                 max_pkts_per_type=None):
         Thread.__init__(self)
         # Socket related
         self.rcv_size = RCV_SIZE_DEFAULT
         self.listen_socket = None
         self.switch_socket = None
         self.switch_addr = None
+        self.rcv_buf = bytearray()
         self.socs = []
         self.connect_cv = Condition()
         self.message_cv = Condition()
@@ -99,7 +234,7 @@ class Controller(Thread):
         self.poll_discards = 0
 
         # State
-        self.packets = []
+        self.packets = MessageQueue(max_pkts, max_pkts_per_type)
         self.sync = Lock()
         self.handlers = {}
         self.keep_alive = False
@@ -108,7 +243,6 @@ class Controller(Thread):
         self.exit_on_reset = True
 
         # Settings
-        self.max_pkts = max_pkts
         self.passive = True
         self.host = host
         self.port = port
@@ -116,17 +250,18 @@ class Controller(Thread):
         self.logger = logging.getLogger("controller")
 
         # Transaction and message type waiting variables 
-        #   xid_cv: Condition variable (semaphore) for packet waiters
-        #   xid: Transaction ID being waited on
-        #   xid_response: Transaction response message
+        #   xid_cv: Condition variable (semaphore) for transaction waiters
+        #   xid_pending: Map from each transaction ID being waited on to
+        #     the list of (msg, pkt) responses received for it so far
+        #   xid_done: Set of transaction IDs whose response is complete
         #   expect_msg: Is a message being waited on 
         #   expect_msg_cv: Semaphore for waiters
         #   expect_msg_type: Type of message expected
         #   expect_msg_response: Result passed through here
 
         self.xid_cv = Condition()
-        self.xid = None
-        self.xid_response = None
+        self.xid_pending = {}
+        self.xid_done = set()
 
         self.expect_msg = False
         self.expect_msg_cv = Condition()
@@ -134,119 +269,145 @@ class Controller(Thread):
         self.expect_msg_response = None
 
     def _pkt_handle(self, pkt):
+        """
+        Frame the received bytes into OpenFlow messages
+
+        The bytes are appended to the connection's receive buffer and
+        every complete message (as given by ofp_header.length) is passed
+        to _msg_handle.  A trailing partial message stays in the buffer
+        and is completed by the next read.
+
+        @param pkt The raw bytes (string) read from the switch socket;
+        may hold several OF msgs and may end in the middle of one
+        """
+        self.rcv_buf.extend(pkt)
+        rawmsgs = of_message_split(self.rcv_buf)
+        if rawmsgs is None:
+            # Cannot find the next message boundary; stream was dropped
+            self.logger.info("Bad header length in received stream")
+            self.parse_errors += 1
+            return
+        for rawmsg in rawmsgs:
+            if not self._msg_handle(rawmsg):
+                del self.rcv_buf[:]
+                return
+
+    def _msg_handle(self, rawmsg):
         """
         Check for all packet handling conditions
 
-        Parse and verify message 
+        Verify the message header
         Check if XID matches something waiting
         Check if message is being expected for a poll operation
         Check if keep alive is on and message is an echo request
         Check if any registered handler wants the packet
         Enqueue if none of those conditions is met
 
-        an echo request in case keep_alive is true, followed by
-        registered message handlers.
-        @param pkt The raw packet (string) which may contain multiple OF msgs
-        """
-        # Process each of the OF msgs inside the pkt
-        offset = 0
-        while offset < len(pkt):
-            # Parse the header to get type
-            hdr = of_header_parse(pkt[offset:])
-            if not hdr:
-                self.logger.info("Could not parse header, pkt len", len(pkt))
-                self.parse_errors += 1
-                return
-            if hdr.length == 0:
-                self.logger.info("Header length is zero")
-                self.parse_errors += 1
-                return
+        Messages are routed on the header alone.  The body is parsed
+        only for handlers; transaction waiters and pollers are passed
+        the raw message and parse it when they take it, and messages
+        evicted from the queue are never parsed.
 
-            # Extract the raw message bytes
-            rawmsg = pkt[offset : offset + hdr.length]
-
-            self.logger.debug("Msg in: len %d. offset %d. type %s. hdr.len %d" %
-                (len(pkt), offset, ofp_type_map[hdr.type], hdr.length))
-            if hdr.version != OFP_VERSION:
-                self.logger.error("Version %d does not match OFTest version %d"
-                                  % (hdr.version, OFP_VERSION))
-                print "Version %d does not match OFTest version %d" % \
-                    (hdr.version, OFP_VERSION)
-                self.active = False
-                self.switch_socket = None
-                self.kill()
-
-            msg = of_message_parse(rawmsg)
-            if not msg:
-                self.parse_errors += 1
-                self.logger.warn("Could not parse message")
-                continue
-
-            self.sync.acquire()
-
-            # Check if transaction is waiting
-            self.xid_cv.acquire()
-            if self.xid:
-                if hdr.xid == self.xid:
-                    self.logger.debug("Matched expected XID " + str(hdr.xid))
-                    self.xid_response = (msg, rawmsg)
-                    self.xid = None
-                    self.xid_cv.notify()
-                    self.xid_cv.release()
-                    self.sync.release()
-                    continue
-            self.xid_cv.release()
+        @param rawmsg The raw bytes (string) of exactly one OF msg
+        @return False if the connection should no longer be parsed
+        """
+        # Read the header fields to check the version before parsing
+        (version, msg_type, length, xid) = of_header_unpack(rawmsg)
+
+        self.logger.debug("Msg in: len %d. type %s. xid %d" %
+            (length, ofp_type_map.get(msg_type, msg_type), xid))
+        if version != OFP_VERSION:
+            self.logger.error("Version %d does not match OFTest version %d"
+                              % (version, OFP_VERSION))
+            print "Version %d does not match OFTest version %d" % \
+                (version, OFP_VERSION)
+            self.active = False
+            self.switch_socket = None
+            self.kill()
+            return False
 
-            # PREVENT QUEUE ACCESS AT THIS POINT?
-            # Check if anyone waiting on this type of message
-            self.expect_msg_cv.acquire()
-            if self.expect_msg:
-                if not self.expect_msg_type or (self.expect_msg_type == hdr.type):
-                    self.logger.debug("Matched expected msg type "
-                                       + ofp_type_map[hdr.type])
-                    self.expect_msg_response = (msg, rawmsg)
-                    self.expect_msg = False
-                    self.expect_msg_cv.notify()
-                    self.expect_msg_cv.release()
-                    self.sync.release()
-                    continue
-            self.expect_msg_cv.release()
-
-            # Check if keep alive is set; if so, respond to echo requests
-            if self.keep_alive:
-                if hdr.type == OFPT_ECHO_REQUEST:
-                    self.sync.release()
-                    self.logger.debug("Responding to echo request")
-                    rep = echo_reply()
-                    rep.header.xid = hdr.xid
-                    # Ignoring additional data
-                    self.message_send(rep.pack(), zero_xid=True)
-                    offset += hdr.length
-                    continue
-
-            # Now check for message handlers; preference is given to
-            # handlers for a specific packet
-            # @todo FIXME handler should be called with ptr to 
-            #   registering object, not 'self'
-            handled = False
-            if hdr.type in self.handlers.keys():
-                handled = self.handlers[hdr.type](self, msg, rawmsg)
-            if not handled and ("all" in self.handlers.keys()):
-                handled = self.handlers["all"](self, msg, rawmsg)
-
-            if not handled: # Not handled, enqueue
-                self.logger.debug("Enqueuing pkt type " + ofp_type_map[hdr.type])
-                if len(self.packets) >= self.max_pkts:
-                    self.packets.pop(0)
-                    self.packets_expired += 1
-                self.packets.append((msg, rawmsg))
-                self.packets_total += 1
-            else:
-                self.packets_handled += 1
-                self.logger.debug("Message handled by callback")
+        self.sync.acquire()
 
+        # Check if transaction is waiting
+        self.xid_cv.acquire()
+        if xid and xid in self.xid_pending:
+            self.logger.debug("Matched expected XID " + str(xid))
+            self.xid_pending[xid].append((None, rawmsg))
+            # Multipart replies complete with the last segment; waiters
+            # are woken for each segment so stats_iter can stream them
+            if not _reply_more(msg_type, rawmsg):
+                self.xid_done.add(xid)
+            self.xid_cv.notify_all()
+            self.xid_cv.release()
             self.sync.release()
-            offset += hdr.length
+            return True
+        self.xid_cv.release()
+
+        # PREVENT QUEUE ACCESS AT THIS POINT?
+        # Check if anyone waiting on this type of message
+        self.expect_msg_cv.acquire()
+        if self.expect_msg:
+            if not self.expect_msg_type or (self.expect_msg_type == msg_type):
+                self.logger.debug("Matched expected msg type "
+                                   + ofp_type_map[msg_type])
+                self.expect_msg_response = (None, rawmsg)
+                self.expect_msg = False
+                self.expect_msg_cv.notify()
+                self.expect_msg_cv.release()
+                self.sync.release()
+                return True
+        self.expect_msg_cv.release()
+
+        # Check if keep alive is set; if so, respond to echo requests
+        if self.keep_alive:
+            if msg_type == OFPT_ECHO_REQUEST:
+                self.sync.release()
+                self.logger.debug("Responding to echo request")
+                rep = echo_reply()
+                rep.header.xid = xid
+                # Ignoring additional data
+                self.message_send(rep.pack(), zero_xid=True)
+                return True
+
+        # Now check for message handlers; preference is given to
+        # handlers for a specific packet
+        # @todo FIXME handler should be called with ptr to 
+        #   registering object, not 'self'
+        handled = False
+        msg = None
+        if msg_type in self.handlers or "all" in self.handlers:
+            msg = self._msg_materialize(rawmsg)
+            if msg is None:
+                self.sync.release()
+                return True
+        if msg_type in self.handlers:
+            handled = self.handlers[msg_type](self, msg, rawmsg)
+        if not handled and ("all" in self.handlers):
+            handled = self.handlers["all"](self, msg, rawmsg)
+
+        if not handled: # Not handled, enqueue
+            self.logger.debug("Enqueuing pkt type " +
+                              ofp_type_map.get(msg_type, str(msg_type)))
+            self.packets_expired += self.packets.put(msg_type, msg, rawmsg)
+            self.packets_total += 1
+        else:
+            self.packets_handled += 1
+            self.logger.debug("Message handled by callback")
+
+        self.sync.release()
+        return True
+
+    def _msg_materialize(self, rawmsg, decode=of_message_parse):
+        """
+        Parse a raw message taken from the receive path
+        @param decode The function parsing the raw message
+        @return The message object or None if it cannot be parsed
+        """
+        msg = decode(rawmsg)
+        if not msg:
+            self.parse_errors += 1
+            self.logger.warn("Could not parse message")
+        return msg
 
     def _socket_ready_handle(self, s):
         """
@@ -352,6 +513,8 @@ class Controller(Thread):
         if self.switch_socket is not None:
             self.switch_socket.close()
             self.switch_socket = None
+        # Partial messages from an old connection are meaningless
+        del self.rcv_buf[:]
         
         self.logger.info("Trying to connect")
         start = time.time()
@@ -450,6 +613,7 @@ class Controller(Thread):
                         pass
                     self.switch_socket = None
                     self.socs = self.socs[0:1]
+                    del self.rcv_buf[:]
 
         # End of main loop
         self.dbg_state = "closing"
@@ -504,6 +668,23 @@ class Controller(Thread):
         self.listen_socket = None
         self.dbg_state = "down"
 
+    def _max_pkts_get(self):
+        return self.packets.max_pkts
+
+    def _max_pkts_set(self, max_pkts):
+        self.packets.max_pkts = max_pkts
+
+    max_pkts = property(_max_pkts_get, _max_pkts_set)
+
+    def _max_pkts_per_type_get(self):
+        return self.packets.max_pkts_per_type
+
+    def _max_pkts_per_type_set(self, max_pkts_per_type):
+        self.packets.max_pkts_per_type = max_pkts_per_type
+
+    max_pkts_per_type = property(_max_pkts_per_type_get,
+                                 _max_pkts_per_type_set)
+
     def register(self, msg_type, handler):
         """
         Register a callback to receive a specific message type.
@@ -525,7 +706,7 @@ class Controller(Thread):
             return
         self.handlers[msg_type] = handler
 
-    def poll(self, exp_msg=None, timeout=None):
+    def poll(self, exp_msg=None, timeout=None, decode=None):
         """
         Wait for the next OF message received from the switch.
 
@@ -533,6 +714,9 @@ class Controller(Thread):
         is received (unless timeout occurs).
         @param timeout If None, do not block.  Otherwise, sleep in
         intervals of 1 second until message is received.
+        @param decode If set, the function used instead of
+        of_message_parse to parse the message, such as
+        of_packet_in_parse for a cheap view of a packet_in
 
         @retval A pair (msg, pkt) where msg is a message object and pkt
         the string representing the packet as received from the socket.
@@ -547,21 +731,20 @@ class Controller(Thread):
 
         msg = pkt = None
 
-        self.logger.debug("Poll for " + ofp_type_map[exp_msg])
+        self.logger.debug("Poll for " + str(ofp_type_map.get(exp_msg, exp_msg)))
         # First check the current queue
         self.sync.acquire()
-        if len(self.packets) > 0:
-            if not exp_msg:
-                (msg, pkt) = self.packets.pop(0)
+        if not exp_msg:
+            exp_msg = None
+        while True:
+            (msg, pkt) = self.packets.get(exp_msg)
+            if pkt is None:
+                break
+            if msg is None or decode:
+                msg = self._msg_materialize(pkt, decode or of_message_parse)
+            if msg is not None:
                 self.sync.release()
                 return (msg, pkt)
-            else:
-                for i in range(len(self.packets)):
-                    msg = self.packets[i][0]
-                    if msg.header.type == exp_msg:
-                        (msg, pkt) = self.packets.pop(i)
-                        self.sync.release()
-                        return (msg, pkt)
 
         # Okay, not currently in the queue
         if timeout is None or timeout <= 0:
@@ -581,6 +764,10 @@ class Controller(Thread):
         if self.expect_msg_response is not None:
             (msg, pkt) = self.expect_msg_response
         self.expect_msg_cv.release()
+        if pkt is not None:
+            msg = self._msg_materialize(pkt, decode or of_message_parse)
+            if msg is None:
+                pkt = None
 
         if msg is None:
             self.logger.debug("Poll time out")
@@ -589,44 +776,204 @@ class Controller(Thread):
 
         return (msg, pkt)
 
-    def transact(self, msg, timeout=5, zero_xid=False):
+    def transact(self, msg, timeout=5, zero_xid=False, lazy=False):
         """
         Run a message transaction with the switch
 
         Send the message in msg and wait for a reply with a matching
         transaction id.  Transactions have the highest priority in
-        received message handling.
+        received message handling.  Any number of transactions may be
+        outstanding at once, from one or several threads.
 
         @param msg The message object to send; must not be a string
         @param timeout The timeout in seconds (?)
         @param zero_xid Normally, if the XID is 0 an XID will be generated
         for the message.  Set xero_xid to override this behavior
-        @return The matching message object or None if unsuccessful
+        @param lazy As for transact_wait
+        @return The pair (msg, pkt) as for transact_wait; (None, None)
+        if unsuccessful
+
+        """
+
+        xid = self.transact_start(msg, zero_xid=zero_xid)
+        if xid is None:
+            return (None, None)
+        return self.transact_wait(xid, timeout=timeout, lazy=lazy)
 
+    def transact_start(self, msg, zero_xid=False):
         """
+        Send a message and register its XID as a pending transaction
 
+        Does not wait for the reply; use transact_wait with the returned
+        XID to collect it.  This allows many requests to be pipelined
+        to the switch before waiting on any of them.
+
+        @param msg The message object to send; must not be a string
+        @param zero_xid Normally, if the XID is 0 an XID will be generated
+        for the message.  Set xero_xid to override this behavior
+        @return The transaction ID or None if the message was not sent
+        """
+
+        xid = self._xid_register(msg, zero_xid)
+        if xid is None:
+            return None
+        if self.message_send(msg.pack()) < 0:
+            self._xid_unregister(xid)
+            return None
+        return xid
+
+    def _xid_register(self, msg, zero_xid=False):
+        """
+        Register the XID of msg as a pending transaction
+        @return The XID or None if a transaction is already pending on it
+        """
         if not zero_xid and msg.header.xid == 0:
             msg.header.xid = gen_xid()
+        xid = msg.header.xid
 
         self.xid_cv.acquire()
-        if self.xid:
+        if xid in self.xid_pending:
             self.xid_cv.release()
-            self.logger.error("Can only run one transaction at a time")
+            self.logger.error("Transaction already pending for xid " +
+                              str(xid))
             return None
+        self.xid_pending[xid] = []
+        self.xid_cv.release()
+        return xid
 
-        self.xid = msg.header.xid
-        self.xid_response = None
-        self.message_send(msg.pack())
-        self.xid_cv.wait(timeout)
-        if self.xid_response:
-            (resp, pkt) = self.xid_response
-            self.xid_response = None
-        else:
-            (resp, pkt) = (None, None)
+    def _xid_unregister(self, xid):
+        self.xid_cv.acquire()
+        del self.xid_pending[xid]
         self.xid_cv.release()
-        if resp is None:
-            self.logger.warning("No response for xid " + str(self.xid))
-        return (resp, pkt)
+
+    def transact_wait(self, xid, timeout=5, lazy=False):
+        """
+        Wait for the reply to a transaction started with transact_start
+
+        For multipart stats replies, the entries of all segments sharing
+        the XID are collected into the stats list of the first segment.
+
+        @param xid The transaction ID returned by transact_start
+        @param timeout The timeout in seconds
+        @param lazy If True, a flow stats reply keeps its entries packed;
+        see of_message_parse
+        @return The pair (msg, pkt) where msg is the reply message object
+        and pkt the raw reply (all segments concatenated for a multipart
+        reply); (None, None) if no complete reply arrived in time
+        """
+
+        deadline = time.time() + timeout
+        self.xid_cv.acquire()
+        while xid not in self.xid_done:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            self.xid_cv.wait(remaining)
+        responses = self.xid_pending.pop(xid, [])
+        complete = xid in self.xid_done
+        self.xid_done.discard(xid)
+        self.xid_cv.release()
+
+        if not complete:
+            self.logger.warning("No response for xid " + str(xid))
+            return (None, None)
+        responses = self._responses_parse(responses, lazy)
+        if not responses:
+            return (None, None)
+        return _transact_merge(responses)
+
+    def stats_iter(self, request, timeout=5, zero_xid=False, lazy=False):
+        """
+        Send a stats request and generate the entries of its reply
+
+        The request is sent by this call.  Entries are generated as each
+        segment of a multipart reply arrives; segments are released once
+        their entries have been generated, so a full table can be
+        scanned without holding the whole reply.  Iteration ends after
+        the last segment (the one without OFPSF_REPLY_MORE), or early if
+        no segment arrives within timeout or the reply is not a stats
+        reply, in which case a warning is logged.  The transaction is
+        released when iteration ends or the generator is closed or
+        collected.
+
+        @param request The stats request message object to send
+        @param timeout The timeout in seconds for each reply segment,
+        counted from when the generator waits for it
+        @param zero_xid As for transact
+        @param lazy As for transact_wait
+        @return An iterator over the stats entries
+        """
+
+        xid = self.transact_start(request, zero_xid=zero_xid)
+        if xid is None:
+            return iter([])
+        entries = self._stats_entries(xid, timeout, lazy)
+        # Run up to the first yield so the transaction is released even
+        # if no entry is ever asked for
+        entries.next()
+        return entries
+
+    def _stats_entries(self, xid, timeout, lazy):
+        try:
+            yield None
+            while True:
+                (responses, done) = self._xid_segments_wait(xid, timeout)
+                if not responses and not done:
+                    self.logger.warning("Stats reply incomplete for xid " +
+                                        str(xid))
+                    return
+                for (msg, pkt) in self._responses_parse(responses, lazy):
+                    if msg.header.type != OFPT_STATS_REPLY:
+                        self.logger.warning("Stats request xid " + str(xid) +
+                                            " answered by message type " +
+                                            str(msg.header.type))
+                        return
+                    for entry in msg.stats:
+                        yield entry
+                if done:
+                    return
+        finally:
+            self.xid_cv.acquire()
+            self.xid_pending.pop(xid, None)
+            self.xid_done.discard(xid)
+            self.xid_cv.release()
+
+    def _responses_parse(self, responses, lazy=False):
+        """
+        Parse the raw (None, pkt) responses queued for a transaction
+        @param lazy As for transact_wait
+        @return The list of (msg, pkt) pairs that could be parsed
+        """
+        decode = of_message_parse
+        if lazy:
+            decode = lambda pkt: of_message_parse(pkt, lazy=True)
+        parsed = []
+        for (msg, pkt) in responses:
+            if msg is None:
+                msg = self._msg_materialize(pkt, decode)
+            if msg is not None:
+                parsed.append((msg, pkt))
+        return parsed
+
+    def _xid_segments_wait(self, xid, timeout):
+        """
+        Wait for and take the responses received so far for a transaction
+        @return The pair (responses, done) where responses is the list
+        of (msg, pkt) received since the last call, possibly empty on
+        timeout, and done is True once the last response has arrived
+        """
+        deadline = time.time() + timeout
+        self.xid_cv.acquire()
+        while not self.xid_pending[xid] and xid not in self.xid_done:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            self.xid_cv.wait(remaining)
+        responses = self.xid_pending[xid]
+        self.xid_pending[xid] = []
+        done = xid in self.xid_done
+        self.xid_cv.release()
+        return (responses, done)
 
     def message_send(self, msg, zero_xid=False):
         """
@@ -647,21 +994,9 @@ class Controller(Thread):
             # Sending a string indicates the message is ready to go
             self.logger.info("message_send: no socket")
             return -1
-        #@todo If not string, try to pack
-        if type(msg) != type(""):
-            try:
-                if msg.header.xid == 0 and not zero_xid:
-                    msg.header.xid = gen_xid()
-                outpkt = msg.pack()
-            except StandardError:
-                (etype,info,tb) = sys.exc_info()
-                self.logger.error(
-                         "message_send: not an OF message or string?  Got %s::%s\n%s" % 
-                         (str(etype), info, "\n".join(traceback.format_tb(tb))))
-                return -1
-
-        else:
-            outpkt = msg
+        outpkt = message_pack(msg, zero_xid, self.logger)
+        if outpkt is None:
+            return -1
 
         self.logger.debug("Sending pkt of len " + str(len(outpkt)))
         if self.switch_socket.sendall(outpkt) is None:
@@ -670,6 +1005,102 @@ class Controller(Thread):
         self.logger.error("Unknown error on sendall")
         return -1
 
+    def message_send_many(self, msgs, zero_xid=False, barrier=False,
+                          timeout=5):
+        """
+        Send a sequence of messages to the switch with a single write
+
+        The messages are packed into one buffer, so the switch sees them
+        in order and in as few segments as possible.
+
+        @param msgs A list of strings or OpenFlow message objects
+        @param zero_xid As for message_send, applied to each message
+        @param barrier If true, follow the messages with a barrier
+        request and wait for its reply
+        @param timeout The timeout in seconds for the barrier reply
+        @return -1 if error (including no barrier reply), 0 on success
+        """
+
+        outpkts = []
+        for msg in msgs:
+            outpkt = message_pack(msg, zero_xid, self.logger)
+            if outpkt is None:
+                return -1
+            outpkts.append(outpkt)
+        xid = None
+        if barrier:
+            request = barrier_request()
+            xid = self._xid_register(request)
+            if xid is None:
+                return -1
+            outpkts.append(request.pack())
+
+        rv = self.message_send("".join(outpkts))
+        if xid is not None:
+            if rv < 0:
+                self._xid_unregister(xid)
+                return rv
+            (resp, pkt) = self.transact_wait(xid, timeout=timeout)
+            if resp is None:
+                return -1
+        return rv
+
+    def message_confirm(self, msg, timeout=5, zero_xid=False):
+        """
+        Send a message and confirm the switch accepted it
+
+        The message is followed by a barrier request in the same write,
+        and the call returns as soon as the barrier reply arrives.  As
+        the switch processes them in order, an error caused by the
+        message arrives before the barrier reply.  The errors carrying
+        the message's XID and those in the receive queue by then are
+        returned; the queued ones are removed from the queue.
+
+        @param msg The message object to send; must not be a string
+        @param timeout The timeout in seconds for the barrier reply
+        @param zero_xid As for transact
+        @return The list of error message objects, empty if the message
+        was accepted; None if the message could not be sent or no
+        barrier reply arrived in time
+        """
+
+        xid = self._xid_register(msg, zero_xid)
+        if xid is None:
+            return None
+        rv = self.message_send_many([msg], zero_xid=zero_xid, barrier=True,
+                                    timeout=timeout)
+        self.xid_cv.acquire()
+        responses = self.xid_pending.pop(xid, [])
+        self.xid_done.discard(xid)
+        self.xid_cv.release()
+        if rv < 0:
+            return None
+
+        errors = [resp for (resp, pkt) in self._responses_parse(responses)
+                  if resp.header.type == OFPT_ERROR]
+        self.sync.acquire()
+        while True:
+            (resp, pkt) = self.packets.get(OFPT_ERROR)
+            if pkt is None:
+                break
+            if resp is None:
+                resp = self._msg_materialize(pkt)
+            if resp is not None:
+                errors.append(resp)
+        self.sync.release()
+        return errors
+
+    def batch(self, barrier=False, timeout=5, max_bytes=BATCH_BYTES_DEFAULT):
+        """
+        Return a MessageBatch collecting messages for message_send_many
+
+            with ctrl.batch(barrier=True) as batch:
+                for request in requests:
+                    batch.message_send(request)
+        """
+        return MessageBatch(self, barrier=barrier, timeout=timeout,
+                            max_bytes=max_bytes)
+
     def __str__(self):
         string = "Controller:\n"
         string += "  state           " + self.dbg_state + "\n"
@@ -677,6 +1108,9 @@ class Controller(Thread):
         string += "  pending pkts    " + str(len(self.packets)) + "\n"
         string += "  total pkts      " + str(self.packets_total) + "\n"
         string += "  expired pkts    " + str(self.packets_expired) + "\n"
+        for (msg_type, count) in self.packets.expired_by_type.items():
+            string += "    %-28s%d\n" % (ofp_type_map.get(msg_type, msg_type),
+                                         count)
         string += "  handled pkts    " + str(self.packets_handled) + "\n"
         string += "  poll discards   " + str(self.poll_discards) + "\n"
         string += "  parse errors    " + str(self.parse_errors) + "\n"
@@ -690,6 +1124,116 @@ class Controller(Thread):
     def show(self):
         print str(self)
 
+def message_pack(msg, zero_xid=False, logger=None):
+    """
+    Pack a message for sending as message_send does
+
+    @param msg A string or OpenFlow message object; a 0 XID is replaced
+    by a generated one unless zero_xid is set
+    @return The packed string or None if msg could not be packed
+    """
+    if type(msg) == type(""):
+        return msg
+    try:
+        if msg.header.xid == 0 and not zero_xid:
+            msg.header.xid = gen_xid()
+        return msg.pack()
+    except StandardError:
+        if logger:
+            (etype,info,tb) = sys.exc_info()
+            logger.error(
+                "message_send: not an OF message or string?  Got %s::%s\n%s" %
+                (str(etype), info, "\n".join(traceback.format_tb(tb))))
+        return None
+
+class MessageBatch(object):
+    """
+    Messages collected for sending together
+
+    Each message is packed as it is added, so a message object may be
+    modified and added again.  The batch is written with one
+    message_send_many call when it exceeds max_bytes and when flushed;
+    used as a context manager, it is flushed on exit (with a barrier
+    if requested) unless an exception was raised.
+
+    @var ctrl The controller to send through
+    @var rv The results of all sends ORed together: -1 if any failed
+    """
+
+    def __init__(self, ctrl, barrier=False, timeout=5,
+                 max_bytes=BATCH_BYTES_DEFAULT):
+        self.ctrl = ctrl
+        self.barrier = barrier
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.outpkts = []
+        self.bytes = 0
+        self.rv = 0
+
+    def __len__(self):
+        return len(self.outpkts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, value, tb):
+        if etype is None:
+            self.flush(barrier=self.barrier)
+        return False
+
+    def message_send(self, msg, zero_xid=False):
+        """
+        Add a message to the batch; arguments as for message_send
+        @return -1 if msg could not be packed or an early flush failed,
+        0 otherwise
+        """
+        outpkt = message_pack(msg, zero_xid, self.ctrl.logger)
+        if outpkt is None:
+            self.rv = -1
+            return -1
+        self.outpkts.append(outpkt)
+        self.bytes += len(outpkt)
+        if self.bytes >= self.max_bytes:
+            return self.flush()
+        return 0
+
+    def flush(self, barrier=False):
+        """
+        Send the messages collected so far
+        @param barrier If true, follow them with a barrier and wait for it
+        @return -1 if error, 0 on success
+        """
+        rv = 0
+        if self.outpkts or barrier:
+            rv = self.ctrl.message_send_many(self.outpkts, barrier=barrier,
+                                             timeout=self.timeout)
+        self.outpkts = []
+        self.bytes = 0
+        self.rv |= rv
+        return rv
+
+def _reply_more(msg_type, rawmsg):
+    """
+    Return True if rawmsg is a stats reply segment with more to follow
+    """
+    if (msg_type != OFPT_STATS_REPLY or
+            len(rawmsg) < STATS_REPLY_FLAGS_OFFSET + 2):
+        return False
+    (flags,) = STATS_REPLY_FLAGS.unpack_from(rawmsg, STATS_REPLY_FLAGS_OFFSET)
+    return bool(flags & OFPSF_REPLY_MORE)
+
+def _transact_merge(responses):
+    """
+    Combine the (msg, pkt) segments of a multipart reply into one pair
+    """
+    (resp, pkt) = responses[0]
+    if len(responses) == 1:
+        return (resp, pkt)
+    for (seg, _) in responses[1:]:
+        resp.stats.extend(seg.stats)
+    resp.flags &= ~OFPSF_REPLY_MORE
+    return (resp, "".join([seg_pkt for (_, seg_pkt) in responses]))
+
 def sample_handler(controller, msg, pkt):
     """
     Sample message handler
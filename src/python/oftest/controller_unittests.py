@@ -0,0 +1,502 @@
+#!/usr/bin/python
+
+import socket
+import struct
+import threading
+import time
+import unittest
+from oftest import message
+from oftest import controller
+from oftest import async_controller
+from oftest import cstruct as ofp
+from oftest import parse
+from oftest import stats_list
+
+def echo_request_pkt(xid, data=""):
+    msg = message.echo_request()
+    msg.header.xid = xid
+    msg.data = data
+    return msg.pack()
+
+def port_stats_reply_pkt(xid, port_nos, more=False):
+    msg = message.port_stats_reply()
+    msg.header.xid = xid
+    for port_no in port_nos:
+        entry = message.port_stats_entry()
+        entry.port_no = port_no
+        msg.stats.append(entry)
+    if more:
+        msg.flags = ofp.OFPSF_REPLY_MORE
+    return msg.pack()
+
+def flow_stats_reply_pkt(xid, priorities, more=False):
+    msg = message.flow_stats_reply()
+    msg.header.xid = xid
+    for priority in priorities:
+        entry = message.flow_stats_entry()
+        entry.priority = priority
+        msg.stats.append(entry)
+    if more:
+        msg.flags = ofp.OFPSF_REPLY_MORE
+    return msg.pack()
+
+def connected_controller():
+    """
+    Return a controller whose switch socket is one end of a socket pair
+    """
+    ctrl = controller.Controller()
+    (ctrl.switch_socket, peer) = socket.socketpair()
+    return (ctrl, peer)
+
+class stream_reassembly(unittest.TestCase):
+    def runTest(self):
+        ctrl = controller.Controller()
+        stream = "".join([echo_request_pkt(xid, "x" * xid)
+                          for xid in range(1, 6)])
+        # Feed the stream in awkward chunks splitting headers and bodies
+        for start in range(0, len(stream), 7):
+            ctrl._pkt_handle(stream[start:start + 7])
+        self.assertEqual(ctrl.parse_errors, 0)
+        self.assertEqual(len(ctrl.rcv_buf), 0)
+        self.assertEqual(len(ctrl.packets), 5)
+        for xid in range(1, 6):
+            (msg, pkt) = ctrl.poll(ofp.OFPT_ECHO_REQUEST)
+            self.assertEqual(msg.header.xid, xid)
+            self.assertEqual(msg.data, "x" * xid)
+            self.assertEqual(pkt, echo_request_pkt(xid, "x" * xid))
+
+class stream_partial(unittest.TestCase):
+    def runTest(self):
+        ctrl = controller.Controller()
+        pkt = echo_request_pkt(7, "hello")
+        ctrl._pkt_handle(pkt + pkt[:3])
+        self.assertEqual(len(ctrl.packets), 1)
+        self.assertEqual(str(ctrl.rcv_buf), pkt[:3])
+        ctrl._pkt_handle(pkt[3:])
+        self.assertEqual(len(ctrl.packets), 2)
+        self.assertEqual(len(ctrl.rcv_buf), 0)
+
+class message_queue_order(unittest.TestCase):
+    def runTest(self):
+        queue = controller.MessageQueue(max_pkts=4)
+        for (idx, msg_type) in enumerate([1, 2, 1, 3]):
+            self.assertEqual(queue.put(msg_type, idx, str(idx)), 0)
+        self.assertEqual(queue.get(1), (0, "0"))
+        self.assertEqual(queue.get(), (1, "1"))
+        self.assertEqual(queue.get(5), (None, None))
+        # Overflow evicts the oldest remaining message (idx 2)
+        queue.put(1, 4, "4")
+        queue.put(2, 5, "5")
+        self.assertEqual(queue.put(2, 6, "6"), 1)
+        self.assertEqual(queue.expired_by_type, {1: 1})
+        self.assertEqual(len(queue), 4)
+        self.assertEqual([queue.get()[0] for idx in range(5)],
+                         [3, 4, 5, 6, None])
+
+class message_queue_type_limit(unittest.TestCase):
+    def runTest(self):
+        queue = controller.MessageQueue(max_pkts_per_type={
+                ofp.OFPT_PACKET_IN : 2})
+        for idx in range(1000):
+            queue.put(ofp.OFPT_PACKET_IN, idx, "")
+            queue.put(ofp.OFPT_ERROR, idx, "")
+            queue.get(ofp.OFPT_ERROR)
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.expired, 998)
+        self.assertTrue(len(queue.order) < 100, "Arrival index not compacted")
+        self.assertEqual(queue.get(), (998, ""))
+        self.assertEqual(queue.get(), (999, ""))
+        self.assertEqual(queue.get(), (None, None))
+
+class deferred_parse(unittest.TestCase):
+    def runTest(self):
+        (ctrl, peer) = connected_controller()
+        ctrl.keep_alive = True
+        ctrl._pkt_handle(echo_request_pkt(5, "ping"))
+        self.assertEqual(len(ctrl.packets), 0)
+        hdr = parse.of_header_parse(peer.recv(4096))
+        self.assertEqual((hdr.type, hdr.xid), (ofp.OFPT_ECHO_REPLY, 5))
+        ctrl.keep_alive = False
+
+        # Queued raw; bodies are parsed when polled
+        bogus = message.bad_request_error_msg()
+        bogus.type = 0x99
+        ctrl._pkt_handle(bogus.pack() + echo_request_pkt(6, "x"))
+        self.assertEqual(len(ctrl.packets), 2)
+        self.assertEqual(ctrl.parse_errors, 0)
+        (msg, pkt) = ctrl.poll()
+        self.assertEqual((msg.header.xid, msg.data), (6, "x"))
+        self.assertEqual(ctrl.parse_errors, 1)
+
+        # Handlers are passed the parsed message
+        seen = []
+        ctrl.register(ofp.OFPT_ECHO_REQUEST,
+                      lambda ctrl, msg, pkt: seen.append(msg.data) or True)
+        ctrl._pkt_handle(echo_request_pkt(7, "y"))
+        self.assertEqual(seen, ["y"])
+        self.assertEqual(len(ctrl.packets), 0)
+
+class transact_concurrent(unittest.TestCase):
+    def runTest(self):
+        (ctrl, peer) = connected_controller()
+        xids = []
+        for idx in range(3):
+            xids.append(ctrl.transact_start(message.echo_request()))
+        self.assertEqual(len(ctrl.xid_pending), 3)
+        # Reply out of order
+        for xid in reversed(xids):
+            ctrl._pkt_handle(echo_request_pkt(xid))
+        for xid in xids:
+            (resp, pkt) = ctrl.transact_wait(xid, timeout=0)
+            self.assertTrue(resp is not None)
+            self.assertEqual(resp.header.xid, xid)
+        self.assertEqual(len(ctrl.xid_pending), 0)
+        self.assertEqual(len(ctrl.packets), 0)
+
+class transact_multipart(unittest.TestCase):
+    def runTest(self):
+        (ctrl, peer) = connected_controller()
+        xid = ctrl.transact_start(message.port_stats_request())
+        ctrl._pkt_handle(port_stats_reply_pkt(xid, [1, 2], more=True))
+        (resp, pkt) = ctrl.transact_wait(xid, timeout=0)
+        self.assertTrue(resp is None, "Incomplete reply returned")
+
+        xid = ctrl.transact_start(message.port_stats_request())
+        seg1 = port_stats_reply_pkt(xid, [1, 2], more=True)
+        seg2 = port_stats_reply_pkt(xid, [3])
+        ctrl._pkt_handle(seg1 + seg2)
+        (resp, pkt) = ctrl.transact_wait(xid, timeout=0)
+        self.assertEqual([entry.port_no for entry in resp.stats], [1, 2, 3])
+        self.assertEqual(resp.flags & ofp.OFPSF_REPLY_MORE, 0)
+        self.assertEqual(pkt, seg1 + seg2)
+
+class transact_lazy(unittest.TestCase):
+    def runTest(self):
+        (ctrl, peer) = connected_controller()
+        lazy_xid = ctrl.transact_start(message.flow_stats_request())
+        eager_xid = ctrl.transact_start(message.flow_stats_request())
+        ctrl._pkt_handle(flow_stats_reply_pkt(lazy_xid, [1, 2], more=True) +
+                         flow_stats_reply_pkt(eager_xid, [4]) +
+                         flow_stats_reply_pkt(lazy_xid, [3]))
+        (resp, pkt) = ctrl.transact_wait(lazy_xid, timeout=0, lazy=True)
+        self.assertTrue(isinstance(resp.stats, stats_list.lazy_stats_list))
+        self.assertEqual([resp.stats.field(idx, "priority")
+                          for idx in range(len(resp.stats))], [1, 2, 3])
+        # Other transactions still decode their replies
+        (resp, pkt) = ctrl.transact_wait(eager_xid, timeout=0)
+        self.assertEqual(type(resp.stats), list)
+        self.assertEqual(resp.stats[0].priority, 4)
+
+class stats_iter_segments(unittest.TestCase):
+    def runTest(self):
+        (ctrl, peer) = connected_controller()
+        entries = ctrl.stats_iter(message.port_stats_request(), timeout=0)
+        self.assertRaises(StopIteration, entries.next)
+        self.assertEqual(len(ctrl.xid_pending), 0)
+        recv_msg(peer)
+
+        # The request is sent by the call, and the transaction released
+        # if the entries are never asked for
+        request = message.port_stats_request()
+        request.header.xid = 41
+        entries = ctrl.stats_iter(request, timeout=2)
+        self.assertEqual(parse.of_header_parse(recv_msg(peer)).xid, 41)
+        self.assertEqual(ctrl.xid_pending, {41 : []})
+        del entries
+        self.assertEqual(len(ctrl.xid_pending), 0)
+
+        request = message.port_stats_request()
+        request.header.xid = 42
+        entries = ctrl.stats_iter(request, timeout=2)
+        # Answer from a thread while the first next() waits
+        seg1 = port_stats_reply_pkt(42, [1, 2], more=True)
+        threading.Timer(0.1, ctrl._pkt_handle, [seg1]).start()
+        self.assertEqual(entries.next().port_no, 1)
+        self.assertEqual(entries.next().port_no, 2)
+        # Consumed segments are released
+        self.assertEqual(ctrl.xid_pending[42], [])
+        ctrl._pkt_handle(port_stats_reply_pkt(42, [3], more=True))
+        self.assertEqual(entries.next().port_no, 3)
+        ctrl._pkt_handle(port_stats_reply_pkt(42, [4, 5]))
+        self.assertEqual([entry.port_no for entry in entries], [4, 5])
+        self.assertEqual(len(ctrl.xid_pending), 0)
+        self.assertEqual(len(ctrl.xid_done), 0)
+
+class message_send_many(unittest.TestCase):
+    def runTest(self):
+        (ctrl, peer) = connected_controller()
+        received = []
+        def switch():
+            while True:
+                hdr = parse.of_header_parse(recv_msg(peer))
+                received.append(hdr)
+                if hdr.type == ofp.OFPT_BARRIER_REQUEST:
+                    reply = message.barrier_reply()
+                    reply.header.xid = hdr.xid
+                    ctrl._pkt_handle(reply.pack())
+                    return
+        responder = threading.Thread(target=switch)
+        responder.start()
+        request = message.echo_request()
+        with ctrl.batch(barrier=True, timeout=2) as batch:
+            for idx in range(3):
+                request.data = str(idx)
+                request.header.xid = 0
+                self.assertEqual(batch.message_send(request), 0)
+        responder.join()
+        self.assertEqual(batch.rv, 0)
+        self.assertEqual([hdr.type for hdr in received],
+                         [ofp.OFPT_ECHO_REQUEST] * 3 +
+                         [ofp.OFPT_BARRIER_REQUEST])
+        self.assertEqual(len(set([hdr.xid for hdr in received])), 4)
+        self.assertEqual(len(ctrl.xid_pending), 0)
+
+        # No barrier reply
+        rv = ctrl.message_send_many([echo_request_pkt(1)], barrier=True,
+                                    timeout=0.1)
+        self.assertEqual(rv, -1)
+
+class message_confirm(unittest.TestCase):
+    def runTest(self):
+        (ctrl, peer) = connected_controller()
+        def switch(reject):
+            # Reject group mods; errors carry the offending XID
+            while True:
+                hdr = parse.of_header_parse(recv_msg(peer))
+                if hdr.type == ofp.OFPT_GROUP_MOD and reject:
+                    error = message.group_mod_failed_error_msg()
+                    error.header.xid = hdr.xid
+                    error.code = ofp.OFPGMFC_GROUP_EXISTS
+                    ctrl._pkt_handle(error.pack())
+                if hdr.type == ofp.OFPT_BARRIER_REQUEST:
+                    reply = message.barrier_reply()
+                    reply.header.xid = hdr.xid
+                    ctrl._pkt_handle(reply.pack())
+                    return
+        for reject in [False, True]:
+            responder = threading.Thread(target=switch, args=(reject,))
+            responder.start()
+            start = time.time()
+            errors = ctrl.message_confirm(message.group_mod(), timeout=2)
+            responder.join()
+            self.assertTrue(time.time() - start < 1)
+            if reject:
+                self.assertEqual(len(errors), 1)
+                self.assertEqual(errors[0].code, ofp.OFPGMFC_GROUP_EXISTS)
+            else:
+                self.assertEqual(errors, [])
+            self.assertEqual(len(ctrl.xid_pending), 0)
+            self.assertEqual(len(ctrl.xid_done), 0)
+
+        # Errors queued before the barrier reply are reported too
+        error = message.bad_request_error_msg()
+        error.header.xid = 7
+        ctrl._pkt_handle(error.pack())
+        responder = threading.Thread(target=switch, args=(False,))
+        responder.start()
+        errors = ctrl.message_confirm(message.group_mod(), timeout=2)
+        responder.join()
+        self.assertEqual([err.header.xid for err in errors], [7])
+        self.assertEqual(ctrl.poll(ofp.OFPT_ERROR), (None, None))
+
+        # No barrier reply
+        self.assertEqual(ctrl.message_confirm(message.group_mod(),
+                                              timeout=0.1), None)
+        self.assertEqual(len(ctrl.xid_pending), 0)
+
+def fake_switch():
+    """
+    Return a listening socket standing in for a switch
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(1)
+    return sock
+
+def recv_msg(sock):
+    """
+    Read one OpenFlow message from a blocking socket
+    """
+    pkt = ""
+    while len(pkt) < ofp.OFP_HEADER_BYTES:
+        pkt += sock.recv(ofp.OFP_HEADER_BYTES - len(pkt))
+    length = struct.unpack("!H", pkt[2:4])[0]
+    while len(pkt) < length:
+        pkt += sock.recv(length - len(pkt))
+    return pkt
+
+class async_controller_transact(unittest.TestCase):
+    def runTest(self):
+        listener = fake_switch()
+        ctrl = async_controller.ThreadedController(
+            port=listener.getsockname()[1])
+        ctrl.start()
+        try:
+            (switch, addr) = listener.accept()
+            self.assertTrue(ctrl.connect(timeout=2))
+            hdr = parse.of_header_parse(recv_msg(switch))
+            self.assertEqual(hdr.type, ofp.OFPT_HELLO)
+
+            # Unsolicited message is queued for poll
+            switch.sendall(echo_request_pkt(1))
+            (msg, pkt) = ctrl.poll(ofp.OFPT_ECHO_REQUEST, timeout=2)
+            self.assertEqual(msg.header.xid, 1)
+            self.assertEqual(ctrl.poll(timeout=0), (None, None))
+
+            # Multipart reply split across segments and writes
+            request = message.port_stats_request()
+            request.header.xid = 42
+            seg1 = port_stats_reply_pkt(42, [1, 2], more=True)
+            seg2 = port_stats_reply_pkt(42, [3])
+            def reply():
+                hdr = parse.of_header_parse(recv_msg(switch))
+                switch.sendall(seg1[:5])
+                switch.sendall(seg1[5:] + seg2)
+            responder = threading.Thread(target=reply)
+            responder.start()
+            (resp, pkt) = ctrl.transact(request, timeout=2)
+            responder.join()
+            self.assertEqual([entry.port_no for entry in resp.stats],
+                             [1, 2, 3])
+            self.assertEqual(pkt, seg1 + seg2)
+        finally:
+            ctrl.kill()
+            ctrl.join(2)
+            listener.close()
+        self.assertFalse(ctrl.isAlive(), "Loop did not stop")
+        self.assertEqual(ctrl.message_send(message.hello()), -1)
+
+class async_controller_send_many(unittest.TestCase):
+    def runTest(self):
+        listener = fake_switch()
+        ctrl = async_controller.ThreadedController(
+            port=listener.getsockname()[1])
+        ctrl.start()
+        try:
+            (switch, addr) = listener.accept()
+            self.assertTrue(ctrl.connect(timeout=2))
+            recv_msg(switch)
+            conn = ctrl.engine.switch
+            writes = []
+            def message_send(msg, zero_xid=False):
+                writes.append(msg)
+                return async_controller.SwitchConnection.message_send(
+                    conn, msg, zero_xid)
+            conn.message_send = message_send
+            received = []
+            def reply():
+                while True:
+                    hdr = parse.of_header_parse(recv_msg(switch))
+                    received.append(hdr)
+                    if hdr.type == ofp.OFPT_BARRIER_REQUEST:
+                        reply = message.barrier_reply()
+                        reply.header.xid = hdr.xid
+                        switch.sendall(reply.pack())
+                        return
+            responder = threading.Thread(target=reply)
+            responder.start()
+            rv = ctrl.message_send_many([echo_request_pkt(1),
+                                         echo_request_pkt(2)],
+                                        barrier=True, timeout=2)
+            responder.join()
+            self.assertEqual(rv, 0)
+            self.assertEqual([hdr.type for hdr in received],
+                             [ofp.OFPT_ECHO_REQUEST] * 2 +
+                             [ofp.OFPT_BARRIER_REQUEST])
+            # The barrier goes out in the same write as the messages
+            self.assertEqual(len(writes), 1)
+            self.assertEqual(writes[0][:16],
+                             echo_request_pkt(1) + echo_request_pkt(2))
+            self.assertEqual(conn.xid_pending, {})
+
+            # No barrier reply
+            rv = ctrl.message_send_many([echo_request_pkt(3)], barrier=True,
+                                        timeout=0.1)
+            self.assertEqual(rv, -1)
+            time.sleep(0.1)
+            self.assertEqual(conn.xid_pending, {})
+        finally:
+            ctrl.kill()
+            ctrl.join(2)
+            listener.close()
+
+class async_controller_timeout(unittest.TestCase):
+    def runTest(self):
+        listener = fake_switch()
+        ctrl = async_controller.ThreadedController(
+            port=listener.getsockname()[1])
+        ctrl.start()
+        try:
+            (switch, addr) = listener.accept()
+            self.assertTrue(ctrl.connect(timeout=2))
+            (resp, pkt) = ctrl.transact(message.echo_request(), timeout=0.1)
+            self.assertTrue(resp is None)
+            self.assertEqual(ctrl.poll(timeout=0), (None, None))
+            self.assertEqual(ctrl.engine.switch.xid_pending, {})
+            # A late reply to an abandoned transaction is queued instead
+            recv_msg(switch)
+            hdr = parse.of_header_parse(recv_msg(switch))
+            switch.sendall(echo_request_pkt(hdr.xid))
+            (msg, pkt) = ctrl.poll(ofp.OFPT_ECHO_REQUEST, timeout=2)
+            self.assertEqual(msg.header.xid, hdr.xid)
+        finally:
+            ctrl.kill()
+            ctrl.join(2)
+            listener.close()
+
+def fake_switch_connect(port, dpid):
+    """
+    Connect to a listening controller and answer its features request
+    """
+    sock = socket.create_connection(('127.0.0.1', port))
+    while True:
+        hdr = parse.of_header_parse(recv_msg(sock))
+        if hdr.type == ofp.OFPT_FEATURES_REQUEST:
+            break
+    reply = message.features_reply()
+    reply.header.xid = hdr.xid
+    reply.datapath_id = dpid
+    sock.sendall(reply.pack())
+    return sock
+
+class multi_controller(unittest.TestCase):
+    def runTest(self):
+        ctrl = async_controller.ThreadedMultiController(port=0)
+        ctrl.start()
+        try:
+            socks = {}
+            for dpid in [3, 1, 2]:
+                socks[dpid] = fake_switch_connect(ctrl.engine.port, dpid)
+            self.assertEqual(ctrl.connect(count=3, timeout=2), [1, 2, 3])
+
+            # Each switch has its own receive queue
+            for dpid in [1, 2, 3]:
+                socks[dpid].sendall(echo_request_pkt(dpid))
+            for dpid in [1, 2, 3]:
+                switch = ctrl.switch(dpid)
+                (msg, pkt) = switch.poll(ofp.OFPT_ECHO_REQUEST, timeout=2)
+                self.assertEqual(msg.header.xid, dpid)
+                self.assertEqual(switch.poll(timeout=0), (None, None))
+
+            # A datapath reconnecting replaces its old connection
+            old = ctrl.switch(2)
+            socks[2] = fake_switch_connect(ctrl.engine.port, 2)
+            deadline = time.time() + 2
+            while (ctrl.switch(2) is None or
+                   ctrl.switch(2).target is old.target):
+                self.assertTrue(time.time() < deadline, "No reconnect")
+                time.sleep(0.01)
+            self.assertEqual(ctrl.datapath_ids(), [1, 2, 3])
+            self.assertEqual(old.message_send(message.hello()), -1)
+
+            socks[1].close()
+            deadline = time.time() + 2
+            while ctrl.datapath_ids() != [2, 3]:
+                self.assertTrue(time.time() < deadline, "No disconnect")
+                time.sleep(0.01)
+        finally:
+            ctrl.kill()
+            ctrl.join(2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ class ofp_hello(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ()
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -26,18 +27,30 @@ class ofp_hello(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        return packed
+        return ""
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        return offset + 0
 
     def unpack(self, binaryString):
         """Unpack message
         Do not unpack empty array used as placeholder
         since they can contain heterogeneous type
         """
-        if (len(binaryString) < 0):
-            return binaryString
         return binaryString[0:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        return offset + 0
+
     def __len__(self):
         """Return length of message
         """
@@ -59,6 +72,7 @@ class ofp_hello(object):
         return outstr
 
 
+_ofp_aggregate_stats_reply_s0 = struct.Struct("!QQLBBBB")
 class ofp_aggregate_stats_reply(object):
     """Automatically generated Python class for ofp_aggregate_stats_reply
 
@@ -67,6 +81,7 @@ class ofp_aggregate_stats_reply(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('packet_count', 'byte_count', 'flow_count', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -92,10 +107,15 @@ class ofp_aggregate_stats_reply(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!QQL", self.packet_count, self.byte_count, self.flow_count)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_aggregate_stats_reply_s0.pack(self.packet_count, self.byte_count, self.flow_count, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_aggregate_stats_reply_s0.pack_into(buffer, offset, self.packet_count, self.byte_count, self.flow_count, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 24
 
     def unpack(self, binaryString):
         """Unpack message
@@ -104,16 +124,20 @@ class ofp_aggregate_stats_reply(object):
         """
         if (len(binaryString) < 24):
             return binaryString
-        fmt = '!QQL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.packet_count, self.byte_count, self.flow_count) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 20
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.packet_count, self.byte_count, self.flow_count, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_aggregate_stats_reply_s0.unpack_from(binaryString, 0)
         return binaryString[24:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 24):
+            return offset
+        (self.packet_count, self.byte_count, self.flow_count, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_aggregate_stats_reply_s0.unpack_from(buffer, offset)
+        return offset + 24
+
     def __len__(self):
         """Return length of message
         """
@@ -142,6 +166,7 @@ class ofp_aggregate_stats_reply(object):
         return outstr
 
 
+_ofp_role_request_s0 = struct.Struct("!LBBBBQ")
 class ofp_role_request(object):
     """Automatically generated Python class for ofp_role_request
 
@@ -150,6 +175,7 @@ class ofp_role_request(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('role', 'pad', 'generation_id')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -174,11 +200,15 @@ class ofp_role_request(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!L", self.role)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        packed += struct.pack("!Q", self.generation_id)
-        return packed
+        return _ofp_role_request_s0.pack(self.role, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.generation_id)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_role_request_s0.pack_into(buffer, offset, self.role, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.generation_id)
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -187,20 +217,20 @@ class ofp_role_request(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        fmt = '!L'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.role,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!Q'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.generation_id,) = struct.unpack(fmt, binaryString[start:end])
+        (self.role, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.generation_id) = _ofp_role_request_s0.unpack_from(binaryString, 0)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        (self.role, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.generation_id) = _ofp_role_request_s0.unpack_from(buffer, offset)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -227,6 +257,7 @@ class ofp_role_request(object):
         return outstr
 
 
+_ofp_table_stats_s0 = struct.Struct("!BBBBBBBB32sQQLLQQQQLLLLQQ")
 class ofp_table_stats(object):
     """Automatically generated Python class for ofp_table_stats
 
@@ -235,6 +266,7 @@ class ofp_table_stats(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('table_id', 'pad', 'name', 'match', 'wildcards', 'write_actions', 'apply_actions', 'write_setfields', 'apply_setfields', 'metadata_match', 'metadata_write', 'instructions', 'config', 'max_entries', 'active_count', 'lookup_count', 'matched_count')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -277,12 +309,15 @@ class ofp_table_stats(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!B", self.table_id)
-        packed += struct.pack("!BBBBBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6])
-        packed += self.name.ljust(32,'\0')
-        packed += struct.pack("!QQLLQQQQLLLLQQ", self.match, self.wildcards, self.write_actions, self.apply_actions, self.write_setfields, self.apply_setfields, self.metadata_match, self.metadata_write, self.instructions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count)
-        return packed
+        return _ofp_table_stats_s0.pack(self.table_id, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6], self.name, self.match, self.wildcards, self.write_actions, self.apply_actions, self.write_setfields, self.apply_setfields, self.metadata_match, self.metadata_write, self.instructions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_table_stats_s0.pack_into(buffer, offset, self.table_id, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6], self.name, self.match, self.wildcards, self.write_actions, self.apply_actions, self.write_setfields, self.apply_setfields, self.metadata_match, self.metadata_write, self.instructions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count)
+        return offset + 128
 
     def unpack(self, binaryString):
         """Unpack message
@@ -291,21 +326,22 @@ class ofp_table_stats(object):
         """
         if (len(binaryString) < 128):
             return binaryString
-        fmt = '!B'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.table_id,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBBBBB'
-        start = 1
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6]) = struct.unpack(fmt, binaryString[start:end])
-        self.name = binaryString[8:40].replace("\0","")
-        fmt = '!QQLLQQQQLLLLQQ'
-        start = 40
-        end = start + struct.calcsize(fmt)
-        (self.match, self.wildcards, self.write_actions, self.apply_actions, self.write_setfields, self.apply_setfields, self.metadata_match, self.metadata_write, self.instructions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count) = struct.unpack(fmt,  binaryString[start:end])
+        (self.table_id, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6], self.name, self.match, self.wildcards, self.write_actions, self.apply_actions, self.write_setfields, self.apply_setfields, self.metadata_match, self.metadata_write, self.instructions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count) = _ofp_table_stats_s0.unpack_from(binaryString, 0)
+        self.name = self.name.replace("\0","")
         return binaryString[128:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 128):
+            return offset
+        (self.table_id, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6], self.name, self.match, self.wildcards, self.write_actions, self.apply_actions, self.write_setfields, self.apply_setfields, self.metadata_match, self.metadata_write, self.instructions, self.config, self.max_entries, self.active_count, self.lookup_count, self.matched_count) = _ofp_table_stats_s0.unpack_from(buffer, offset)
+        self.name = self.name.replace("\0","")
+        return offset + 128
+
     def __len__(self):
         """Return length of message
         """
@@ -360,6 +396,7 @@ class ofp_table_stats(object):
         return outstr
 
 
+_ofp_table_mod_s0 = struct.Struct("!BBBBL")
 class ofp_table_mod(object):
     """Automatically generated Python class for ofp_table_mod
 
@@ -368,6 +405,7 @@ class ofp_table_mod(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('table_id', 'pad', 'config')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -392,11 +430,15 @@ class ofp_table_mod(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!B", self.table_id)
-        packed += struct.pack("!BBB", self.pad[0], self.pad[1], self.pad[2])
-        packed += struct.pack("!L", self.config)
-        return packed
+        return _ofp_table_mod_s0.pack(self.table_id, self.pad[0], self.pad[1], self.pad[2], self.config)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_table_mod_s0.pack_into(buffer, offset, self.table_id, self.pad[0], self.pad[1], self.pad[2], self.config)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -405,20 +447,20 @@ class ofp_table_mod(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!B'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.table_id,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBB'
-        start = 1
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!L'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.config,) = struct.unpack(fmt, binaryString[start:end])
+        (self.table_id, self.pad[0], self.pad[1], self.pad[2], self.config) = _ofp_table_mod_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.table_id, self.pad[0], self.pad[1], self.pad[2], self.config) = _ofp_table_mod_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -445,6 +487,7 @@ class ofp_table_mod(object):
         return outstr
 
 
+_ofp_group_stats_s0 = struct.Struct("!HBBLLBBBBQQ")
 class ofp_group_stats(object):
     """Automatically generated Python class for ofp_group_stats
 
@@ -453,6 +496,7 @@ class ofp_group_stats(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('length', 'pad', 'group_id', 'ref_count', 'pad2', 'packet_count', 'byte_count')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -485,13 +529,15 @@ class ofp_group_stats(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!H", self.length)
-        packed += struct.pack("!BB", self.pad[0], self.pad[1])
-        packed += struct.pack("!LL", self.group_id, self.ref_count)
-        packed += struct.pack("!BBBB", self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3])
-        packed += struct.pack("!QQ", self.packet_count, self.byte_count)
-        return packed
+        return _ofp_group_stats_s0.pack(self.length, self.pad[0], self.pad[1], self.group_id, self.ref_count, self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.packet_count, self.byte_count)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_group_stats_s0.pack_into(buffer, offset, self.length, self.pad[0], self.pad[1], self.group_id, self.ref_count, self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.packet_count, self.byte_count)
+        return offset + 32
 
     def unpack(self, binaryString):
         """Unpack message
@@ -500,28 +546,20 @@ class ofp_group_stats(object):
         """
         if (len(binaryString) < 32):
             return binaryString
-        fmt = '!H'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.length,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BB'
-        start = 2
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!LL'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.group_id, self.ref_count) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 12
-        end = start + struct.calcsize(fmt)
-        (self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!QQ'
-        start = 16
-        end = start + struct.calcsize(fmt)
-        (self.packet_count, self.byte_count) = struct.unpack(fmt,  binaryString[start:end])
+        (self.length, self.pad[0], self.pad[1], self.group_id, self.ref_count, self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.packet_count, self.byte_count) = _ofp_group_stats_s0.unpack_from(binaryString, 0)
         return binaryString[32:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 32):
+            return offset
+        (self.length, self.pad[0], self.pad[1], self.group_id, self.ref_count, self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.packet_count, self.byte_count) = _ofp_group_stats_s0.unpack_from(buffer, offset)
+        return offset + 32
+
     def __len__(self):
         """Return length of message
         """
@@ -555,6 +593,7 @@ class ofp_group_stats(object):
         return outstr
 
 
+_ofp_instruction_actions_s0 = struct.Struct("!HHBBBB")
 class ofp_instruction_actions(object):
     """Automatically generated Python class for ofp_instruction_actions
 
@@ -563,6 +602,7 @@ class ofp_instruction_actions(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -587,10 +627,15 @@ class ofp_instruction_actions(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.len)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_instruction_actions_s0.pack(self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_instruction_actions_s0.pack_into(buffer, offset, self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -599,16 +644,20 @@ class ofp_instruction_actions(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_instruction_actions_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_instruction_actions_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -635,6 +684,7 @@ class ofp_instruction_actions(object):
         return outstr
 
 
+_ofp_queue_stats_s0 = struct.Struct("!LLQQQ")
 class ofp_queue_stats(object):
     """Automatically generated Python class for ofp_queue_stats
 
@@ -643,6 +693,7 @@ class ofp_queue_stats(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('port_no', 'queue_id', 'tx_bytes', 'tx_packets', 'tx_errors')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -665,9 +716,15 @@ class ofp_queue_stats(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LLQQQ", self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors)
-        return packed
+        return _ofp_queue_stats_s0.pack(self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_queue_stats_s0.pack_into(buffer, offset, self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors)
+        return offset + 32
 
     def unpack(self, binaryString):
         """Unpack message
@@ -676,12 +733,20 @@ class ofp_queue_stats(object):
         """
         if (len(binaryString) < 32):
             return binaryString
-        fmt = '!LLQQQ'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors) = struct.unpack(fmt,  binaryString[start:end])
+        (self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors) = _ofp_queue_stats_s0.unpack_from(binaryString, 0)
         return binaryString[32:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 32):
+            return offset
+        (self.port_no, self.queue_id, self.tx_bytes, self.tx_packets, self.tx_errors) = _ofp_queue_stats_s0.unpack_from(buffer, offset)
+        return offset + 32
+
     def __len__(self):
         """Return length of message
         """
@@ -713,6 +778,7 @@ class ofp_queue_stats(object):
         return outstr
 
 
+_ofp_packet_in_s0 = struct.Struct("!LHBB")
 class ofp_packet_in(object):
     """Automatically generated Python class for ofp_packet_in
 
@@ -721,6 +787,7 @@ class ofp_packet_in(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('buffer_id', 'total_len', 'reason', 'table_id', 'match')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -745,10 +812,16 @@ class ofp_packet_in(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LHBB", self.buffer_id, self.total_len, self.reason, self.table_id)
-        packed += self.match.pack()
-        return packed
+        return _ofp_packet_in_s0.pack(self.buffer_id, self.total_len, self.reason, self.table_id) + self.match.pack()
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_packet_in_s0.pack_into(buffer, offset, self.buffer_id, self.total_len, self.reason, self.table_id)
+        self.match.pack_into(buffer, offset + 8)
+        return offset + 12
 
     def unpack(self, binaryString):
         """Unpack message
@@ -757,13 +830,22 @@ class ofp_packet_in(object):
         """
         if (len(binaryString) < 12):
             return binaryString
-        fmt = '!LHBB'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.buffer_id, self.total_len, self.reason, self.table_id) = struct.unpack(fmt,  binaryString[start:end])
-        self.match.unpack(binaryString[8:])
+        (self.buffer_id, self.total_len, self.reason, self.table_id) = _ofp_packet_in_s0.unpack_from(binaryString, 0)
+        self.match.unpack_from(binaryString, 8)
         return binaryString[12:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 12):
+            return offset
+        (self.buffer_id, self.total_len, self.reason, self.table_id) = _ofp_packet_in_s0.unpack_from(buffer, offset)
+        self.match.unpack_from(buffer, offset + 8)
+        return offset + 12
+
     def __len__(self):
         """Return length of message
         """
@@ -796,6 +878,7 @@ class ofp_packet_in(object):
         return outstr
 
 
+_ofp_error_experimenter_msg_s0 = struct.Struct("!HHL")
 class ofp_error_experimenter_msg(object):
     """Automatically generated Python class for ofp_error_experimenter_msg
 
@@ -804,6 +887,7 @@ class ofp_error_experimenter_msg(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'exp_type', 'experimenter')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -824,9 +908,15 @@ class ofp_error_experimenter_msg(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHL", self.type, self.exp_type, self.experimenter)
-        return packed
+        return _ofp_error_experimenter_msg_s0.pack(self.type, self.exp_type, self.experimenter)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_error_experimenter_msg_s0.pack_into(buffer, offset, self.type, self.exp_type, self.experimenter)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -835,12 +925,20 @@ class ofp_error_experimenter_msg(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.exp_type, self.experimenter) = struct.unpack(fmt,  binaryString[start:end])
+        (self.type, self.exp_type, self.experimenter) = _ofp_error_experimenter_msg_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.exp_type, self.experimenter) = _ofp_error_experimenter_msg_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -868,6 +966,7 @@ class ofp_error_experimenter_msg(object):
         return outstr
 
 
+_ofp_bucket_counter_s0 = struct.Struct("!QQ")
 class ofp_bucket_counter(object):
     """Automatically generated Python class for ofp_bucket_counter
 
@@ -876,6 +975,7 @@ class ofp_bucket_counter(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('packet_count', 'byte_count')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -895,9 +995,15 @@ class ofp_bucket_counter(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!QQ", self.packet_count, self.byte_count)
-        return packed
+        return _ofp_bucket_counter_s0.pack(self.packet_count, self.byte_count)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_bucket_counter_s0.pack_into(buffer, offset, self.packet_count, self.byte_count)
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -906,12 +1012,20 @@ class ofp_bucket_counter(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        fmt = '!QQ'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.packet_count, self.byte_count) = struct.unpack(fmt,  binaryString[start:end])
+        (self.packet_count, self.byte_count) = _ofp_bucket_counter_s0.unpack_from(binaryString, 0)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        (self.packet_count, self.byte_count) = _ofp_bucket_counter_s0.unpack_from(buffer, offset)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -937,6 +1051,7 @@ class ofp_bucket_counter(object):
         return outstr
 
 
+_ofp_port_stats_request_s0 = struct.Struct("!LBBBB")
 class ofp_port_stats_request(object):
     """Automatically generated Python class for ofp_port_stats_request
 
@@ -955,6 +1070,7 @@ class ofp_port_stats_request(object):
     def __assert(self):
         """Sanity check
         """
+
         if(not isinstance(self.pad, list)):
             return (False, "self.pad is not list as expected.")
         if(len(self.pad) != 4):
@@ -968,10 +1084,15 @@ class ofp_port_stats_request(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!L", self.port_no)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_port_stats_request_s0.pack(self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_port_stats_request_s0.pack_into(buffer, offset, self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -980,16 +1101,20 @@ class ofp_port_stats_request(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!L'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.port_no,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_port_stats_request_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_port_stats_request_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -1014,6 +1139,7 @@ class ofp_port_stats_request(object):
         return outstr
 
 
+_ofp_stats_request_s0 = struct.Struct("!HHBBBB")
 class ofp_stats_request(object):
     """Automatically generated Python class for ofp_stats_request
 
@@ -1022,6 +1148,7 @@ class ofp_stats_request(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'flags', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1033,7 +1160,6 @@ class ofp_stats_request(object):
     def __assert(self):
         """Sanity check
         """
-
         if(not isinstance(self.pad, list)):
             return (False, "self.pad is not list as expected.")
         if(len(self.pad) != 4):
@@ -1047,10 +1173,15 @@ class ofp_stats_request(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.flags)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_stats_request_s0.pack(self.type, self.flags, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_stats_request_s0.pack_into(buffer, offset, self.type, self.flags, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1059,16 +1190,20 @@ class ofp_stats_request(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.flags) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.flags, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_stats_request_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.flags, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_stats_request_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -1095,6 +1230,7 @@ class ofp_stats_request(object):
         return outstr
 
 
+_ofp_instruction_s0 = struct.Struct("!HHBBBB")
 class ofp_instruction(object):
     """Automatically generated Python class for ofp_instruction
 
@@ -1103,6 +1239,7 @@ class ofp_instruction(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1127,10 +1264,15 @@ class ofp_instruction(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.len)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_instruction_s0.pack(self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_instruction_s0.pack_into(buffer, offset, self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1139,16 +1281,20 @@ class ofp_instruction(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_instruction_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_instruction_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -1175,6 +1321,7 @@ class ofp_instruction(object):
         return outstr
 
 
+_ofp_group_stats_request_s0 = struct.Struct("!LBBBB")
 class ofp_group_stats_request(object):
     """Automatically generated Python class for ofp_group_stats_request
 
@@ -1206,10 +1353,15 @@ class ofp_group_stats_request(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!L", self.group_id)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_group_stats_request_s0.pack(self.group_id, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_group_stats_request_s0.pack_into(buffer, offset, self.group_id, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1218,16 +1370,20 @@ class ofp_group_stats_request(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!L'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.group_id,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.group_id, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_group_stats_request_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.group_id, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_group_stats_request_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -1252,6 +1408,7 @@ class ofp_group_stats_request(object):
         return outstr
 
 
+_ofp_experimenter_header_s0 = struct.Struct("!LL")
 class ofp_experimenter_header(object):
     """Automatically generated Python class for ofp_experimenter_header
 
@@ -1260,6 +1417,7 @@ class ofp_experimenter_header(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('experimenter', 'exp_type')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1279,9 +1437,15 @@ class ofp_experimenter_header(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LL", self.experimenter, self.exp_type)
-        return packed
+        return _ofp_experimenter_header_s0.pack(self.experimenter, self.exp_type)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_experimenter_header_s0.pack_into(buffer, offset, self.experimenter, self.exp_type)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1290,12 +1454,20 @@ class ofp_experimenter_header(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!LL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.experimenter, self.exp_type) = struct.unpack(fmt,  binaryString[start:end])
+        (self.experimenter, self.exp_type) = _ofp_experimenter_header_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.experimenter, self.exp_type) = _ofp_experimenter_header_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -1321,6 +1493,7 @@ class ofp_experimenter_header(object):
         return outstr
 
 
+_ofp_aggregate_stats_request_s0 = struct.Struct("!BBBBLLBBBBQQ")
 class ofp_aggregate_stats_request(object):
     """Automatically generated Python class for ofp_aggregate_stats_request
 
@@ -1364,14 +1537,16 @@ class ofp_aggregate_stats_request(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!B", self.table_id)
-        packed += struct.pack("!BBB", self.pad_asr[0], self.pad_asr[1], self.pad_asr[2])
-        packed += struct.pack("!LL", self.out_port, self.out_group)
-        packed += struct.pack("!BBBB", self.pad_asr2[0], self.pad_asr2[1], self.pad_asr2[2], self.pad_asr2[3])
-        packed += struct.pack("!QQ", self.cookie, self.cookie_mask)
-        packed += self.match.pack()
-        return packed
+        return _ofp_aggregate_stats_request_s0.pack(self.table_id, self.pad_asr[0], self.pad_asr[1], self.pad_asr[2], self.out_port, self.out_group, self.pad_asr2[0], self.pad_asr2[1], self.pad_asr2[2], self.pad_asr2[3], self.cookie, self.cookie_mask) + self.match.pack()
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_aggregate_stats_request_s0.pack_into(buffer, offset, self.table_id, self.pad_asr[0], self.pad_asr[1], self.pad_asr[2], self.out_port, self.out_group, self.pad_asr2[0], self.pad_asr2[1], self.pad_asr2[2], self.pad_asr2[3], self.cookie, self.cookie_mask)
+        self.match.pack_into(buffer, offset + 32)
+        return offset + 36
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1380,29 +1555,22 @@ class ofp_aggregate_stats_request(object):
         """
         if (len(binaryString) < 36):
             return binaryString
-        fmt = '!B'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.table_id,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBB'
-        start = 1
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad_asr[1], self.pad_asr[2]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!LL'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.out_port, self.out_group) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 12
-        end = start + struct.calcsize(fmt)
-        (self.pad2[0], self.pad_asr2[1], self.pad_asr2[2], self.pad_asr2[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!QQ'
-        start = 16
-        end = start + struct.calcsize(fmt)
-        (self.cookie, self.cookie_mask) = struct.unpack(fmt,  binaryString[start:end])
-        self.match.unpack(binaryString[32:])
+        (self.table_id, self.pad_asr[0], self.pad_asr[1], self.pad_asr[2], self.out_port, self.out_group, self.pad_asr2[0], self.pad_asr2[1], self.pad_asr2[2], self.pad_asr2[3], self.cookie, self.cookie_mask) = _ofp_aggregate_stats_request_s0.unpack_from(binaryString, 0)
+        self.match.unpack_from(binaryString, 32)
         return binaryString[36:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 36):
+            return offset
+        (self.table_id, self.pad_asr[0], self.pad_asr[1], self.pad_asr[2], self.out_port, self.out_group, self.pad_asr2[0], self.pad_asr2[1], self.pad_asr2[2], self.pad_asr2[3], self.cookie, self.cookie_mask) = _ofp_aggregate_stats_request_s0.unpack_from(buffer, offset)
+        self.match.unpack_from(buffer, offset + 32)
+        return offset + 36
+
     def __len__(self):
         """Return length of message
         """
@@ -1439,6 +1607,7 @@ class ofp_aggregate_stats_request(object):
         return outstr
 
 
+_ofp_queue_get_config_request_s0 = struct.Struct("!LBBBB")
 class ofp_queue_get_config_request(object):
     """Automatically generated Python class for ofp_queue_get_config_request
 
@@ -1447,6 +1616,7 @@ class ofp_queue_get_config_request(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('port', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1470,10 +1640,15 @@ class ofp_queue_get_config_request(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!L", self.port)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_queue_get_config_request_s0.pack(self.port, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_queue_get_config_request_s0.pack_into(buffer, offset, self.port, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1482,16 +1657,20 @@ class ofp_queue_get_config_request(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!L'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.port,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.port, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_queue_get_config_request_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.port, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_queue_get_config_request_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -1516,6 +1695,7 @@ class ofp_queue_get_config_request(object):
         return outstr
 
 
+_ofp_action_nw_ttl_s0 = struct.Struct("!HHBBBB")
 class ofp_action_nw_ttl(object):
     """Automatically generated Python class for ofp_action_nw_ttl
 
@@ -1524,6 +1704,7 @@ class ofp_action_nw_ttl(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'nw_ttl', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1549,10 +1730,15 @@ class ofp_action_nw_ttl(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHB", self.type, self.len, self.nw_ttl)
-        packed += struct.pack("!BBB", self.pad[0], self.pad[1], self.pad[2])
-        return packed
+        return _ofp_action_nw_ttl_s0.pack(self.type, self.len, self.nw_ttl, self.pad[0], self.pad[1], self.pad[2])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_nw_ttl_s0.pack_into(buffer, offset, self.type, self.len, self.nw_ttl, self.pad[0], self.pad[1], self.pad[2])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1561,16 +1747,20 @@ class ofp_action_nw_ttl(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHB'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.nw_ttl) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBB'
-        start = 5
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.nw_ttl, self.pad[0], self.pad[1], self.pad[2]) = _ofp_action_nw_ttl_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.nw_ttl, self.pad[0], self.pad[1], self.pad[2]) = _ofp_action_nw_ttl_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -1599,6 +1789,7 @@ class ofp_action_nw_ttl(object):
         return outstr
 
 
+_ofp_port_status_s0 = struct.Struct("!BBBBBBBB")
 class ofp_port_status(object):
     """Automatically generated Python class for ofp_port_status
 
@@ -1607,6 +1798,7 @@ class ofp_port_status(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('reason', 'pad', 'desc')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1633,11 +1825,16 @@ class ofp_port_status(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!B", self.reason)
-        packed += struct.pack("!BBBBBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6])
-        packed += self.desc.pack()
-        return packed
+        return _ofp_port_status_s0.pack(self.reason, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6]) + self.desc.pack()
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_port_status_s0.pack_into(buffer, offset, self.reason, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6])
+        self.desc.pack_into(buffer, offset + 8)
+        return offset + 72
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1646,17 +1843,22 @@ class ofp_port_status(object):
         """
         if (len(binaryString) < 72):
             return binaryString
-        fmt = '!B'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.reason,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBBBBB'
-        start = 1
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6]) = struct.unpack(fmt, binaryString[start:end])
-        self.desc.unpack(binaryString[8:])
+        (self.reason, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6]) = _ofp_port_status_s0.unpack_from(binaryString, 0)
+        self.desc.unpack_from(binaryString, 8)
         return binaryString[72:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 72):
+            return offset
+        (self.reason, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5], self.pad[6]) = _ofp_port_status_s0.unpack_from(buffer, offset)
+        self.desc.unpack_from(buffer, offset + 8)
+        return offset + 72
+
     def __len__(self):
         """Return length of message
         """
@@ -1684,6 +1886,7 @@ class ofp_port_status(object):
         return outstr
 
 
+_ofp_action_header_s0 = struct.Struct("!HHBBBB")
 class ofp_action_header(object):
     """Automatically generated Python class for ofp_action_header
 
@@ -1692,6 +1895,7 @@ class ofp_action_header(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1716,10 +1920,15 @@ class ofp_action_header(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.len)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_action_header_s0.pack(self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_header_s0.pack_into(buffer, offset, self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1728,16 +1937,20 @@ class ofp_action_header(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_action_header_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_action_header_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -1764,6 +1977,7 @@ class ofp_action_header(object):
         return outstr
 
 
+_ofp_port_mod_s0 = struct.Struct("!LBBBBBBBBBBBBLLLBBBB")
 class ofp_port_mod(object):
     """Automatically generated Python class for ofp_port_mod
 
@@ -1772,6 +1986,7 @@ class ofp_port_mod(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('port_no', 'pad', 'hw_addr', 'pad2', 'config', 'mask', 'advertise', 'pad3')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1813,14 +2028,15 @@ class ofp_port_mod(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!L", self.port_no)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        packed += struct.pack("!BBBBBB", self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5])
-        packed += struct.pack("!BB", self.pad2[0], self.pad2[1])
-        packed += struct.pack("!LLL", self.config, self.mask, self.advertise)
-        packed += struct.pack("!BBBB", self.pad3[0], self.pad3[1], self.pad3[2], self.pad3[3])
-        return packed
+        return _ofp_port_mod_s0.pack(self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5], self.pad2[0], self.pad2[1], self.config, self.mask, self.advertise, self.pad3[0], self.pad3[1], self.pad3[2], self.pad3[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_port_mod_s0.pack_into(buffer, offset, self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5], self.pad2[0], self.pad2[1], self.config, self.mask, self.advertise, self.pad3[0], self.pad3[1], self.pad3[2], self.pad3[3])
+        return offset + 32
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1829,32 +2045,20 @@ class ofp_port_mod(object):
         """
         if (len(binaryString) < 32):
             return binaryString
-        fmt = '!L'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.port_no,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBBBB'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BB'
-        start = 14
-        end = start + struct.calcsize(fmt)
-        (self.pad2[0], self.pad2[1]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!LLL'
-        start = 16
-        end = start + struct.calcsize(fmt)
-        (self.config, self.mask, self.advertise) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 28
-        end = start + struct.calcsize(fmt)
-        (self.pad3[0], self.pad3[1], self.pad3[2], self.pad3[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5], self.pad2[0], self.pad2[1], self.config, self.mask, self.advertise, self.pad3[0], self.pad3[1], self.pad3[2], self.pad3[3]) = _ofp_port_mod_s0.unpack_from(binaryString, 0)
         return binaryString[32:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 32):
+            return offset
+        (self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5], self.pad2[0], self.pad2[1], self.config, self.mask, self.advertise, self.pad3[0], self.pad3[1], self.pad3[2], self.pad3[3]) = _ofp_port_mod_s0.unpack_from(buffer, offset)
+        return offset + 32
+
     def __len__(self):
         """Return length of message
         """
@@ -1889,6 +2093,7 @@ class ofp_port_mod(object):
         return outstr
 
 
+_ofp_action_output_s0 = struct.Struct("!HHLHBBBBBB")
 class ofp_action_output(object):
     """Automatically generated Python class for ofp_action_output
 
@@ -1897,6 +2102,7 @@ class ofp_action_output(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'port', 'max_len', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -1923,10 +2129,15 @@ class ofp_action_output(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHLH", self.type, self.len, self.port, self.max_len)
-        packed += struct.pack("!BBBBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
-        return packed
+        return _ofp_action_output_s0.pack(self.type, self.len, self.port, self.max_len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_output_s0.pack_into(buffer, offset, self.type, self.len, self.port, self.max_len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -1935,16 +2146,20 @@ class ofp_action_output(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        fmt = '!HHLH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.port, self.max_len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBBBB'
-        start = 10
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.port, self.max_len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_action_output_s0.unpack_from(binaryString, 0)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        (self.type, self.len, self.port, self.max_len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_action_output_s0.unpack_from(buffer, offset)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -1975,6 +2190,7 @@ class ofp_action_output(object):
         return outstr
 
 
+_ofp_switch_config_s0 = struct.Struct("!HH")
 class ofp_switch_config(object):
     """Automatically generated Python class for ofp_switch_config
 
@@ -1983,6 +2199,7 @@ class ofp_switch_config(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('flags', 'miss_send_len')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2002,9 +2219,15 @@ class ofp_switch_config(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.flags, self.miss_send_len)
-        return packed
+        return _ofp_switch_config_s0.pack(self.flags, self.miss_send_len)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_switch_config_s0.pack_into(buffer, offset, self.flags, self.miss_send_len)
+        return offset + 4
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2013,12 +2236,20 @@ class ofp_switch_config(object):
         """
         if (len(binaryString) < 4):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.flags, self.miss_send_len) = struct.unpack(fmt,  binaryString[start:end])
+        (self.flags, self.miss_send_len) = _ofp_switch_config_s0.unpack_from(binaryString, 0)
         return binaryString[4:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 4):
+            return offset
+        (self.flags, self.miss_send_len) = _ofp_switch_config_s0.unpack_from(buffer, offset)
+        return offset + 4
+
     def __len__(self):
         """Return length of message
         """
@@ -2044,6 +2275,7 @@ class ofp_switch_config(object):
         return outstr
 
 
+_ofp_queue_prop_experimenter_s0 = struct.Struct("!LBBBB")
 class ofp_queue_prop_experimenter(object):
     """Automatically generated Python class for ofp_queue_prop_experimenter
 
@@ -2052,6 +2284,7 @@ class ofp_queue_prop_experimenter(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('prop_header', 'experimenter', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2078,11 +2311,16 @@ class ofp_queue_prop_experimenter(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += self.prop_header.pack()
-        packed += struct.pack("!L", self.experimenter)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return self.prop_header.pack() + _ofp_queue_prop_experimenter_s0.pack(self.experimenter, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        self.prop_header.pack_into(buffer, offset)
+        _ofp_queue_prop_experimenter_s0.pack_into(buffer, offset + 8, self.experimenter, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2091,17 +2329,22 @@ class ofp_queue_prop_experimenter(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        self.prop_header.unpack(binaryString[0:])
-        fmt = '!L'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.experimenter,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 12
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        self.prop_header.unpack_from(binaryString, 0)
+        (self.experimenter, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_queue_prop_experimenter_s0.unpack_from(binaryString, 8)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        self.prop_header.unpack_from(buffer, offset)
+        (self.experimenter, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_queue_prop_experimenter_s0.unpack_from(buffer, offset + 8)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -2129,6 +2372,7 @@ class ofp_queue_prop_experimenter(object):
         return outstr
 
 
+_ofp_instruction_write_metadata_s0 = struct.Struct("!HHBBBBQQ")
 class ofp_instruction_write_metadata(object):
     """Automatically generated Python class for ofp_instruction_write_metadata
 
@@ -2137,6 +2381,7 @@ class ofp_instruction_write_metadata(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'pad', 'metadata', 'metadata_mask')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2163,11 +2408,15 @@ class ofp_instruction_write_metadata(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.len)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        packed += struct.pack("!QQ", self.metadata, self.metadata_mask)
-        return packed
+        return _ofp_instruction_write_metadata_s0.pack(self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.metadata, self.metadata_mask)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_instruction_write_metadata_s0.pack_into(buffer, offset, self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.metadata, self.metadata_mask)
+        return offset + 24
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2176,20 +2425,20 @@ class ofp_instruction_write_metadata(object):
         """
         if (len(binaryString) < 24):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!QQ'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.metadata, self.metadata_mask) = struct.unpack(fmt,  binaryString[start:end])
+        (self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.metadata, self.metadata_mask) = _ofp_instruction_write_metadata_s0.unpack_from(binaryString, 0)
         return binaryString[24:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 24):
+            return offset
+        (self.type, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.metadata, self.metadata_mask) = _ofp_instruction_write_metadata_s0.unpack_from(buffer, offset)
+        return offset + 24
+
     def __len__(self):
         """Return length of message
         """
@@ -2220,6 +2469,7 @@ class ofp_instruction_write_metadata(object):
         return outstr
 
 
+_ofp_action_experimenter_header_s0 = struct.Struct("!HHL")
 class ofp_action_experimenter_header(object):
     """Automatically generated Python class for ofp_action_experimenter_header
 
@@ -2228,6 +2478,7 @@ class ofp_action_experimenter_header(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'experimenter')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2248,9 +2499,15 @@ class ofp_action_experimenter_header(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHL", self.type, self.len, self.experimenter)
-        return packed
+        return _ofp_action_experimenter_header_s0.pack(self.type, self.len, self.experimenter)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_experimenter_header_s0.pack_into(buffer, offset, self.type, self.len, self.experimenter)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2259,12 +2516,20 @@ class ofp_action_experimenter_header(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.experimenter) = struct.unpack(fmt,  binaryString[start:end])
+        (self.type, self.len, self.experimenter) = _ofp_action_experimenter_header_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.experimenter) = _ofp_action_experimenter_header_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -2292,6 +2557,7 @@ class ofp_action_experimenter_header(object):
         return outstr
 
 
+_ofp_queue_get_config_reply_s0 = struct.Struct("!LBBBB")
 class ofp_queue_get_config_reply(object):
     """Automatically generated Python class for ofp_queue_get_config_reply
 
@@ -2300,6 +2566,7 @@ class ofp_queue_get_config_reply(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('port', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2323,10 +2590,15 @@ class ofp_queue_get_config_reply(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!L", self.port)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_queue_get_config_reply_s0.pack(self.port, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_queue_get_config_reply_s0.pack_into(buffer, offset, self.port, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2335,16 +2607,20 @@ class ofp_queue_get_config_reply(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!L'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.port,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.port, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_queue_get_config_reply_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.port, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_queue_get_config_reply_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -2369,6 +2645,7 @@ class ofp_queue_get_config_reply(object):
         return outstr
 
 
+_ofp_oxm_experimenter_header_s0 = struct.Struct("!LL")
 class ofp_oxm_experimenter_header(object):
     """Automatically generated Python class for ofp_oxm_experimenter_header
 
@@ -2377,6 +2654,7 @@ class ofp_oxm_experimenter_header(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('oxm_header', 'experimenter')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2396,9 +2674,15 @@ class ofp_oxm_experimenter_header(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LL", self.oxm_header, self.experimenter)
-        return packed
+        return _ofp_oxm_experimenter_header_s0.pack(self.oxm_header, self.experimenter)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_oxm_experimenter_header_s0.pack_into(buffer, offset, self.oxm_header, self.experimenter)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2407,12 +2691,20 @@ class ofp_oxm_experimenter_header(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!LL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.oxm_header, self.experimenter) = struct.unpack(fmt,  binaryString[start:end])
+        (self.oxm_header, self.experimenter) = _ofp_oxm_experimenter_header_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.oxm_header, self.experimenter) = _ofp_oxm_experimenter_header_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -2438,6 +2730,7 @@ class ofp_oxm_experimenter_header(object):
         return outstr
 
 
+_ofp_action_set_queue_s0 = struct.Struct("!HHL")
 class ofp_action_set_queue(object):
     """Automatically generated Python class for ofp_action_set_queue
 
@@ -2446,6 +2739,7 @@ class ofp_action_set_queue(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'queue_id')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2466,9 +2760,15 @@ class ofp_action_set_queue(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHL", self.type, self.len, self.queue_id)
-        return packed
+        return _ofp_action_set_queue_s0.pack(self.type, self.len, self.queue_id)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_set_queue_s0.pack_into(buffer, offset, self.type, self.len, self.queue_id)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2477,12 +2777,20 @@ class ofp_action_set_queue(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.queue_id) = struct.unpack(fmt,  binaryString[start:end])
+        (self.type, self.len, self.queue_id) = _ofp_action_set_queue_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.queue_id) = _ofp_action_set_queue_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -2510,6 +2818,7 @@ class ofp_action_set_queue(object):
         return outstr
 
 
+_ofp_action_set_field_s0 = struct.Struct("!HHBBBB")
 class ofp_action_set_field(object):
     """Automatically generated Python class for ofp_action_set_field
 
@@ -2518,6 +2827,7 @@ class ofp_action_set_field(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'field')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2542,10 +2852,15 @@ class ofp_action_set_field(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.len)
-        packed += struct.pack("!BBBB", self.field[0], self.field[1], self.field[2], self.field[3])
-        return packed
+        return _ofp_action_set_field_s0.pack(self.type, self.len, self.field[0], self.field[1], self.field[2], self.field[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_set_field_s0.pack_into(buffer, offset, self.type, self.len, self.field[0], self.field[1], self.field[2], self.field[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2554,16 +2869,20 @@ class ofp_action_set_field(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.field[0], self.field[1], self.field[2], self.field[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.field[0], self.field[1], self.field[2], self.field[3]) = _ofp_action_set_field_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.field[0], self.field[1], self.field[2], self.field[3]) = _ofp_action_set_field_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -2591,6 +2910,7 @@ class ofp_action_set_field(object):
         return outstr
 
 
+_ofp_flow_stats_s0 = struct.Struct("!HBBLLHHHBBBBBBQQQ")
 class ofp_flow_stats(object):
     """Automatically generated Python class for ofp_flow_stats
 
@@ -2599,6 +2919,7 @@ class ofp_flow_stats(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('length', 'table_id', 'pad', 'duration_sec', 'duration_nsec', 'priority', 'idle_timeout', 'hard_timeout', 'pad2', 'cookie', 'packet_count', 'byte_count', 'match')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2635,12 +2956,16 @@ class ofp_flow_stats(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HBBLLHHH", self.length, self.table_id, self.pad, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout)
-        packed += struct.pack("!BBBBBB", self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.pad2[4], self.pad2[5])
-        packed += struct.pack("!QQQ", self.cookie, self.packet_count, self.byte_count)
-        packed += self.match.pack()
-        return packed
+        return _ofp_flow_stats_s0.pack(self.length, self.table_id, self.pad, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.pad2[4], self.pad2[5], self.cookie, self.packet_count, self.byte_count) + self.match.pack()
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_flow_stats_s0.pack_into(buffer, offset, self.length, self.table_id, self.pad, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.pad2[4], self.pad2[5], self.cookie, self.packet_count, self.byte_count)
+        self.match.pack_into(buffer, offset + 48)
+        return offset + 52
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2649,21 +2974,22 @@ class ofp_flow_stats(object):
         """
         if (len(binaryString) < 52):
             return binaryString
-        fmt = '!HBBLLHHH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.length, self.table_id, self.pad, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBBBB'
-        start = 18
-        end = start + struct.calcsize(fmt)
-        (self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.pad2[4], self.pad2[5]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!QQQ'
-        start = 24
-        end = start + struct.calcsize(fmt)
-        (self.cookie, self.packet_count, self.byte_count) = struct.unpack(fmt,  binaryString[start:end])
-        self.match.unpack(binaryString[48:])
+        (self.length, self.table_id, self.pad, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.pad2[4], self.pad2[5], self.cookie, self.packet_count, self.byte_count) = _ofp_flow_stats_s0.unpack_from(binaryString, 0)
+        self.match.unpack_from(binaryString, 48)
         return binaryString[52:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 52):
+            return offset
+        (self.length, self.table_id, self.pad, self.duration_sec, self.duration_nsec, self.priority, self.idle_timeout, self.hard_timeout, self.pad2[0], self.pad2[1], self.pad2[2], self.pad2[3], self.pad2[4], self.pad2[5], self.cookie, self.packet_count, self.byte_count) = _ofp_flow_stats_s0.unpack_from(buffer, offset)
+        self.match.unpack_from(buffer, offset + 48)
+        return offset + 52
+
     def __len__(self):
         """Return length of message
         """
@@ -2710,6 +3036,7 @@ class ofp_flow_stats(object):
         return outstr
 
 
+_ofp_flow_removed_s0 = struct.Struct("!QHBBLLHHQQ")
 class ofp_flow_removed(object):
     """Automatically generated Python class for ofp_flow_removed
 
@@ -2718,6 +3045,7 @@ class ofp_flow_removed(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('cookie', 'priority', 'reason', 'table_id', 'duration_sec', 'duration_nsec', 'idle_timeout', 'hard_timeout', 'packet_count', 'byte_count', 'match')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2748,10 +3076,16 @@ class ofp_flow_removed(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!QHBBLLHHQQ", self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count)
-        packed += self.match.pack()
-        return packed
+        return _ofp_flow_removed_s0.pack(self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count) + self.match.pack()
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_flow_removed_s0.pack_into(buffer, offset, self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count)
+        self.match.pack_into(buffer, offset + 40)
+        return offset + 44
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2760,13 +3094,22 @@ class ofp_flow_removed(object):
         """
         if (len(binaryString) < 44):
             return binaryString
-        fmt = '!QHBBLLHHQQ'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count) = struct.unpack(fmt,  binaryString[start:end])
-        self.match.unpack(binaryString[40:])
+        (self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count) = _ofp_flow_removed_s0.unpack_from(binaryString, 0)
+        self.match.unpack_from(binaryString, 40)
         return binaryString[44:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 44):
+            return offset
+        (self.cookie, self.priority, self.reason, self.table_id, self.duration_sec, self.duration_nsec, self.idle_timeout, self.hard_timeout, self.packet_count, self.byte_count) = _ofp_flow_removed_s0.unpack_from(buffer, offset)
+        self.match.unpack_from(buffer, offset + 40)
+        return offset + 44
+
     def __len__(self):
         """Return length of message
         """
@@ -2811,6 +3154,7 @@ class ofp_flow_removed(object):
         return outstr
 
 
+_ofp_queue_prop_min_rate_s0 = struct.Struct("!HBBBBBB")
 class ofp_queue_prop_min_rate(object):
     """Automatically generated Python class for ofp_queue_prop_min_rate
 
@@ -2819,6 +3163,7 @@ class ofp_queue_prop_min_rate(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('prop_header', 'rate', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2845,11 +3190,16 @@ class ofp_queue_prop_min_rate(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += self.prop_header.pack()
-        packed += struct.pack("!H", self.rate)
-        packed += struct.pack("!BBBBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
-        return packed
+        return self.prop_header.pack() + _ofp_queue_prop_min_rate_s0.pack(self.rate, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        self.prop_header.pack_into(buffer, offset)
+        _ofp_queue_prop_min_rate_s0.pack_into(buffer, offset + 8, self.rate, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2858,17 +3208,22 @@ class ofp_queue_prop_min_rate(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        self.prop_header.unpack(binaryString[0:])
-        fmt = '!H'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.rate,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBBBB'
-        start = 10
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = struct.unpack(fmt, binaryString[start:end])
+        self.prop_header.unpack_from(binaryString, 0)
+        (self.rate, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_queue_prop_min_rate_s0.unpack_from(binaryString, 8)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        self.prop_header.unpack_from(buffer, offset)
+        (self.rate, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_queue_prop_min_rate_s0.unpack_from(buffer, offset + 8)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -2896,6 +3251,7 @@ class ofp_queue_prop_min_rate(object):
         return outstr
 
 
+_ofp_header_s0 = struct.Struct("!BBHL")
 class ofp_header(object):
     """Automatically generated Python class for ofp_header
 
@@ -2904,6 +3260,7 @@ class ofp_header(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('version', 'type', 'length', 'xid')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -2927,9 +3284,15 @@ class ofp_header(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!BBHL", self.version, self.type, self.length, self.xid)
-        return packed
+        return _ofp_header_s0.pack(self.version, self.type, self.length, self.xid)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_header_s0.pack_into(buffer, offset, self.version, self.type, self.length, self.xid)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -2938,12 +3301,20 @@ class ofp_header(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!BBHL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.version, self.type, self.length, self.xid) = struct.unpack(fmt,  binaryString[start:end])
+        (self.version, self.type, self.length, self.xid) = _ofp_header_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.version, self.type, self.length, self.xid) = _ofp_header_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -2973,6 +3344,7 @@ class ofp_header(object):
         return outstr
 
 
+_ofp_stats_reply_s0 = struct.Struct("!HHBBBB")
 class ofp_stats_reply(object):
     """Automatically generated Python class for ofp_stats_reply
 
@@ -2981,6 +3353,7 @@ class ofp_stats_reply(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'flags', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3005,10 +3378,15 @@ class ofp_stats_reply(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.flags)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_stats_reply_s0.pack(self.type, self.flags, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_stats_reply_s0.pack_into(buffer, offset, self.type, self.flags, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3017,16 +3395,20 @@ class ofp_stats_reply(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.flags) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.flags, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_stats_reply_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.flags, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_stats_reply_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -3053,6 +3435,7 @@ class ofp_stats_reply(object):
         return outstr
 
 
+_ofp_queue_stats_request_s0 = struct.Struct("!LL")
 class ofp_queue_stats_request(object):
     """Automatically generated Python class for ofp_queue_stats_request
 
@@ -3080,9 +3463,15 @@ class ofp_queue_stats_request(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LL", self.port_no, self.queue_id)
-        return packed
+        return _ofp_queue_stats_request_s0.pack(self.port_no, self.queue_id)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_queue_stats_request_s0.pack_into(buffer, offset, self.port_no, self.queue_id)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3091,12 +3480,20 @@ class ofp_queue_stats_request(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!LL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.port_no, self.queue_id) = struct.unpack(fmt,  binaryString[start:end])
+        (self.port_no, self.queue_id) = _ofp_queue_stats_request_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.port_no, self.queue_id) = _ofp_queue_stats_request_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -3122,6 +3519,7 @@ class ofp_queue_stats_request(object):
         return outstr
 
 
+_ofp_group_features_stats_s0 = struct.Struct("!LLLLLLLLLL")
 class ofp_group_features_stats(object):
     """Automatically generated Python class for ofp_group_features_stats
 
@@ -3130,6 +3528,7 @@ class ofp_group_features_stats(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('types', 'capabilities', 'max_groups', 'actions')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3159,11 +3558,15 @@ class ofp_group_features_stats(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LL", self.types, self.capabilities)
-        packed += struct.pack("!LLLL", self.max_groups[0], self.max_groups[1], self.max_groups[2], self.max_groups[3])
-        packed += struct.pack("!LLLL", self.actions[0], self.actions[1], self.actions[2], self.actions[3])
-        return packed
+        return _ofp_group_features_stats_s0.pack(self.types, self.capabilities, self.max_groups[0], self.max_groups[1], self.max_groups[2], self.max_groups[3], self.actions[0], self.actions[1], self.actions[2], self.actions[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_group_features_stats_s0.pack_into(buffer, offset, self.types, self.capabilities, self.max_groups[0], self.max_groups[1], self.max_groups[2], self.max_groups[3], self.actions[0], self.actions[1], self.actions[2], self.actions[3])
+        return offset + 40
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3172,20 +3575,20 @@ class ofp_group_features_stats(object):
         """
         if (len(binaryString) < 40):
             return binaryString
-        fmt = '!LL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.types, self.capabilities) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!LLLL'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.max_groups[0], self.max_groups[1], self.max_groups[2], self.max_groups[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!LLLL'
-        start = 24
-        end = start + struct.calcsize(fmt)
-        (self.actions[0], self.actions[1], self.actions[2], self.actions[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.types, self.capabilities, self.max_groups[0], self.max_groups[1], self.max_groups[2], self.max_groups[3], self.actions[0], self.actions[1], self.actions[2], self.actions[3]) = _ofp_group_features_stats_s0.unpack_from(binaryString, 0)
         return binaryString[40:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 40):
+            return offset
+        (self.types, self.capabilities, self.max_groups[0], self.max_groups[1], self.max_groups[2], self.max_groups[3], self.actions[0], self.actions[1], self.actions[2], self.actions[3]) = _ofp_group_features_stats_s0.unpack_from(buffer, offset)
+        return offset + 40
+
     def __len__(self):
         """Return length of message
         """
@@ -3215,6 +3618,7 @@ class ofp_group_features_stats(object):
         return outstr
 
 
+_ofp_group_mod_s0 = struct.Struct("!HBBL")
 class ofp_group_mod(object):
     """Automatically generated Python class for ofp_group_mod
 
@@ -3223,6 +3627,7 @@ class ofp_group_mod(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('command', 'type', 'pad', 'group_id')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3244,9 +3649,15 @@ class ofp_group_mod(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HBBL", self.command, self.type, self.pad, self.group_id)
-        return packed
+        return _ofp_group_mod_s0.pack(self.command, self.type, self.pad, self.group_id)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_group_mod_s0.pack_into(buffer, offset, self.command, self.type, self.pad, self.group_id)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3255,12 +3666,20 @@ class ofp_group_mod(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HBBL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.command, self.type, self.pad, self.group_id) = struct.unpack(fmt,  binaryString[start:end])
+        (self.command, self.type, self.pad, self.group_id) = _ofp_group_mod_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.command, self.type, self.pad, self.group_id) = _ofp_group_mod_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -3289,6 +3708,7 @@ class ofp_group_mod(object):
         return outstr
 
 
+_ofp_port_stats_s0 = struct.Struct("!LBBBBQQQQQQQQQQQQ")
 class ofp_port_stats(object):
     """Automatically generated Python class for ofp_port_stats
 
@@ -3297,6 +3717,7 @@ class ofp_port_stats(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('port_no', 'pad', 'rx_packets', 'tx_packets', 'rx_bytes', 'tx_bytes', 'rx_dropped', 'tx_dropped', 'rx_errors', 'tx_errors', 'rx_frame_err', 'rx_over_err', 'rx_crc_err', 'collisions')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3332,11 +3753,15 @@ class ofp_port_stats(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!L", self.port_no)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        packed += struct.pack("!QQQQQQQQQQQQ", self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions)
-        return packed
+        return _ofp_port_stats_s0.pack(self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_port_stats_s0.pack_into(buffer, offset, self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions)
+        return offset + 104
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3345,20 +3770,20 @@ class ofp_port_stats(object):
         """
         if (len(binaryString) < 104):
             return binaryString
-        fmt = '!L'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.port_no,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!QQQQQQQQQQQQ'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions) = struct.unpack(fmt,  binaryString[start:end])
+        (self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions) = _ofp_port_stats_s0.unpack_from(binaryString, 0)
         return binaryString[104:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 104):
+            return offset
+        (self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.rx_packets, self.tx_packets, self.rx_bytes, self.tx_bytes, self.rx_dropped, self.tx_dropped, self.rx_errors, self.tx_errors, self.rx_frame_err, self.rx_over_err, self.rx_crc_err, self.collisions) = _ofp_port_stats_s0.unpack_from(buffer, offset)
+        return offset + 104
+
     def __len__(self):
         """Return length of message
         """
@@ -3407,6 +3832,7 @@ class ofp_port_stats(object):
         return outstr
 
 
+_ofp_packet_queue_s0 = struct.Struct("!LLHBBBBBB")
 class ofp_packet_queue(object):
     """Automatically generated Python class for ofp_packet_queue
 
@@ -3415,6 +3841,7 @@ class ofp_packet_queue(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('queue_id', 'port', 'len', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3440,10 +3867,15 @@ class ofp_packet_queue(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LLH", self.queue_id, self.port, self.len)
-        packed += struct.pack("!BBBBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
-        return packed
+        return _ofp_packet_queue_s0.pack(self.queue_id, self.port, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_packet_queue_s0.pack_into(buffer, offset, self.queue_id, self.port, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3452,16 +3884,20 @@ class ofp_packet_queue(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        fmt = '!LLH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.queue_id, self.port, self.len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBBBB'
-        start = 10
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = struct.unpack(fmt, binaryString[start:end])
+        (self.queue_id, self.port, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_packet_queue_s0.unpack_from(binaryString, 0)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        (self.queue_id, self.port, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_packet_queue_s0.unpack_from(buffer, offset)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -3490,6 +3926,7 @@ class ofp_packet_queue(object):
         return outstr
 
 
+_ofp_port_s0 = struct.Struct("!LBBBBBBBBBBBB16sLLLLLLLL")
 class ofp_port(object):
     """Automatically generated Python class for ofp_port
 
@@ -3498,6 +3935,7 @@ class ofp_port(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('port_no', 'pad', 'hw_addr', 'pad2', 'name', 'config', 'state', 'curr', 'advertised', 'supported', 'peer', 'curr_speed', 'max_speed')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3544,14 +3982,15 @@ class ofp_port(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!L", self.port_no)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        packed += struct.pack("!BBBBBB", self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5])
-        packed += struct.pack("!BB", self.pad2[0], self.pad2[1])
-        packed += self.name.ljust(16,'\0')
-        packed += struct.pack("!LLLLLLLL", self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed)
-        return packed
+        return _ofp_port_s0.pack(self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5], self.pad2[0], self.pad2[1], self.name, self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_port_s0.pack_into(buffer, offset, self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5], self.pad2[0], self.pad2[1], self.name, self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed)
+        return offset + 64
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3560,29 +3999,22 @@ class ofp_port(object):
         """
         if (len(binaryString) < 64):
             return binaryString
-        fmt = '!L'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.port_no,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBBBB'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BB'
-        start = 14
-        end = start + struct.calcsize(fmt)
-        (self.pad2[0], self.pad2[1]) = struct.unpack(fmt, binaryString[start:end])
-        self.name = binaryString[16:32].replace("\0","")
-        fmt = '!LLLLLLLL'
-        start = 32
-        end = start + struct.calcsize(fmt)
-        (self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed) = struct.unpack(fmt,  binaryString[start:end])
+        (self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5], self.pad2[0], self.pad2[1], self.name, self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed) = _ofp_port_s0.unpack_from(binaryString, 0)
+        self.name = self.name.replace("\0","")
         return binaryString[64:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 64):
+            return offset
+        (self.port_no, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.hw_addr[0], self.hw_addr[1], self.hw_addr[2], self.hw_addr[3], self.hw_addr[4], self.hw_addr[5], self.pad2[0], self.pad2[1], self.name, self.config, self.state, self.curr, self.advertised, self.supported, self.peer, self.curr_speed, self.max_speed) = _ofp_port_s0.unpack_from(buffer, offset)
+        self.name = self.name.replace("\0","")
+        return offset + 64
+
     def __len__(self):
         """Return length of message
         """
@@ -3628,6 +4060,7 @@ class ofp_port(object):
         return outstr
 
 
+_ofp_switch_features_s0 = struct.Struct("!QLBBBBLL")
 class ofp_switch_features(object):
     """Automatically generated Python class for ofp_switch_features
 
@@ -3636,6 +4069,7 @@ class ofp_switch_features(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('datapath_id', 'n_buffers', 'n_tables', 'pad', 'capabilities', 'reserved')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3663,11 +4097,15 @@ class ofp_switch_features(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!QLB", self.datapath_id, self.n_buffers, self.n_tables)
-        packed += struct.pack("!BBB", self.pad[0], self.pad[1], self.pad[2])
-        packed += struct.pack("!LL", self.capabilities, self.reserved)
-        return packed
+        return _ofp_switch_features_s0.pack(self.datapath_id, self.n_buffers, self.n_tables, self.pad[0], self.pad[1], self.pad[2], self.capabilities, self.reserved)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_switch_features_s0.pack_into(buffer, offset, self.datapath_id, self.n_buffers, self.n_tables, self.pad[0], self.pad[1], self.pad[2], self.capabilities, self.reserved)
+        return offset + 24
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3676,20 +4114,20 @@ class ofp_switch_features(object):
         """
         if (len(binaryString) < 24):
             return binaryString
-        fmt = '!QLB'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.datapath_id, self.n_buffers, self.n_tables) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBB'
-        start = 13
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!LL'
-        start = 16
-        end = start + struct.calcsize(fmt)
-        (self.capabilities, self.reserved) = struct.unpack(fmt,  binaryString[start:end])
+        (self.datapath_id, self.n_buffers, self.n_tables, self.pad[0], self.pad[1], self.pad[2], self.capabilities, self.reserved) = _ofp_switch_features_s0.unpack_from(binaryString, 0)
         return binaryString[24:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 24):
+            return offset
+        (self.datapath_id, self.n_buffers, self.n_tables, self.pad[0], self.pad[1], self.pad[2], self.capabilities, self.reserved) = _ofp_switch_features_s0.unpack_from(buffer, offset)
+        return offset + 24
+
     def __len__(self):
         """Return length of message
         """
@@ -3722,6 +4160,7 @@ class ofp_switch_features(object):
         return outstr
 
 
+_ofp_queue_prop_header_s0 = struct.Struct("!HHBBBB")
 class ofp_queue_prop_header(object):
     """Automatically generated Python class for ofp_queue_prop_header
 
@@ -3730,6 +4169,7 @@ class ofp_queue_prop_header(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('property', 'len', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3754,10 +4194,15 @@ class ofp_queue_prop_header(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.property, self.len)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_queue_prop_header_s0.pack(self.property, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_queue_prop_header_s0.pack_into(buffer, offset, self.property, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3766,16 +4211,20 @@ class ofp_queue_prop_header(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.property, self.len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.property, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_queue_prop_header_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.property, self.len, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_queue_prop_header_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -3802,6 +4251,7 @@ class ofp_queue_prop_header(object):
         return outstr
 
 
+_ofp_flow_stats_request_s0 = struct.Struct("!BBBBLLBBBBQQ")
 class ofp_flow_stats_request(object):
     """Automatically generated Python class for ofp_flow_stats_request
 
@@ -3845,14 +4295,16 @@ class ofp_flow_stats_request(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!B", self.table_id)
-        packed += struct.pack("!BBB", self.pad_fstat[0], self.pad_fstat[1], self.pad_fstat[2])
-        packed += struct.pack("!LL", self.out_port, self.out_group)
-        packed += struct.pack("!BBBB", self.pad_fstat2[0], self.pad_fstat2[1], self.pad_fstat2[2], self.pad_fstat2[3])
-        packed += struct.pack("!QQ", self.cookie, self.cookie_mask)
-        packed += self.match.pack()
-        return packed
+        return _ofp_flow_stats_request_s0.pack(self.table_id, self.pad_fstat[0], self.pad_fstat[1], self.pad_fstat[2], self.out_port, self.out_group, self.pad_fstat2[0], self.pad_fstat2[1], self.pad_fstat2[2], self.pad_fstat2[3], self.cookie, self.cookie_mask) + self.match.pack()
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_flow_stats_request_s0.pack_into(buffer, offset, self.table_id, self.pad_fstat[0], self.pad_fstat[1], self.pad_fstat[2], self.out_port, self.out_group, self.pad_fstat2[0], self.pad_fstat2[1], self.pad_fstat2[2], self.pad_fstat2[3], self.cookie, self.cookie_mask)
+        self.match.pack_into(buffer, offset + 32)
+        return offset + 36
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3861,29 +4313,22 @@ class ofp_flow_stats_request(object):
         """
         if (len(binaryString) < 36):
             return binaryString
-        fmt = '!B'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.table_id,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBB'
-        start = 1
-        end = start + struct.calcsize(fmt)
-        (self.pad_fstat[0], self.pad_fstat[1], self.pad_fstat[2]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!LL'
-        start = 4
-        end = start + struct.calcsize(fmt)
-        (self.out_port, self.out_group) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 12
-        end = start + struct.calcsize(fmt)
-        (self.pad_fstat2[0], self.pad_fstat2[1], self.pad_fstat2[2], self.pad_fstat2[3]) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!QQ'
-        start = 16
-        end = start + struct.calcsize(fmt)
-        (self.cookie, self.cookie_mask) = struct.unpack(fmt,  binaryString[start:end])
-        self.match.unpack(binaryString[32:])
+        (self.table_id, self.pad_fstat[0], self.pad_fstat[1], self.pad_fstat[2], self.out_port, self.out_group, self.pad_fstat2[0], self.pad_fstat2[1], self.pad_fstat2[2], self.pad_fstat2[3], self.cookie, self.cookie_mask) = _ofp_flow_stats_request_s0.unpack_from(binaryString, 0)
+        self.match.unpack_from(binaryString, 32)
         return binaryString[36:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 36):
+            return offset
+        (self.table_id, self.pad_fstat[0], self.pad_fstat[1], self.pad_fstat[2], self.out_port, self.out_group, self.pad_fstat2[0], self.pad_fstat2[1], self.pad_fstat2[2], self.pad_fstat2[3], self.cookie, self.cookie_mask) = _ofp_flow_stats_request_s0.unpack_from(buffer, offset)
+        self.match.unpack_from(buffer, offset + 32)
+        return offset + 36
+
     def __len__(self):
         """Return length of message
         """
@@ -3920,6 +4365,7 @@ class ofp_flow_stats_request(object):
         return outstr
 
 
+_ofp_bucket_s0 = struct.Struct("!HHLLBBBB")
 class ofp_bucket(object):
     """Automatically generated Python class for ofp_bucket
 
@@ -3928,6 +4374,7 @@ class ofp_bucket(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('len', 'weight', 'watch_port', 'watch_group', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -3954,10 +4401,15 @@ class ofp_bucket(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHLL", self.len, self.weight, self.watch_port, self.watch_group)
-        packed += struct.pack("!BBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3])
-        return packed
+        return _ofp_bucket_s0.pack(self.len, self.weight, self.watch_port, self.watch_group, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_bucket_s0.pack_into(buffer, offset, self.len, self.weight, self.watch_port, self.watch_group, self.pad[0], self.pad[1], self.pad[2], self.pad[3])
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -3966,16 +4418,20 @@ class ofp_bucket(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        fmt = '!HHLL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.len, self.weight, self.watch_port, self.watch_group) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBB'
-        start = 12
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = struct.unpack(fmt, binaryString[start:end])
+        (self.len, self.weight, self.watch_port, self.watch_group, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_bucket_s0.unpack_from(binaryString, 0)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        (self.len, self.weight, self.watch_port, self.watch_group, self.pad[0], self.pad[1], self.pad[2], self.pad[3]) = _ofp_bucket_s0.unpack_from(buffer, offset)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -4006,6 +4462,7 @@ class ofp_bucket(object):
         return outstr
 
 
+_ofp_action_pop_mpls_s0 = struct.Struct("!HHHBB")
 class ofp_action_pop_mpls(object):
     """Automatically generated Python class for ofp_action_pop_mpls
 
@@ -4014,6 +4471,7 @@ class ofp_action_pop_mpls(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'ethertype', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4039,10 +4497,15 @@ class ofp_action_pop_mpls(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHH", self.type, self.len, self.ethertype)
-        packed += struct.pack("!BB", self.pad[0], self.pad[1])
-        return packed
+        return _ofp_action_pop_mpls_s0.pack(self.type, self.len, self.ethertype, self.pad[0], self.pad[1])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_pop_mpls_s0.pack_into(buffer, offset, self.type, self.len, self.ethertype, self.pad[0], self.pad[1])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4051,16 +4514,20 @@ class ofp_action_pop_mpls(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.ethertype) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BB'
-        start = 6
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.ethertype, self.pad[0], self.pad[1]) = _ofp_action_pop_mpls_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.ethertype, self.pad[0], self.pad[1]) = _ofp_action_pop_mpls_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -4089,6 +4556,7 @@ class ofp_action_pop_mpls(object):
         return outstr
 
 
+_ofp_match_s0 = struct.Struct("!HH")
 class ofp_match(object):
     """Automatically generated Python class for ofp_match
 
@@ -4097,6 +4565,7 @@ class ofp_match(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'length')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4117,9 +4586,15 @@ class ofp_match(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.length)
-        return packed
+        return _ofp_match_s0.pack(self.type, self.length)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_match_s0.pack_into(buffer, offset, self.type, self.length)
+        return offset + 4
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4128,12 +4603,20 @@ class ofp_match(object):
         """
         if (len(binaryString) < 4):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.length) = struct.unpack(fmt,  binaryString[start:end])
+        (self.type, self.length) = _ofp_match_s0.unpack_from(binaryString, 0)
         return binaryString[4:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 4):
+            return offset
+        (self.type, self.length) = _ofp_match_s0.unpack_from(buffer, offset)
+        return offset + 4
+
     def __len__(self):
         """Return length of message
         """
@@ -4159,6 +4642,7 @@ class ofp_match(object):
         return outstr
 
 
+_ofp_flow_mod_s0 = struct.Struct("!QQBBHHHLLLHBB")
 class ofp_flow_mod(object):
     """Automatically generated Python class for ofp_flow_mod
 
@@ -4167,6 +4651,7 @@ class ofp_flow_mod(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('cookie', 'cookie_mask', 'table_id', 'command', 'idle_timeout', 'hard_timeout', 'priority', 'buffer_id', 'out_port', 'out_group', 'flags', 'pad', 'match')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4203,11 +4688,16 @@ class ofp_flow_mod(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!QQBBHHHLLLH", self.cookie, self.cookie_mask, self.table_id, self.command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags)
-        packed += struct.pack("!BB", self.pad[0], self.pad[1])
-        packed += self.match.pack()
-        return packed
+        return _ofp_flow_mod_s0.pack(self.cookie, self.cookie_mask, self.table_id, self.command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.pad[0], self.pad[1]) + self.match.pack()
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_flow_mod_s0.pack_into(buffer, offset, self.cookie, self.cookie_mask, self.table_id, self.command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.pad[0], self.pad[1])
+        self.match.pack_into(buffer, offset + 40)
+        return offset + 44
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4216,17 +4706,22 @@ class ofp_flow_mod(object):
         """
         if (len(binaryString) < 44):
             return binaryString
-        fmt = '!QQBBHHHLLLH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.cookie, self.cookie_mask, self.table_id, self.command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BB'
-        start = 38
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1]) = struct.unpack(fmt, binaryString[start:end])
-        self.match.unpack(binaryString[40:])
+        (self.cookie, self.cookie_mask, self.table_id, self.command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.pad[0], self.pad[1]) = _ofp_flow_mod_s0.unpack_from(binaryString, 0)
+        self.match.unpack_from(binaryString, 40)
         return binaryString[44:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 44):
+            return offset
+        (self.cookie, self.cookie_mask, self.table_id, self.command, self.idle_timeout, self.hard_timeout, self.priority, self.buffer_id, self.out_port, self.out_group, self.flags, self.pad[0], self.pad[1]) = _ofp_flow_mod_s0.unpack_from(buffer, offset)
+        self.match.unpack_from(buffer, offset + 40)
+        return offset + 44
+
     def __len__(self):
         """Return length of message
         """
@@ -4274,6 +4769,7 @@ class ofp_flow_mod(object):
         return outstr
 
 
+_ofp_packet_out_s0 = struct.Struct("!LLHBBBBBB")
 class ofp_packet_out(object):
     """Automatically generated Python class for ofp_packet_out
 
@@ -4282,6 +4778,7 @@ class ofp_packet_out(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('buffer_id', 'in_port', 'actions_len', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4307,10 +4804,15 @@ class ofp_packet_out(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LLH", self.buffer_id, self.in_port, self.actions_len)
-        packed += struct.pack("!BBBBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
-        return packed
+        return _ofp_packet_out_s0.pack(self.buffer_id, self.in_port, self.actions_len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_packet_out_s0.pack_into(buffer, offset, self.buffer_id, self.in_port, self.actions_len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4319,16 +4821,20 @@ class ofp_packet_out(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        fmt = '!LLH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.buffer_id, self.in_port, self.actions_len) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBBBBB'
-        start = 10
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = struct.unpack(fmt, binaryString[start:end])
+        (self.buffer_id, self.in_port, self.actions_len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_packet_out_s0.unpack_from(binaryString, 0)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        (self.buffer_id, self.in_port, self.actions_len, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_packet_out_s0.unpack_from(buffer, offset)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -4357,6 +4863,7 @@ class ofp_packet_out(object):
         return outstr
 
 
+_ofp_instruction_goto_table_s0 = struct.Struct("!HHBBBB")
 class ofp_instruction_goto_table(object):
     """Automatically generated Python class for ofp_instruction_goto_table
 
@@ -4365,6 +4872,7 @@ class ofp_instruction_goto_table(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'table_id', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4390,10 +4898,15 @@ class ofp_instruction_goto_table(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHB", self.type, self.len, self.table_id)
-        packed += struct.pack("!BBB", self.pad[0], self.pad[1], self.pad[2])
-        return packed
+        return _ofp_instruction_goto_table_s0.pack(self.type, self.len, self.table_id, self.pad[0], self.pad[1], self.pad[2])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_instruction_goto_table_s0.pack_into(buffer, offset, self.type, self.len, self.table_id, self.pad[0], self.pad[1], self.pad[2])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4402,16 +4915,20 @@ class ofp_instruction_goto_table(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHB'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.table_id) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBB'
-        start = 5
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.table_id, self.pad[0], self.pad[1], self.pad[2]) = _ofp_instruction_goto_table_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.table_id, self.pad[0], self.pad[1], self.pad[2]) = _ofp_instruction_goto_table_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -4440,6 +4957,7 @@ class ofp_instruction_goto_table(object):
         return outstr
 
 
+_ofp_queue_prop_max_rate_s0 = struct.Struct("!HBBBBBB")
 class ofp_queue_prop_max_rate(object):
     """Automatically generated Python class for ofp_queue_prop_max_rate
 
@@ -4448,6 +4966,7 @@ class ofp_queue_prop_max_rate(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('prop_header', 'rate', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4474,11 +4993,16 @@ class ofp_queue_prop_max_rate(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += self.prop_header.pack()
-        packed += struct.pack("!H", self.rate)
-        packed += struct.pack("!BBBBBB", self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
-        return packed
+        return self.prop_header.pack() + _ofp_queue_prop_max_rate_s0.pack(self.rate, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        self.prop_header.pack_into(buffer, offset)
+        _ofp_queue_prop_max_rate_s0.pack_into(buffer, offset + 8, self.rate, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5])
+        return offset + 16
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4487,17 +5011,22 @@ class ofp_queue_prop_max_rate(object):
         """
         if (len(binaryString) < 16):
             return binaryString
-        self.prop_header.unpack(binaryString[0:])
-        fmt = '!H'
-        start = 8
-        end = start + struct.calcsize(fmt)
-        (self.rate,) = struct.unpack(fmt, binaryString[start:end])
-        fmt = '!BBBBBB'
-        start = 10
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = struct.unpack(fmt, binaryString[start:end])
+        self.prop_header.unpack_from(binaryString, 0)
+        (self.rate, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_queue_prop_max_rate_s0.unpack_from(binaryString, 8)
         return binaryString[16:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 16):
+            return offset
+        self.prop_header.unpack_from(buffer, offset)
+        (self.rate, self.pad[0], self.pad[1], self.pad[2], self.pad[3], self.pad[4], self.pad[5]) = _ofp_queue_prop_max_rate_s0.unpack_from(buffer, offset + 8)
+        return offset + 16
+
     def __len__(self):
         """Return length of message
         """
@@ -4525,6 +5054,7 @@ class ofp_queue_prop_max_rate(object):
         return outstr
 
 
+_ofp_experimenter_stats_header_s0 = struct.Struct("!LL")
 class ofp_experimenter_stats_header(object):
     """Automatically generated Python class for ofp_experimenter_stats_header
 
@@ -4533,6 +5063,7 @@ class ofp_experimenter_stats_header(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('experimenter', 'exp_type')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4552,9 +5083,15 @@ class ofp_experimenter_stats_header(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!LL", self.experimenter, self.exp_type)
-        return packed
+        return _ofp_experimenter_stats_header_s0.pack(self.experimenter, self.exp_type)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_experimenter_stats_header_s0.pack_into(buffer, offset, self.experimenter, self.exp_type)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4563,12 +5100,20 @@ class ofp_experimenter_stats_header(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!LL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.experimenter, self.exp_type) = struct.unpack(fmt,  binaryString[start:end])
+        (self.experimenter, self.exp_type) = _ofp_experimenter_stats_header_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.experimenter, self.exp_type) = _ofp_experimenter_stats_header_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -4594,6 +5139,7 @@ class ofp_experimenter_stats_header(object):
         return outstr
 
 
+_ofp_action_group_s0 = struct.Struct("!HHL")
 class ofp_action_group(object):
     """Automatically generated Python class for ofp_action_group
 
@@ -4602,6 +5148,7 @@ class ofp_action_group(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'group_id')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4622,9 +5169,15 @@ class ofp_action_group(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHL", self.type, self.len, self.group_id)
-        return packed
+        return _ofp_action_group_s0.pack(self.type, self.len, self.group_id)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_group_s0.pack_into(buffer, offset, self.type, self.len, self.group_id)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4633,12 +5186,20 @@ class ofp_action_group(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.group_id) = struct.unpack(fmt,  binaryString[start:end])
+        (self.type, self.len, self.group_id) = _ofp_action_group_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.group_id) = _ofp_action_group_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -4666,6 +5227,7 @@ class ofp_action_group(object):
         return outstr
 
 
+_ofp_desc_stats_s0 = struct.Struct("!256s256s256s32s256s")
 class ofp_desc_stats(object):
     """Automatically generated Python class for ofp_desc_stats
 
@@ -4674,6 +5236,7 @@ class ofp_desc_stats(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('mfr_desc', 'hw_desc', 'sw_desc', 'serial_num', 'dp_desc')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4716,13 +5279,15 @@ class ofp_desc_stats(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += self.mfr_desc.ljust(256,'\0')
-        packed += self.hw_desc.ljust(256,'\0')
-        packed += self.sw_desc.ljust(256,'\0')
-        packed += self.serial_num.ljust(32,'\0')
-        packed += self.dp_desc.ljust(256,'\0')
-        return packed
+        return _ofp_desc_stats_s0.pack(self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_desc_stats_s0.pack_into(buffer, offset, self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc)
+        return offset + 1056
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4731,13 +5296,30 @@ class ofp_desc_stats(object):
         """
         if (len(binaryString) < 1056):
             return binaryString
-        self.mfr_desc = binaryString[0:256].replace("\0","")
-        self.hw_desc = binaryString[256:512].replace("\0","")
-        self.sw_desc = binaryString[512:768].replace("\0","")
-        self.serial_num = binaryString[768:800].replace("\0","")
-        self.dp_desc = binaryString[800:1056].replace("\0","")
+        (self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc) = _ofp_desc_stats_s0.unpack_from(binaryString, 0)
+        self.mfr_desc = self.mfr_desc.replace("\0","")
+        self.hw_desc = self.hw_desc.replace("\0","")
+        self.sw_desc = self.sw_desc.replace("\0","")
+        self.serial_num = self.serial_num.replace("\0","")
+        self.dp_desc = self.dp_desc.replace("\0","")
         return binaryString[1056:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 1056):
+            return offset
+        (self.mfr_desc, self.hw_desc, self.sw_desc, self.serial_num, self.dp_desc) = _ofp_desc_stats_s0.unpack_from(buffer, offset)
+        self.mfr_desc = self.mfr_desc.replace("\0","")
+        self.hw_desc = self.hw_desc.replace("\0","")
+        self.sw_desc = self.sw_desc.replace("\0","")
+        self.serial_num = self.serial_num.replace("\0","")
+        self.dp_desc = self.dp_desc.replace("\0","")
+        return offset + 1056
+
     def __len__(self):
         """Return length of message
         """
@@ -4769,6 +5351,7 @@ class ofp_desc_stats(object):
         return outstr
 
 
+_ofp_action_push_s0 = struct.Struct("!HHHBB")
 class ofp_action_push(object):
     """Automatically generated Python class for ofp_action_push
 
@@ -4777,6 +5360,7 @@ class ofp_action_push(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'ethertype', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4802,10 +5386,15 @@ class ofp_action_push(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHH", self.type, self.len, self.ethertype)
-        packed += struct.pack("!BB", self.pad[0], self.pad[1])
-        return packed
+        return _ofp_action_push_s0.pack(self.type, self.len, self.ethertype, self.pad[0], self.pad[1])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_push_s0.pack_into(buffer, offset, self.type, self.len, self.ethertype, self.pad[0], self.pad[1])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4814,16 +5403,20 @@ class ofp_action_push(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.ethertype) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BB'
-        start = 6
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.ethertype, self.pad[0], self.pad[1]) = _ofp_action_push_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.ethertype, self.pad[0], self.pad[1]) = _ofp_action_push_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -4852,6 +5445,7 @@ class ofp_action_push(object):
         return outstr
 
 
+_ofp_group_desc_stats_s0 = struct.Struct("!HBBL")
 class ofp_group_desc_stats(object):
     """Automatically generated Python class for ofp_group_desc_stats
 
@@ -4860,6 +5454,7 @@ class ofp_group_desc_stats(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('length', 'type', 'pad', 'group_id')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4881,9 +5476,15 @@ class ofp_group_desc_stats(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HBBL", self.length, self.type, self.pad, self.group_id)
-        return packed
+        return _ofp_group_desc_stats_s0.pack(self.length, self.type, self.pad, self.group_id)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_group_desc_stats_s0.pack_into(buffer, offset, self.length, self.type, self.pad, self.group_id)
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4892,12 +5493,20 @@ class ofp_group_desc_stats(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HBBL'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.length, self.type, self.pad, self.group_id) = struct.unpack(fmt,  binaryString[start:end])
+        (self.length, self.type, self.pad, self.group_id) = _ofp_group_desc_stats_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.length, self.type, self.pad, self.group_id) = _ofp_group_desc_stats_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -4926,6 +5535,7 @@ class ofp_group_desc_stats(object):
         return outstr
 
 
+_ofp_error_msg_s0 = struct.Struct("!HH")
 class ofp_error_msg(object):
     """Automatically generated Python class for ofp_error_msg
 
@@ -4934,6 +5544,7 @@ class ofp_error_msg(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'code')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -4953,9 +5564,15 @@ class ofp_error_msg(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HH", self.type, self.code)
-        return packed
+        return _ofp_error_msg_s0.pack(self.type, self.code)
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_error_msg_s0.pack_into(buffer, offset, self.type, self.code)
+        return offset + 4
 
     def unpack(self, binaryString):
         """Unpack message
@@ -4964,12 +5581,20 @@ class ofp_error_msg(object):
         """
         if (len(binaryString) < 4):
             return binaryString
-        fmt = '!HH'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.code) = struct.unpack(fmt,  binaryString[start:end])
+        (self.type, self.code) = _ofp_error_msg_s0.unpack_from(binaryString, 0)
         return binaryString[4:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 4):
+            return offset
+        (self.type, self.code) = _ofp_error_msg_s0.unpack_from(buffer, offset)
+        return offset + 4
+
     def __len__(self):
         """Return length of message
         """
@@ -4995,6 +5620,7 @@ class ofp_error_msg(object):
         return outstr
 
 
+_ofp_action_mpls_ttl_s0 = struct.Struct("!HHBBBB")
 class ofp_action_mpls_ttl(object):
     """Automatically generated Python class for ofp_action_mpls_ttl
 
@@ -5003,6 +5629,7 @@ class ofp_action_mpls_ttl(object):
     Core structure: Messages do not include ofp_header
     Does not include var-length arrays
     """
+    __slots__ = ('type', 'len', 'mpls_ttl', 'pad')
     def __init__(self):
         """Initialize
         Declare members and default values
@@ -5028,10 +5655,15 @@ class ofp_action_mpls_ttl(object):
         if(assertstruct):
             if(not self.__assert()[0]):
                 return None
-        packed = ""
-        packed += struct.pack("!HHB", self.type, self.len, self.mpls_ttl)
-        packed += struct.pack("!BBB", self.pad[0], self.pad[1], self.pad[2])
-        return packed
+        return _ofp_action_mpls_ttl_s0.pack(self.type, self.len, self.mpls_ttl, self.pad[0], self.pad[1], self.pad[2])
+
+    def pack_into(self, buffer, offset=0):
+        """Pack message into buffer at offset
+        Does not pack empty array used as placeholder
+        Return the offset following the structure
+        """
+        _ofp_action_mpls_ttl_s0.pack_into(buffer, offset, self.type, self.len, self.mpls_ttl, self.pad[0], self.pad[1], self.pad[2])
+        return offset + 8
 
     def unpack(self, binaryString):
         """Unpack message
@@ -5040,16 +5672,20 @@ class ofp_action_mpls_ttl(object):
         """
         if (len(binaryString) < 8):
             return binaryString
-        fmt = '!HHB'
-        start = 0
-        end = start + struct.calcsize(fmt)
-        (self.type, self.len, self.mpls_ttl) = struct.unpack(fmt,  binaryString[start:end])
-        fmt = '!BBB'
-        start = 5
-        end = start + struct.calcsize(fmt)
-        (self.pad[0], self.pad[1], self.pad[2]) = struct.unpack(fmt, binaryString[start:end])
+        (self.type, self.len, self.mpls_ttl, self.pad[0], self.pad[1], self.pad[2]) = _ofp_action_mpls_ttl_s0.unpack_from(binaryString, 0)
         return binaryString[8:]
 
+    def unpack_from(self, buffer, offset=0):
+        """Unpack message from buffer at offset
+        Do not unpack empty array used as placeholder
+        Return the offset following the structure,
+        unchanged if buffer is too short
+        """
+        if (len(buffer) - offset < 8):
+            return offset
+        (self.type, self.len, self.mpls_ttl, self.pad[0], self.pad[1], self.pad[2]) = _ofp_action_mpls_ttl_s0.unpack_from(buffer, offset)
+        return offset + 8
+
     def __len__(self):
         """Return length of message
         """
@@ -14,18 +14,19 @@ configuration.
 for filters should include a callback or a counter
 """
 
+import os
 import sys
 import time
+import errno
 import socket
-try:
-    import pcap
-except:
-    sys.exit("Need to install pypcap (apt-get install python-pypcap).")
 from threading import Thread
 from threading import Condition
+import heapq
 import select
 import logging
+from collections import deque
 from oft_assert import oft_assert
+from capture import capture_open
 
 ##@todo Find a better home for these identifiers (dataplane)
 RCV_SIZE_DEFAULT = 4096
@@ -36,74 +37,100 @@ class DataPlanePort(Thread):
     Class defining a port monitoring object.
 
     Control a dataplane port connected to the switch under test.
-    Creates a promiscuous socket on a physical interface.
-    Queues the packets received on that interface with time stamps.
-    Inherits from Thread class as meant to run in background.  Also
+    Creates a promiscuous socket on a physical interface through a
+    capture backend (see capture.py).
+    Queues the packets received on that interface with time stamps,
+    all the packets received by each wakeup at once.
+    Inherits from Thread class as meant to run in background, unless
+    the dataplane services all its ports from a DataPlaneReactor.  Also
     supports polling.
     Use accessors to dequeue packets for proper synchronization.
 
     Currently assumes a controlling 'parent' which maintains a
-    common Lock object and a total packet-pending count.  May want
-    to decouple that some day.
+    common Lock object, a total packet-pending count and the index of
+    queue heads across ports.  May want to decouple that some day.
+
+    @var packets The deque of (seq, packet, time-stamp) triples queued,
+    oldest first; seq is the arrival sequence number from the parent
     """
 
-    def __init__(self, interface_name, port_number, parent, max_pkts=1024):
+    def __init__(self, interface_name, port_number, parent, max_pkts=1024,
+                 capture="auto", capture_filter=None):
         """
         Set up a port monitor object
         @param interface_name The name of the physical interface like eth1
         @param port_number The port number associated with this port
         @param parent The controlling dataplane object; for pkt wait CV
         @param max_pkts Maximum number of pkts to keep in queue
+        @param capture The capture backend: "ring", "pcap" or "auto"
+        @param capture_filter The frames to drop in the kernel; see
+        capture.capture_open
         """
         Thread.__init__(self)
         self.interface_name = interface_name
         self.max_pkts = max_pkts
         self.packets_total = 0
-        self.packets = []
+        self.packets = deque()
         self.packets_discarded = 0
         self.port_number = port_number
         logname = "dp-" + interface_name
         self.logger = logging.getLogger(logname)
         try:
-            self.pcap = pcap.pcap(interface_name, RCV_SIZE_DEFAULT, True, RCV_TIMEOUT)
- #           self.pcap.setnonblock()
-        except OSError, msg:
-            self.logger.info("Could not open interface: " + msg)
+            self.capture = capture_open(interface_name, capture,
+                                        RCV_SIZE_DEFAULT, RCV_TIMEOUT,
+                                        self.logger, capture_filter)
+        except EnvironmentError, msg:
+            self.logger.info("Could not open interface: " + str(msg))
             sys.exit(1)
-        self.logger.info("Opened interface")
+        self.logger.info("Opened interface with " + self.capture.name +
+                         " capture")
         self.parent = parent
         self.pkt_sync = self.parent.pkt_sync
         self.pkt_handler = None
 
-    def pcap_cb(self, ts, pkt):
-        self.logger.debug("Pkt len " + str(len(pkt)) +
-             " in at " + str(ts))
-
-        # Enqueue packet
+    def enqueue(self, pkts):
+        """
+        Queue packets received on the port
+        @param pkts A list of (packet, time-stamp) pairs
+        """
         self.pkt_sync.acquire()
-        if len(self.packets) >= self.max_pkts:
-            # Queue full, throw away oldest
-            self.packets.pop(0)
-            self.packets_discarded += 1
-        else:
-            self.parent.packets_pending += 1
-        # Check if parent is waiting on this (or any) port
-        if self.parent.want_pkt:
-            if (not self.parent.want_pkt_port or
-                    self.parent.want_pkt_port == self.port_number):
-                self.parent.got_pkt_port = self.port_number
-                self.parent.want_pkt = False
-#                    self.parent.pkt_sync.notify()
-        self.packets.append((pkt, ts))
-        self.packets_total += 1
+        # Wake up anyone polling on this (or any) port
+        if self.enqueue_locked(pkts):
+            self.pkt_sync.notify_all()
         self.pkt_sync.release()
 
+    def enqueue_locked(self, pkts):
+        """
+        Queue packets received on the port; pkt_sync must be held
+        @param pkts A list of (packet, time-stamp) pairs
+        @return True if a poller waiting on the port must be notified
+        """
+        self.logger.debug(str(len(pkts)) + " pkts in at " + str(pkts[0][1]))
+
+        packets = self.packets
+        head = packets[0][0] if packets else None
+        seq = self.parent.packet_seq
+        for (pkt, pkt_time) in pkts:
+            if len(packets) >= self.max_pkts:
+                # Queue full, throw away oldest
+                packets.popleft()
+                self.packets_discarded += 1
+            else:
+                self.parent.packets_pending += 1
+            packets.append((seq, pkt, pkt_time))
+            seq += 1
+        self.parent.packet_seq = seq
+        self.packets_total += len(pkts)
+        if packets[0][0] != head:
+            self.parent.head_push(self)
+        return self.parent.waiting(self.port_number)
+
     def run(self):
         """
         Activity function for class
         """
         self.running = True
-        self.socs = [self.pcap.fd]
+        self.socs = [self.capture.fileno()]
         while self.running:
             try:
                 sel_in, sel_out, sel_err = \
@@ -118,10 +145,12 @@ class DataPlanePort(Thread):
             if (sel_in is None) or (len(sel_in) == 0):
                 continue
 
-            self.pcap.dispatch(1, self.pcap_cb)
+            pkts = self.capture.recv_batch()
+            if pkts:
+                self.enqueue(pkts)
 
         self.logger.info("Thread exit ")
-        self.pcap.close()
+        self.capture.close()
 
     def kill(self):
         """
@@ -140,9 +169,11 @@ class DataPlanePort(Thread):
         """
         if use_lock:
             self.pkt_sync.acquire()
-        if len(self.packets) > 0:
-            pkt, pkt_time = self.packets.pop(0)
+        if self.packets:
+            _, pkt, pkt_time = self.packets.popleft()
             self.parent.packets_pending -= 1
+            if self.packets:
+                self.parent.head_push(self)
         else:
             pkt = pkt_time = None
         if use_lock:
@@ -153,12 +184,9 @@ class DataPlanePort(Thread):
         """
         Return the timestamp of the head of queue or None if empty
         """
-        rv = None
-        try:
-            rv = self.packets[0][1]
-        except StandardError:
-            rv = None
-        return rv
+        if self.packets:
+            return self.packets[0][2]
+        return None
 
     def flush(self):
         """
@@ -167,8 +195,9 @@ class DataPlanePort(Thread):
         self.pkt_sync.acquire()
         self.packets_discarded += len(self.packets)
         self.parent.packets_pending -= len(self.packets)
-        self.packets = []
-        self.packet_times = []
+        # The parent's index entries for the port go stale and are
+        # skipped when reached
+        self.packets = deque()
         self.pkt_sync.release()
 
 
@@ -182,9 +211,9 @@ class DataPlanePort(Thread):
         self.logger.debug("Pkt len " + str(len(packet)) +
              " out")
         try:
-            ret = self.pcap.inject(packet, len(packet))
-        except OSError, msg:
-            self.logger.info("Could not inject packet: " + msg)
+            ret = self.capture.send(packet)
+        except EnvironmentError, msg:
+            self.logger.info("Could not inject packet: " + str(msg))
             sys.exit(1)
         return ret
 
@@ -198,43 +227,171 @@ class DataPlanePort(Thread):
         """
         self.pkt_handler = pkt_handler
 
+    def filter_stats(self):
+        """
+        Return the frames dropped and passed by the capture filter
+        @return The pair (hits, misses); see capture.Capture.filter_stats
+        """
+        return self.capture.filter_stats()
+
     def show(self, prefix=''):
         print prefix + "Name:          " + self.interface_name
         print prefix + "Pkts pending:  " + str(len(self.packets))
         print prefix + "Pkts total:    " + str(self.packets_total)
-        print prefix + "pcap:        " + str(self.pcap)
+        print prefix + "Pkts dropped:  " + str(self.capture.dropped())
+        print prefix + "Capture:       " + self.capture.name
+        (hits, misses) = self.filter_stats()
+        print prefix + "Filter hits:   " + str(hits)
+        print prefix + "Filter misses: " + str(misses)
+
+
+class DataPlaneReactor(Thread):
+    """
+    Single thread receiving on all the ports of a dataplane
+
+    Waits on the capture fds of all ports with epoll (poll where epoll
+    is not available), takes the packets of every ready port and
+    queues them all with one acquisition of pkt_sync and one wakeup.
+    A pipe wakes the thread up to stop at once.
+
+    @var ports Map from capture fd to DataPlanePort
+    """
+
+    def __init__(self, parent):
+        Thread.__init__(self)
+        self.parent = parent
+        self.logger = logging.getLogger("dp-reactor")
+        self.ports = {}
+        self.running = True
+        if hasattr(select, "epoll"):
+            self.poller = select.epoll()
+            self.poll_in = select.EPOLLIN
+            self.poll_scale = 1
+        else:
+            self.poller = select.poll()
+            self.poll_in = select.POLLIN
+            self.poll_scale = 1000
+        (self.wakeup_fd, self.notify_fd) = os.pipe()
+        self.poller.register(self.wakeup_fd, self.poll_in)
+
+    def port_add(self, port):
+        """
+        Start receiving on a port; safe from any thread
+        """
+        fd = port.capture.fileno()
+        self.ports[fd] = port
+        self.poller.register(fd, self.poll_in)
 
+    def run(self):
+        pkt_sync = self.parent.pkt_sync
+        while self.running:
+            try:
+                events = self.poller.poll(1 * self.poll_scale)
+            except EnvironmentError, e:
+                if e.errno == errno.EINTR:
+                    continue
+                self.logger.error("Poll error: " + str(e))
+                break
+            batches = []
+            for (fd, event) in events:
+                port = self.ports.get(fd)
+                if port is not None:
+                    pkts = port.capture.recv_batch()
+                    if pkts:
+                        batches.append((port, pkts))
+            if not batches:
+                continue
+            notify = False
+            pkt_sync.acquire()
+            for (port, pkts) in batches:
+                if port.enqueue_locked(pkts):
+                    notify = True
+            if notify:
+                pkt_sync.notify_all()
+            pkt_sync.release()
+
+        self.logger.info("Thread exit ")
+        for port in self.ports.values():
+            port.capture.close()
+        if hasattr(self.poller, "close"):
+            self.poller.close()   # epoll has an fd of its own
+        os.close(self.wakeup_fd)
+
+    def kill(self):
+        """
+        Make the thread exit; safe from any thread and takes effect at once
+        """
+        if not self.running:
+            return
+        self.running = False
+        try:
+            os.write(self.notify_fd, "x")
+        except OSError:
+            pass   # The thread has already exited
+        os.close(self.notify_fd)
 
 class DataPlane:
     """
     Class defining access primitives to the data plane
     Controls a list of DataPlanePort objects
     """
-    def __init__(self):
+    def __init__(self, capture="auto", reactor=False, capture_filter=None):
+        """
+        @param capture The capture backend of the ports: "ring", "pcap"
+        or "auto"; see capture.capture_open
+        @param reactor If True, receive on all ports from one
+        DataPlaneReactor thread instead of a thread per port
+        @param capture_filter The default capture filter of the ports:
+        None, a BPF expression of the frames to keep or a
+        capture.CaptureFilter
+        """
         self.port_list = {}
+        self.capture = capture
+        self.capture_filter = capture_filter
+        self.reactor_mode = reactor
+        self.reactor = None
         # pkt_sync serves double duty as a regular top level lock and
         # as a condition variable
         self.pkt_sync = Condition()
 
-        # These are used to signal async pkt arrival for polling
-        self.want_pkt = False
-        self.want_pkt_port = None # What port required (or None)
-        self.got_pkt_port = None # On what port received?
+        # Waiter registry used to signal async pkt arrival for polling;
+        # maps a port number (or None for any port) to the number of
+        # pollers blocked on pkt_sync for that port
+        self.waiters = {}
         self.packets_pending = 0 # Total pkts in all port queues
+        # Arrival sequence number of the next packet queued
+        self.packet_seq = 0
+        # Heap of (time-stamp, seq, port_number) of port queue heads, so
+        # the oldest packet of any port is found in O(log n).  An entry
+        # is stale once its packet is no longer the head of the port's
+        # queue; stale entries are skipped lazily.
+        self.heads = []
         self.logger = logging.getLogger("dataplane")
         self.pkt_handler = None
 
-    def port_add(self, interface_name, port_number):
+    def port_add(self, interface_name, port_number, capture_filter=None):
         """
         Add a port to the dataplane
         TBD:  Max packets for queue?
         @param interface_name The name of the physical interface like eth1
         @param port_number The port number used to refer to the port
+        @param capture_filter The capture filter of the port, if not the
+        dataplane's default
         """
 
+        if capture_filter is None:
+            capture_filter = self.capture_filter
         self.port_list[port_number] = DataPlanePort(interface_name,
-                                                    port_number, self)
-        self.port_list[port_number].start()
+                                                    port_number, self,
+                                                    capture=self.capture,
+                                                    capture_filter=capture_filter)
+        if self.reactor_mode:
+            if self.reactor is None:
+                self.reactor = DataPlaneReactor(self)
+                self.reactor.start()
+            self.reactor.port_add(self.port_list[port_number])
+        else:
+            self.port_list[port_number].start()
         if self.pkt_handler is not None:
             self.port_list[port_number].register(self.pkt_handler)
 
@@ -274,19 +431,81 @@ class DataPlane:
                          ", port %d, length mismatch %d != %d" %
                          (port_number, bytes, len(packet)))
 
+    def head_push(self, port):
+        """
+        Index the head of a port's queue after it changed
+
+        Must be called with pkt_sync held and the port's queue not empty.
+        @param port The DataPlanePort
+        """
+        (seq, pkt, pkt_time) = port.packets[0]
+        heapq.heappush(self.heads, (pkt_time, seq, port.port_number))
+        if len(self.heads) > 2 * len(self.port_list) + 64:
+            self._heads_compact()
+
+    def _heads_compact(self):
+        # Rebuild the index from the current queue heads
+        self.heads = [(port.packets[0][2], port.packets[0][0], port_number)
+                      for (port_number, port) in self.port_list.items()
+                      if port.packets]
+        heapq.heapify(self.heads)
+
     def _oldest_packet_find(self):
-        # Find port with oldest packet
-        min_time = 0
-        min_port = -1
-        for port_number in self.port_list.keys():
-            ptime = self.port_list[port_number].timestamp_head()
-            if ptime:
-                if (min_port == -1) or (ptime < min_time):
-                    min_time = ptime
-                    min_port = port_number
-        oft_assert(min_port != -1, "Could not find port when pkts pending")
+        # Find port with oldest packet, dropping stale index entries
+        heads = self.heads
+        while heads:
+            (pkt_time, seq, port_number) = heads[0]
+            port = self.port_list.get(port_number)
+            if port is not None and port.packets and \
+                    port.packets[0][0] == seq:
+                return port_number
+            heapq.heappop(heads)
+        oft_assert(False, "Could not find port when pkts pending")
+
+    def waiting(self, port_number):
+        """
+        Check if any poller is blocked waiting for a packet from a port
+
+        Must be called with pkt_sync held.
+        @param port_number The port on which a packet was queued
+        @return True if a poller for this port or for any port is waiting
+        """
+        return bool(self.waiters.get(port_number) or self.waiters.get(None))
+
+    def _waiter_add(self, port_number):
+        if not port_number:
+            port_number = None
+        self.waiters[port_number] = self.waiters.get(port_number, 0) + 1
+
+    def _waiter_remove(self, port_number):
+        if not port_number:
+            port_number = None
+        self.waiters[port_number] -= 1
+        if self.waiters[port_number] == 0:
+            del self.waiters[port_number]
+
+    def _packet_dequeue(self, port_number):
+        """
+        Dequeue a packet from one or all ports; pkt_sync must be held
+        @return The triple port_number, packet, pkt_time or
+        None, None, None if nothing is queued for the request
+        """
+        # Check if requested specific port and it has a packet
+        if port_number:
+            if not self.port_list[port_number].packets:
+                return None, None, None
+            pkt, pkt_time = self.port_list[port_number].dequeue(use_lock=False)
+            oft_assert(pkt, "Poll: packet not found on port " +
+                       str(port_number))
+            return port_number, pkt, pkt_time
 
-        return min_port
+        # Check if requested any port and some packet pending
+        if self.packets_pending == 0:
+            return None, None, None
+        port = self._oldest_packet_find()
+        pkt, pkt_time = self.port_list[port].dequeue(use_lock=False)
+        oft_assert(pkt, "Poll: oldest packet not found")
+        return port, pkt, pkt_time
 
     def poll(self, port_number=None, timeout=None):
         """
@@ -297,49 +516,35 @@ class DataPlane:
         that packet.
         @param port_number If set, get packet from this port
         @param timeout If positive and no packet is available, block
-        until a packet is received or for this many seconds
+        until a packet is received or for this many seconds.  The call
+        returns as soon as a packet is queued on the requested port.
         @return The triple port_number, packet, pkt_time where packet
         is received from port_number at time pkt_time.  If a timeout
         occurs, return None, None, None
         """
 
+        deadline = None
         self.pkt_sync.acquire()
+        while True:
+            port, pkt, pkt_time = self._packet_dequeue(port_number)
+            if pkt is not None:
+                self.pkt_sync.release()
+                return port, pkt, pkt_time
+
+            # No packet pending; blocking call requested?
+            if not timeout:
+                break
+            if deadline is None:
+                deadline = time.time() + timeout
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
 
-        # Check if requested specific port and it has a packet
-        if port_number and len(self.port_list[port_number].packets) != 0:
-            pkt, time = self.port_list[port_number].dequeue(use_lock=False)
-            self.pkt_sync.release()
-            oft_assert(pkt, "Poll: packet not found on port " +
-                       str(port_number))
-            return port_number, pkt, time
-
-        # Check if requested any port and some packet pending
-        if not port_number and self.packets_pending != 0:
-            port = self._oldest_packet_find()
-            pkt, time = self.port_list[port].dequeue(use_lock=False)
-            self.pkt_sync.release()
-            oft_assert(pkt, "Poll: oldest packet not found")
-            return port, pkt, time
-
-        # No packet pending; blocking call requested?
-        if not timeout:
-            self.pkt_sync.release()
-            return None, None, None
-
-        # Desired packet isn't available and timeout is specified
-        # Already holding pkt_sync; wait on pkt_sync variable
-        self.want_pkt = True
-        self.want_pkt_port = port_number
-        self.got_pkt_port = None
-        self.pkt_sync.wait(timeout)
-        self.want_pkt = False
-        if self.got_pkt_port:
-            pkt, time = \
-                self.port_list[self.got_pkt_port].dequeue(use_lock=False)
-            self.pkt_sync.release()
-            oft_assert(pkt, "Poll: pkt reported, but not found at " +
-                       str(self.got_pkt_port))
-            return self.got_pkt_port, pkt, time
+            # Already holding pkt_sync; register as a waiter so the
+            # port thread notifies us when a packet is queued
+            self._waiter_add(port_number)
+            self.pkt_sync.wait(remaining)
+            self._waiter_remove(port_number)
 
         self.pkt_sync.release()
         self.logger.debug("Poll time out, no packet from " + str(port_number))
@@ -353,9 +558,14 @@ class DataPlane:
         """
         for port_number in self.port_list.keys():
             self.port_list[port_number].kill()
-            if join_threads:
+            if join_threads and self.reactor is None:
                 self.logger.debug("Joining " + str(port_number))
                 self.port_list[port_number].join()
+        if self.reactor is not None:
+            self.reactor.kill()
+            if join_threads:
+                self.logger.debug("Joining reactor")
+                self.reactor.join()
 
         self.logger.info("DataPlane shutdown")
 
@@ -0,0 +1,233 @@
+#!/usr/bin/python
+
+import struct
+import threading
+import time
+import unittest
+from oftest import capture
+from oftest import dataplane
+
+# IEEE 802 local experimental ethertype; keeps the host stack out of it
+TEST_ETHERTYPE = 0x88b5
+
+def test_frame(seq, ethertype=TEST_ETHERTYPE,
+               src="\x02\x00\x00\x00\x00\x01"):
+    frame = struct.pack("!6s6sHL", "\xff" * 6, src, ethertype, seq)
+    return frame + "\x00" * (64 - len(frame))
+
+def ring_open(interface_name):
+    """
+    Return a RingCapture on interface_name or None if not permitted
+    """
+    try:
+        return capture.RingCapture(interface_name)
+    except EnvironmentError:
+        return None
+
+class ring_test(unittest.TestCase):
+    """
+    Base class of the tests needing an AF_PACKET ring on lo
+    """
+    def setUp(self):
+        ring = ring_open("lo")
+        if ring is None:
+            self.skipTest("No AF_PACKET ring on lo")
+        ring.close()
+
+class ring_capture_port(ring_test):
+    def runTest(self):
+        dp = dataplane.DataPlane(capture="ring")
+        dp.port_add("lo", 1)
+        try:
+            port = dp.port_list[1]
+            self.assertEqual(port.capture.name, "ring")
+            for seq in range(100):
+                self.assertEqual(dp.send(1, test_frame(seq)), 64)
+            # lo loops the frames back; the socket sending a frame does
+            # not see it going out
+            seqs = []
+            while len(seqs) < 100:
+                (port_number, pkt, pkt_time) = dp.poll(1, timeout=2)
+                self.assertTrue(pkt is not None)
+                self.assertEqual(port_number, 1)
+                if struct.unpack("!H", pkt[12:14])[0] == TEST_ETHERTYPE:
+                    seqs.append(struct.unpack("!L", pkt[14:18])[0])
+            self.assertEqual(seqs, range(100))
+            self.assertEqual(port.capture.dropped(), 0)
+        finally:
+            dp.kill()
+
+class reactor_ports(ring_test):
+    def runTest(self):
+        threads = threading.active_count()
+        dp = dataplane.DataPlane(capture="ring", reactor=True)
+        for port_number in range(1, 5):
+            dp.port_add("lo", port_number)
+        try:
+            self.assertEqual(threading.active_count(), threads + 1)
+            for seq in range(50):
+                dp.send(1, test_frame(seq))
+            # Port 1 sees its frames come back in; the others also see
+            # them go out
+            for (port_number, count) in [(1, 50), (2, 100), (4, 100)]:
+                seqs = []
+                while len(seqs) < count:
+                    (port, pkt, pkt_time) = dp.poll(port_number, timeout=2)
+                    self.assertTrue(pkt is not None)
+                    if struct.unpack("!H", pkt[12:14])[0] == TEST_ETHERTYPE:
+                        seqs.append(struct.unpack("!L", pkt[14:18])[0])
+                self.assertEqual(sorted(seqs), sorted(range(50) * (count / 50)))
+        finally:
+            start = time.time()
+            dp.kill()
+        self.assertTrue(time.time() - start < 0.5)
+        self.assertEqual(threading.active_count(), threads)
+
+class ring_vlan_tag(ring_test):
+    def runTest(self):
+        dp = dataplane.DataPlane(capture="ring")
+        dp.port_add("lo", 1)
+        dp.port_add("lo", 2)
+        try:
+            frame = struct.pack("!6s6sHHHL", "\xff" * 6,
+                                "\x02\x00\x00\x00\x00\x01", 0x8100, 5,
+                                TEST_ETHERTYPE, 7)
+            frame += "\x00" * (64 - len(frame))
+            dp.send(1, frame)
+            # Port 2 sees the frame go out and come back in; the kernel
+            # takes the tag out of the latter
+            for _ in range(2):
+                # Skip other traffic on lo, tagged or not
+                while True:
+                    (port_number, pkt, pkt_time) = dp.poll(2, timeout=2)
+                    if pkt is None or frame[16:18] in [pkt[12:14], pkt[16:18]]:
+                        break
+                self.assertEqual(pkt, frame)
+        finally:
+            dp.kill()
+
+class any_port_order(ring_test):
+    def runTest(self):
+        dp = dataplane.DataPlane(capture="ring", reactor=True)
+        for port_number in range(1, 5):
+            dp.port_add("lo", port_number)
+        # Stop capturing so only the packets queued here are seen
+        dp.kill()
+        ports = dp.port_list
+        ports[1].max_pkts = 3
+        ports[1].enqueue([("a", 1.0), ("b", 5.0), ("c", 9.0), ("d", 10.0)])
+        ports[2].enqueue([("e", 2.0), ("f", 3.0)])
+        ports[3].enqueue([("g", 4.0), ("h", 6.0)])
+        ports[4].enqueue([("i", 0.5)])
+        self.assertEqual(ports[1].packets_discarded, 1)
+        self.assertEqual(dp.poll(2), (2, "e", 2.0))
+        ports[4].flush()
+        self.assertEqual(dp.packets_pending, 6)
+        result = []
+        while True:
+            (port_number, pkt, pkt_time) = dp.poll()
+            if pkt is None:
+                break
+            result.append((port_number, pkt))
+        self.assertEqual(result, [(2, "f"), (3, "g"), (1, "b"), (3, "h"),
+                                  (1, "c"), (1, "d")])
+        self.assertEqual(dp.packets_pending, 0)
+        # Polls of one port leave stale entries behind; the index is
+        # compacted rather than growing with them
+        for seq in range(200):
+            ports[3].enqueue([(str(seq), float(seq))])
+            self.assertEqual(dp.poll(3)[1], str(seq))
+        self.assertTrue(len(dp.heads) <= 2 * len(ports) + 64)
+
+class capture_filter_port(ring_test):
+    def runTest(self):
+        dp = dataplane.DataPlane(capture="ring")
+        dp.port_add("lo", 1)
+        dp.port_add("lo", 2, capture.CaptureFilter(
+                ethertypes=[0x0800, 0x86dd, TEST_ETHERTYPE + 1],
+                macs=["02:00:00:00:00:02"]))
+        try:
+            for seq in range(30):
+                dp.send(1, test_frame(seq, TEST_ETHERTYPE + seq % 3,
+                                      "\x02\x00\x00\x00\x00" + chr(seq % 2 + 1)))
+            # Port 2 keeps the TEST_ETHERTYPE and TEST_ETHERTYPE + 2
+            # frames from 02:00:00:00:00:01, each going out and back in
+            seqs = []
+            while len(seqs) < 20:
+                (port_number, pkt, pkt_time) = dp.poll(2, timeout=2)
+                self.assertTrue(pkt is not None)
+                self.assertEqual(pkt[11], "\x01")
+                self.assertNotEqual(struct.unpack("!H", pkt[12:14])[0],
+                                    TEST_ETHERTYPE + 1)
+                seqs.append(struct.unpack("!L", pkt[14:18])[0])
+            self.assertEqual(sorted(set(seqs)),
+                             [seq for seq in range(30)
+                              if seq % 2 == 0 and seq % 3 != 1])
+            (hits, misses) = dp.port_list[2].filter_stats()
+            self.assertTrue(misses >= 20)
+            if hits is not None:
+                self.assertTrue(hits >= 40)
+        finally:
+            dp.kill()
+
+class capture_filter_vlan(ring_test):
+    def runTest(self):
+        dp = dataplane.DataPlane(capture="ring")
+        dp.port_add("lo", 1)
+        dp.port_add("lo", 2, capture.CaptureFilter(ethertypes=[0x8100]))
+        dp.port_add("lo", 3, capture.CaptureFilter(
+                ethertypes=[TEST_ETHERTYPE]))
+        try:
+            for seq in range(10):
+                frame = test_frame(seq)
+                if seq % 2:
+                    frame = frame[:12] + struct.pack("!HH", 0x8100, 5) + \
+                        frame[12:-4]
+                dp.send(1, frame)
+            # Port 2 drops the tagged frames and port 3 the untagged
+            # ones, going out and coming back in alike
+            for (port_number, tagged) in [(2, 0), (3, 1)]:
+                seqs = []
+                while True:
+                    (port, pkt, pkt_time) = dp.poll(port_number, timeout=0.5)
+                    if pkt is None:
+                        break
+                    if pkt[12:14] == "\x81\x00" and \
+                            pkt[16:18] == struct.pack("!H", TEST_ETHERTYPE):
+                        seqs.append(struct.unpack("!L", pkt[18:22])[0])
+                    elif pkt[12:14] == struct.pack("!H", TEST_ETHERTYPE):
+                        seqs.append(struct.unpack("!L", pkt[14:18])[0])
+                self.assertEqual(sorted(seqs),
+                                 sorted(range(tagged, 10, 2) * 2))
+        finally:
+            dp.kill()
+
+class capture_filter_program(unittest.TestCase):
+    def runTest(self):
+        prog = capture.CaptureFilter(ethertypes=[0x88cc]).program("lo")
+        self.assertEqual(prog[4:],
+                         [(capture.BPF_LD_H_ABS, 0, 0, 12),
+                          (capture.BPF_JEQ_K, 0, 1, 0x88cc),
+                          (capture.BPF_JA, 0, 0, 1),
+                          (capture.BPF_RET_K, 0, 0, capture.BPF_KEEP),
+                          (capture.BPF_RET_K, 0, 0, 0)])
+        self.assertEqual(capture.CaptureFilter("not ip6", [0x88cc],
+                                               ["01:80:c2:00:00:0e"])
+                         .tcpdump_expression(),
+                         "(not ip6) and not (ether proto 0x88cc) and " +
+                         "not (ether host 01:80:c2:00:00:0e)")
+        self.assertEqual(capture.filter_create("arp").expression, "arp")
+
+class capture_open_backend(unittest.TestCase):
+    def runTest(self):
+        self.assertRaises(ValueError, capture.capture_open, "lo", "ring0")
+        if capture.pcap is None:
+            self.assertRaises(EnvironmentError, capture.capture_open, "lo",
+                              "pcap")
+        if ring_open("lo") is not None:
+            backend = capture.capture_open("lo")
+            self.assertEqual(backend.name, "ring")
+            backend.close()
+
+if __name__ == '__main__':
+    unittest.main()
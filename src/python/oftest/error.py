@@ -2,6 +2,7 @@
 # Python OpenFlow error wrapper classes
 
 from cstruct import *
+from base_list import buffer_bytes
 
 
 
@@ -15,6 +16,8 @@ class hello_failed_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -30,10 +33,15 @@ class hello_failed_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -65,6 +73,8 @@ class bad_request_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -80,10 +90,15 @@ class bad_request_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -115,6 +130,8 @@ class bad_action_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -130,10 +147,15 @@ class bad_action_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -165,6 +187,8 @@ class bad_instruction_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -180,10 +204,15 @@ class bad_instruction_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -215,6 +244,8 @@ class bad_match_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -230,10 +261,15 @@ class bad_match_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -265,6 +301,8 @@ class flow_mod_failed_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -280,10 +318,15 @@ class flow_mod_failed_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -315,6 +358,8 @@ class group_mod_failed_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -330,10 +375,15 @@ class group_mod_failed_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -365,6 +415,8 @@ class port_mod_failed_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -380,10 +432,15 @@ class port_mod_failed_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -415,6 +472,8 @@ class table_mod_failed_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -430,10 +489,15 @@ class table_mod_failed_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -465,6 +529,8 @@ class queue_op_failed_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -480,10 +546,15 @@ class queue_op_failed_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
@@ -515,6 +586,8 @@ class switch_config_failed_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     """
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -530,10 +603,15 @@ class switch_config_failed_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
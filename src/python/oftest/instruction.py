@@ -17,6 +17,8 @@ class instruction_write_metadata(ofp_instruction_write_metadata):
     @arg metadata_mask
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_instruction_write_metadata.__init__(self)
         self.type = OFPIT_WRITE_METADATA
@@ -37,6 +39,8 @@ class instruction_goto_table(ofp_instruction_goto_table):
     @arg table_id
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_instruction_goto_table.__init__(self)
         self.type = OFPIT_GOTO_TABLE
@@ -56,6 +60,8 @@ class instruction_write_actions(ofp_instruction_actions):
     @arg len
 
     """
+    __slots__ = ['actions']
+
     def __init__(self):
         ofp_instruction_actions.__init__(self)
         self.type = OFPIT_WRITE_ACTIONS
@@ -67,11 +73,12 @@ class instruction_write_actions(ofp_instruction_actions):
         outstr += self.actions.show(prefix)
         return outstr
     def unpack(self, binary_string):
-        binary_string = ofp_instruction_actions.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        offset = ofp_instruction_actions.unpack_from(self, buffer, offset)
         bytes = self.len - OFP_INSTRUCTION_ACTIONS_BYTES
         self.actions = action_list()
-        binary_string = self.actions.unpack(binary_string, bytes=bytes)
-        return binary_string
+        return self.actions.unpack_from(buffer, offset, bytes=bytes)
     def pack(self):
         self.len = self.__len__()
         packed = ""
@@ -91,6 +98,8 @@ class instruction_apply_actions(ofp_instruction_actions):
     @arg len
 
     """
+    __slots__ = ['actions']
+
     def __init__(self):
         ofp_instruction_actions.__init__(self)
         self.type = OFPIT_APPLY_ACTIONS
@@ -102,11 +111,12 @@ class instruction_apply_actions(ofp_instruction_actions):
         outstr += self.actions.show(prefix)
         return outstr
     def unpack(self, binary_string):
-        binary_string = ofp_instruction_actions.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        offset = ofp_instruction_actions.unpack_from(self, buffer, offset)
         bytes = self.len - OFP_INSTRUCTION_ACTIONS_BYTES
         self.actions = action_list()
-        binary_string = self.actions.unpack(binary_string, bytes=bytes)
-        return binary_string
+        return self.actions.unpack_from(buffer, offset, bytes=bytes)
     def pack(self):
         self.len = self.__len__()
         packed = ""
@@ -126,6 +136,8 @@ class instruction_clear_actions(ofp_instruction):
     @arg len
 
     """
+    __slots__ = ()
+
     def __init__(self):
         ofp_instruction.__init__(self)
         self.type = OFPIT_CLEAR_ACTIONS
@@ -34,6 +34,7 @@ class instruction_list(ofp_base_list):
     is an action.
 
     """
+    __slots__ = ['instructions']
 
     def __init__(self):
         ofp_base_list.__init__(self)
@@ -41,42 +42,40 @@ class instruction_list(ofp_base_list):
         self.name = "instruction"
         self.class_list = instruction.instruction_class_list
 
-    def unpack(self, binary_string, bytes=None):
+    def unpack_from(self, buffer, offset=0, bytes=None):
         """
         Unpack a list of instructions
         
-        Unpack instructions from a binary string, creating an array
+        Unpack instructions from a buffer at an offset, creating an array
         of objects of the appropriate type
 
-        @param binary_string The string to be unpacked
+        @param buffer The string or buffer to be unpacked
+
+        @param offset The offset of the instruction list in buffer
 
         @param bytes The total length of the instruction list in bytes.  
-        Ignored if decode is True.  If bytes is None and decode is false, the
-        list is assumed to extend through the entire string.
+        If None, the list is assumed to extend through the entire buffer.
 
-        @return The remainder of binary_string that was not parsed
+        @return The offset in buffer just past the parsed instructions
 
         """
         if bytes == None:
-            bytes = len(binary_string)
-        bytes_done = 0
-        count = 0
-        cur_string = binary_string
-        while bytes_done < bytes:
+            bytes = len(buffer) - offset
+        end = offset + bytes
+        while offset < end:
             hdr = instruction.ofp_instruction()
-            hdr.unpack(cur_string)
+            hdr.unpack_from(buffer, offset)
             if hdr.len < action.OFP_ACTION_HEADER_BYTES:
                 print "ERROR: Action too short"
                 break
-            if not hdr.type in instruction_object_map.keys():
+            if not hdr.type in instruction_object_map:
                 print "WARNING: Skipping unknown action ", hdr.type, hdr.len
             else:
-                self.instructions.append(instruction_object_map[hdr.type]())
-                self.instructions[count].unpack(cur_string)
-                count += 1
-            cur_string = cur_string[hdr.len:]
-            bytes_done += hdr.len
-        return cur_string
+                obj = instruction_object_map[hdr.type]()
+                obj.unpack_from(buffer, offset)
+                self.instructions.append(obj)
+            offset += hdr.len
+        return offset
 
 class Instruction_List_Test(unittest.TestCase):
     def runTest(self):
@@ -4,8 +4,13 @@
 import ipaddr
 from cstruct import *
 
+# OXM TLV header: class, field, hasmask and payload length
+OXM_TLV_HEADER = struct.Struct("!I")
+
+
+class oxm_tlv(object):
+    __slots__ = ['class_', 'field', 'hasmask', 'length', 'value', 'mask']
 
-class oxm_tlv:
     def __init__(self, field, hasmask, length, value, mask=None, class_ = 0x8000):
         self.class_ = class_
         self.field = field
@@ -16,8 +21,16 @@ class oxm_tlv:
     
     def pack(self, assertstruct=True):
         
-        packed = ""
-        packed += struct.pack("!I", ((self.class_ << 16) | (self.field << 9) | (self.hasmask << 8) | self.length))
+        codec = oxm_codec_map.get((self.class_, self.field, self.hasmask))
+        if codec is not None and codec.length == self.length:
+            return codec.pack(self.value, self.mask)
+        packed = OXM_TLV_HEADER.pack((self.class_ << 16) | (self.field << 9) | (self.hasmask << 8) | self.length)
+        # No codec: raw payload strings as unpacked, or a legacy length
+        if isinstance(self.value, str):
+            packed += self.value
+            if self.hasmask and isinstance(self.mask, str):
+                packed += self.mask
+            return packed
         if self.length == 1:
             packed += struct.pack("B", self.value)
             if self.hasmask:
@@ -46,6 +59,36 @@ class oxm_tlv:
     
     def __len__(self):
         return self.length + 4
+
+    def key(self):
+        """
+        Return a hashable tuple of the class, field, hasmask, value and mask
+        """
+        return (self.class_, self.field, bool(self.hasmask),
+                _oxm_hashable(self.value), _oxm_hashable(self.mask))
+
+    def canonical_key(self):
+        """
+        Return a hashable tuple of the class, field, value and mask, the
+        value masked and the mask None when it has all bits set, so
+        that TLVs matching the same packets have equal keys
+        """
+        value = self.value
+        mask = self.mask if self.hasmask else None
+        codec = oxm_codec_map.get((self.class_, self.field, False))
+        if codec is not None:
+            (value, mask) = codec.normalize(value, mask)
+        return (self.class_, self.field,
+                _oxm_hashable(value), _oxm_hashable(mask))
+
+    def __eq__(self, other):
+        if not isinstance(other, oxm_tlv): return False
+        return self.key() == other.key()
+
+    def __ne__(self, other): return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.key())
     
     def show(self, prefix=''):
         return "\n".join(
@@ -56,6 +99,11 @@ class oxm_tlv:
         "oxm_tlv_length: " + hex(self.length),
         "value: " + str(self.value),))
 
+def _oxm_hashable(value):
+    # MAC addresses are lists of ints
+    if isinstance(value, list):
+        return tuple(value)
+    return value
 
 def roundup (x,y): 
     return (((x) + ((y) - 1)) / (y) * (y))
@@ -71,6 +119,8 @@ class in_port(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_IN_PORT , hasmask, 4, value)
     def show(self, prefix=''):
@@ -90,6 +140,8 @@ class in_phy_port(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self,OFPXMT_OFB_IN_PHY_PORT, hasmask, 4, value)
     def show(self, prefix=''):
@@ -109,6 +161,8 @@ class metadata(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, mask = None):
         if mask == None:
             oxm_tlv.__init__(self, OFPXMT_OFB_METADATA, False, 8, value)
@@ -130,6 +184,8 @@ class eth_dst(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, mask = None):
         if mask == None:
             oxm_tlv.__init__(self, OFPXMT_OFB_ETH_DST, False, 6, value)
@@ -151,6 +207,8 @@ class eth_src(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_ETH_SRC, hasmask, 6, value)
@@ -172,6 +230,8 @@ class eth_type(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_ETH_TYPE, hasmask, 2, value)
     def show(self, prefix=''):
@@ -190,6 +250,8 @@ class vlan_vid(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_VLAN_VID, hasmask, 2, value)
     def show(self, prefix=''):
@@ -208,6 +270,8 @@ class vlan_pcp(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_VLAN_PCP, hasmask, 1, value)
     def show(self, prefix=''):
@@ -226,6 +290,8 @@ class ip_dscp(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_IP_DSCP, hasmask, 1, value)
     def show(self, prefix=''):
@@ -244,6 +310,8 @@ class ip_ecn(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_IP_ECN, hasmask, 1, value)
     def show(self, prefix=''):
@@ -262,6 +330,8 @@ class ip_proto(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_IP_PROTO, hasmask, 1, value)
     def show(self, prefix=''):
@@ -280,6 +350,8 @@ class ipv4_src(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_IPV4_SRC, hasmask, 4, value)
@@ -301,6 +373,8 @@ class ipv4_dst(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_IPV4_DST, hasmask, 4, value)
@@ -322,6 +396,8 @@ class tcp_src(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_TCP_SRC, hasmask, 2, value)
     def show(self, prefix=''):
@@ -340,6 +416,8 @@ class tcp_dst(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_TCP_DST, hasmask, 2, value)
     def show(self, prefix=''):
@@ -358,6 +436,8 @@ class udp_src(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_UDP_SRC, hasmask, 2, value)
     def show(self, prefix=''):
@@ -376,6 +456,8 @@ class udp_dst(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_UDP_DST, hasmask, 2, value)
     def show(self, prefix=''):
@@ -394,6 +476,8 @@ class sctp_src(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_SCTP_SRC, hasmask, 2, value)
     def show(self, prefix=''):
@@ -413,6 +497,8 @@ class sctp_dst(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_SCTP_DST, hasmask, 2, value)
     def show(self, prefix=''):
@@ -431,6 +517,8 @@ class icmpv4_type(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_ICMPV4_TYPE, hasmask, 1, value)
     def show(self, prefix=''):
@@ -449,6 +537,8 @@ class icmpv4_code(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_ICMPV4_CODE, hasmask, 1, value)
     def show(self, prefix=''):
@@ -467,6 +557,8 @@ class arp_op(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_ARP_OP, hasmask, 2, value)
     def show(self, prefix=''):
@@ -485,6 +577,8 @@ class arp_spa(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_ARP_SPA, hasmask, 4, value)
@@ -506,6 +600,8 @@ class arp_tpa(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_ARP_TPA, hasmask, 4, value)
@@ -528,6 +624,8 @@ class arp_sha(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_ARP_SHA, hasmask, 6, value)
@@ -549,6 +647,8 @@ class arp_tha(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_ARP_THA, hasmask, 6, value)
@@ -570,6 +670,8 @@ class ipv6_src(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_IPV6_SRC, False, 16, value)
@@ -591,6 +693,8 @@ class ipv6_dst(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_IPV6_DST, False, 16, value)
@@ -612,6 +716,8 @@ class ipv6_flabel(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         if not hasmask:
             oxm_tlv.__init__(self, OFPXMT_OFB_IPV6_FLABEL, hasmask, 4, value)
@@ -633,6 +739,8 @@ class icmpv6_type(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_ICMPV6_TYPE, hasmask, 1, value)
     def show(self, prefix=''):
@@ -651,6 +759,8 @@ class icmpv6_code(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_ICMPV6_CODE, hasmask, 1, value)
     def show(self, prefix=''):
@@ -669,6 +779,8 @@ class ipv6_nd_target(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_IPV6_ND_TARGET, hasmask, 16, value)
     def show(self, prefix=''):
@@ -687,6 +799,8 @@ class ipv6_nd_sll(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_IPV6_ND_SLL, hasmask, 6, value)
     def show(self, prefix=''):
@@ -705,6 +819,8 @@ class ipv6_nd_tll(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_IPV6_ND_TLL, hasmask, 6, value)          
     def show(self, prefix=''):
@@ -723,6 +839,8 @@ class mpls_label(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_MPLS_LABEL, hasmask, 4, value)
     def show(self, prefix=''):
@@ -741,6 +859,8 @@ class mpls_tc(oxm_tlv):
     @arg body
 
     """
+    __slots__ = ()
+
     def __init__(self, value, hasmask = False):
         oxm_tlv.__init__(self, OFPXMT_OFB_MPLS_TC, hasmask, 1, value)
     def show(self, prefix=''):
@@ -785,3 +905,161 @@ match_class_list = (
     ipv6_nd_tll,
     mpls_label,
     mpls_tc)
+
+
+################################################################
+#
+# OXM TLV codecs
+#
+################################################################
+
+# Formats of OXM TLV values
+OXM_INT = 0       # Integer
+OXM_MAC = 1       # MAC address as a list of 6 integers
+OXM_IPV6 = 2      # ipaddr.IPv6Address
+
+# Struct format code of integer values by width in bytes
+_oxm_int_codes = {1 : "B", 2 : "H", 4 : "L", 8 : "Q"}
+
+class oxm_codec(object):
+    """
+    Precompiled packing and typed unpacking of one kind of OXM TLV
+
+    @var tlv_class The match class built when unpacking, such as eth_dst
+    @var field The OXM field
+    @var hasmask True if the payload holds a mask after the value
+    @var kind The value format: OXM_INT, OXM_MAC or OXM_IPV6
+    @var length The payload length, including any mask
+    @var full The mask with all bits set of a value
+    @var header The TLV header as an integer
+    @var payload The struct.Struct of the payload
+    @var tlv The struct.Struct of the TLV header and integer payload
+    """
+    __slots__ = ['tlv_class', 'field', 'hasmask', 'kind', 'length', 'full',
+                 'header', 'payload', 'tlv']
+
+    def __init__(self, tlv_class, field, kind, width, hasmask):
+        self.tlv_class = tlv_class
+        self.field = field
+        self.hasmask = hasmask
+        self.kind = kind
+        if kind == OXM_INT:
+            code = _oxm_int_codes[width]
+            self.full = (1 << (8 * width)) - 1
+        elif kind == OXM_MAC:
+            code = "6B"
+            self.full = [0xff] * 6
+        else:
+            code = "QQ"
+            self.full = ipaddr.IPv6Address((1 << 128) - 1)
+        count = 2 if hasmask else 1
+        self.payload = struct.Struct("!" + code * count)
+        self.length = self.payload.size
+        self.header = ((OFPXMC_OPENFLOW_BASIC << 16) | (field << 9) |
+                       (hasmask << 8) | self.length)
+        self.tlv = struct.Struct("!I" + code * count)
+
+    def pack(self, value, mask=None):
+        """
+        Return the packed TLV, header included, of a value and mask
+        """
+        if self.kind == OXM_INT:
+            if self.hasmask:
+                return self.tlv.pack(self.header, value, mask)
+            return self.tlv.pack(self.header, value)
+        if self.kind == OXM_MAC:
+            if self.hasmask:
+                return self.tlv.pack(self.header, *(list(value) + list(mask)))
+            return self.tlv.pack(self.header, *value)
+        packed = OXM_TLV_HEADER.pack(self.header) + value.packed
+        if self.hasmask:
+            packed += mask.packed
+        return packed
+
+    def normalize(self, value, mask):
+        """
+        Return (value, mask) with the value masked, and None for the mask
+        if there is none or it has all bits set
+        """
+        if mask is None or mask == self.full:
+            return (value, None)
+        if self.kind == OXM_INT:
+            return (value & mask, mask)
+        if self.kind == OXM_MAC:
+            return ([v & m for (v, m) in zip(value, mask)], mask)
+        return (ipaddr.IPv6Address(int(value) & int(mask)), mask)
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Build the TLV object whose payload is at offset in buffer
+        """
+        fields = self.payload.unpack_from(buffer, offset)
+        mask = None
+        if self.kind == OXM_INT:
+            value = fields[0]
+            if self.hasmask:
+                mask = fields[1]
+        elif self.kind == OXM_MAC:
+            value = list(fields[:6])
+            if self.hasmask:
+                mask = list(fields[6:])
+        else:
+            value = ipaddr.IPv6Address(fields[0] << 64 | fields[1])
+            if self.hasmask:
+                mask = ipaddr.IPv6Address(fields[2] << 64 | fields[3])
+        # The match classes' constructors differ; fill in the slots
+        tlv = self.tlv_class.__new__(self.tlv_class)
+        tlv.class_ = OFPXMC_OPENFLOW_BASIC
+        tlv.field = self.field
+        tlv.hasmask = self.hasmask
+        tlv.length = self.length
+        tlv.value = value
+        tlv.mask = mask
+        return tlv
+
+# Match class, OXM field, value format and width of the basic OXM TLVs
+oxm_field_formats = [
+    (in_port,           OFPXMT_OFB_IN_PORT,         OXM_INT,    4),
+    (in_phy_port,       OFPXMT_OFB_IN_PHY_PORT,     OXM_INT,    4),
+    (metadata,          OFPXMT_OFB_METADATA,        OXM_INT,    8),
+    (eth_dst,           OFPXMT_OFB_ETH_DST,         OXM_MAC,    6),
+    (eth_src,           OFPXMT_OFB_ETH_SRC,         OXM_MAC,    6),
+    (eth_type,          OFPXMT_OFB_ETH_TYPE,        OXM_INT,    2),
+    (vlan_vid,          OFPXMT_OFB_VLAN_VID,        OXM_INT,    2),
+    (vlan_pcp,          OFPXMT_OFB_VLAN_PCP,        OXM_INT,    1),
+    (ip_dscp,           OFPXMT_OFB_IP_DSCP,         OXM_INT,    1),
+    (ip_ecn,            OFPXMT_OFB_IP_ECN,          OXM_INT,    1),
+    (ip_proto,          OFPXMT_OFB_IP_PROTO,        OXM_INT,    1),
+    (ipv4_src,          OFPXMT_OFB_IPV4_SRC,        OXM_INT,    4),
+    (ipv4_dst,          OFPXMT_OFB_IPV4_DST,        OXM_INT,    4),
+    (tcp_src,           OFPXMT_OFB_TCP_SRC,         OXM_INT,    2),
+    (tcp_dst,           OFPXMT_OFB_TCP_DST,         OXM_INT,    2),
+    (udp_src,           OFPXMT_OFB_UDP_SRC,         OXM_INT,    2),
+    (udp_dst,           OFPXMT_OFB_UDP_DST,         OXM_INT,    2),
+    (sctp_src,          OFPXMT_OFB_SCTP_SRC,        OXM_INT,    2),
+    (sctp_dst,          OFPXMT_OFB_SCTP_DST,        OXM_INT,    2),
+    (icmpv4_type,       OFPXMT_OFB_ICMPV4_TYPE,     OXM_INT,    1),
+    (icmpv4_code,       OFPXMT_OFB_ICMPV4_CODE,     OXM_INT,    1),
+    (arp_op,            OFPXMT_OFB_ARP_OP,          OXM_INT,    2),
+    (arp_spa,           OFPXMT_OFB_ARP_SPA,         OXM_INT,    4),
+    (arp_tpa,           OFPXMT_OFB_ARP_TPA,         OXM_INT,    4),
+    (arp_sha,           OFPXMT_OFB_ARP_SHA,         OXM_MAC,    6),
+    (arp_tha,           OFPXMT_OFB_ARP_THA,         OXM_MAC,    6),
+    (ipv6_src,          OFPXMT_OFB_IPV6_SRC,        OXM_IPV6,   16),
+    (ipv6_dst,          OFPXMT_OFB_IPV6_DST,        OXM_IPV6,   16),
+    (ipv6_flabel,       OFPXMT_OFB_IPV6_FLABEL,     OXM_INT,    4),
+    (icmpv6_type,       OFPXMT_OFB_ICMPV6_TYPE,     OXM_INT,    1),
+    (icmpv6_code,       OFPXMT_OFB_ICMPV6_CODE,     OXM_INT,    1),
+    (ipv6_nd_target,    OFPXMT_OFB_IPV6_ND_TARGET,  OXM_IPV6,   16),
+    (ipv6_nd_sll,       OFPXMT_OFB_IPV6_ND_SLL,     OXM_MAC,    6),
+    (ipv6_nd_tll,       OFPXMT_OFB_IPV6_ND_TLL,     OXM_MAC,    6),
+    (mpls_label,        OFPXMT_OFB_MPLS_LABEL,      OXM_INT,    4),
+    (mpls_tc,           OFPXMT_OFB_MPLS_TC,         OXM_INT,    1),
+]
+
+# Map from (OXM class, field, hasmask) to oxm_codec
+oxm_codec_map = {}
+for (_tlv_class, _field, _kind, _width) in oxm_field_formats:
+    for _hasmask in [False, True]:
+        oxm_codec_map[(OFPXMC_OPENFLOW_BASIC, _field, _hasmask)] = \
+            oxm_codec(_tlv_class, _field, _kind, _width, _hasmask)
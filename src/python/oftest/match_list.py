@@ -2,10 +2,14 @@ import struct
 import oftest.match as match
 from match import oxm_tlv
 from binascii import b2a_hex
-from base_list import ofp_base_list
+from base_list import ofp_base_list, buffer_bytes
+
+# OXM TLV header: class, field and hasmask, payload length
+OXM_HEADER = struct.Struct("!HBB")
 
 
 class match_list(ofp_base_list):
+    __slots__ = ['tlvs']
 
     def __init__(self):
         ofp_base_list.__init__(self)
@@ -15,31 +19,43 @@ class match_list(ofp_base_list):
 
     def __len__(self):
         return sum([len(i) for i in self])
+
+    def canonical_key(self):
+        """
+        Return a hashable key of the match, the same for matches of the
+        same packets whatever the order of their TLVs
+
+        The key is the sorted tuple of the TLV canonical keys, padding
+        TLVs left out.  Use it to index flows in a dict or set.
+        """
+        return tuple(sorted([tlv.canonical_key() for tlv in self.tlvs
+                             if tlv.class_]))
     
-    def unpack(self, binary_string, bytes=None):
+    def unpack_from(self, buffer, offset=0, bytes=None):
         if bytes <= 4:
-            return binary_string[4:]
+            return offset + 4
         if bytes == None:
-            bytes = len(binary_string)
-        offset = 0
-        cur_string = binary_string
-        while offset < bytes:
-            read = 0
-            oxm_class, oxm_fieldhm, oxm_length = struct.unpack("!HBB", cur_string[read:read+4])   
+            bytes = len(buffer) - offset
+        end = offset + bytes
+        while offset < end:
+            oxm_class, oxm_fieldhm, oxm_length = OXM_HEADER.unpack_from(buffer, offset)
             #Found padding bytes?
             if not oxm_class:
                 break
             oxm_field = oxm_fieldhm >> 1
             oxm_hasmask = oxm_fieldhm & 0x00000001
-            payload = struct.unpack("!" + str(oxm_length) + "s", cur_string[read+4:read+4+oxm_length])[0]
-            if oxm_hasmask:
-                value, mask = payload[:oxm_length/2], payload[oxm_length/2:]    
-            else: 
-                value, mask = payload, None
-            oxm = oxm_tlv(oxm_field, oxm_hasmask, oxm_length, value,mask, oxm_class)
+            codec = match.oxm_codec_map.get((oxm_class, oxm_field, oxm_hasmask))
+            if codec is not None and codec.length == oxm_length:
+                oxm = codec.unpack_from(buffer, offset + 4)
+            else:
+                # Unknown field: keep the raw payload strings
+                payload = buffer_bytes(buffer, offset+4, offset+4+oxm_length)
+                if oxm_hasmask:
+                    value, mask = payload[:oxm_length/2], payload[oxm_length/2:]    
+                else: 
+                    value, mask = payload, None
+                oxm = oxm_tlv(oxm_field, oxm_hasmask, oxm_length, value,mask, oxm_class)
             self.tlvs.append(oxm)
-            read = 4 + oxm_length
-            offset += read
-            cur_string = cur_string[read:]
+            offset += 4 + oxm_length
             
-        return cur_string
+        return offset
@@ -5,6 +5,8 @@ from cstruct import *
 from match import oxm_tlv
 from match import roundup
 from match_list import match_list
+from base_list import buffer_bytes
+from stats_list import lazy_stats_list, FLOW_STATS_FIELDS
 from action_list import action_list
 from instruction_list import instruction_list
 from bucket_list import bucket_list
@@ -124,6 +126,7 @@ class barrier_reply(object):
 
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         self.header = ofp_header()
@@ -151,10 +154,23 @@ class barrier_reply(object):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
 
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -217,6 +233,7 @@ class barrier_request(object):
 
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         self.header = ofp_header()
@@ -244,10 +261,23 @@ class barrier_request(object):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
 
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -311,6 +341,7 @@ class echo_reply(object):
     @arg data: Binary string following message members
 
     """
+    __slots__ = ['header', 'data']
 
     def __init__(self):
         self.header = ofp_header()
@@ -340,11 +371,26 @@ class echo_reply(object):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
 
-        self.data = binary_string
-        binary_string = ''
-        return binary_string
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+
+        self.data = buffer_bytes(buffer, offset, end)
+        offset = max(offset, end)
+        return offset
 
     def __len__(self):
         """
@@ -418,6 +464,7 @@ class echo_request(object):
     @arg data: Binary string following message members
 
     """
+    __slots__ = ['header', 'data']
 
     def __init__(self):
         self.header = ofp_header()
@@ -447,11 +494,26 @@ class echo_request(object):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
 
-        self.data = binary_string
-        binary_string = ''
-        return binary_string
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+
+        self.data = buffer_bytes(buffer, offset, end)
+        offset = max(offset, end)
+        return offset
 
     def __len__(self):
         """
@@ -528,6 +590,7 @@ class error(ofp_error_msg):
     @arg data: Binary string following message members
 
     """
+    __slots__ = ['header', 'data']
 
     def __init__(self):
         ofp_error_msg.__init__(self)
@@ -559,12 +622,27 @@ class error(ofp_error_msg):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
 
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        binary_string = ''
-        return binary_string
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        self.data = buffer_bytes(buffer, offset, end)
+        offset = max(offset, end)
+        return offset
 
     def __len__(self):
         """
@@ -644,6 +722,7 @@ class experimenter(ofp_experimenter_header):
     @arg data: Binary string following message members
 
     """
+    __slots__ = ['header', 'data']
 
     def __init__(self):
         ofp_experimenter_header.__init__(self)
@@ -675,12 +754,27 @@ class experimenter(ofp_experimenter_header):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
 
-        binary_string = ofp_experimenter_header.unpack(self, binary_string)
-        self.data = binary_string
-        binary_string = ''
-        return binary_string
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+
+        offset = ofp_experimenter_header.unpack_from(self, buffer, offset)
+        self.data = buffer_bytes(buffer, offset, end)
+        offset = max(offset, end)
+        return offset
 
     def __len__(self):
         """
@@ -763,6 +857,7 @@ class features_reply(ofp_switch_features):
     @arg ports: Variable length array of TBD
 
     """
+    __slots__ = ['header', 'ports']
 
     def __init__(self):
         ofp_switch_features.__init__(self)
@@ -795,15 +890,30 @@ class features_reply(ofp_switch_features):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
 
-        binary_string = ofp_switch_features.unpack(self, binary_string)
-        while len(binary_string) >= OFP_PORT_BYTES:
+        offset = ofp_switch_features.unpack_from(self, buffer, offset)
+        while end - offset >= OFP_PORT_BYTES:
             new_port = ofp_port()
-            binary_string = new_port.unpack(binary_string)
+            offset = new_port.unpack_from(buffer, offset)
             self.ports.append(new_port)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -875,6 +985,7 @@ class features_request(object):
 
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         self.header = ofp_header()
@@ -902,10 +1013,23 @@ class features_request(object):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
 
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -982,6 +1106,7 @@ class flow_mod(ofp_flow_mod):
     @arg instructions: Object of type instruction_list
 
     """
+    __slots__ = ['header', 'match_fields', 'instructions']
 
     def __init__(self):
         ofp_flow_mod.__init__(self)
@@ -1030,16 +1155,28 @@ class flow_mod(ofp_flow_mod):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_flow_mod.unpack(self, binary_string)
-        binary_string = self.match_fields.unpack(binary_string, bytes = self.match.length - 4)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_flow_mod.unpack_from(self, buffer, offset)
+        offset = self.match_fields.unpack_from(buffer, offset, bytes = self.match.length - 4)
         padding = roundup(OFP_FLOW_MOD_BYTES + len(self.match_fields),8) - (OFP_FLOW_MOD_BYTES + len(self.match_fields))
-        if padding:
-            binary_string = binary_string[padding:]
+        offset += padding
         ai_len = self.length - roundup(OFP_FLOW_MOD_BYTES + len(self.match_fields),8)
-        binary_string = self.instructions.unpack(binary_string, bytes=ai_len)
+        offset = self.instructions.unpack_from(buffer, offset, bytes=ai_len)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -1124,6 +1261,7 @@ class flow_removed(ofp_flow_removed):
     @arg match
 
     """
+    __slots__ = ['header', 'match_fields']
 
     def __init__(self):
         ofp_flow_removed.__init__(self)
@@ -1165,14 +1303,26 @@ class flow_removed(ofp_flow_removed):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_flow_removed.unpack(self, binary_string)
-        binary_string = self.match_fields.unpack(binary_string, bytes = self.match.length - 4)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_flow_removed.unpack_from(self, buffer, offset)
+        offset = self.match_fields.unpack_from(buffer, offset, bytes = self.match.length - 4)
         padding = roundup(OFP_FLOW_REMOVED_BYTES + len(self.match_fields),8) - (OFP_FLOW_REMOVED_BYTES + len(self.match_fields))
-        if padding:
-            binary_string = binary_string[padding:]
+        offset += padding
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -1241,6 +1391,7 @@ class get_config_reply(ofp_switch_config):
     @arg miss_send_len
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         ofp_switch_config.__init__(self)
@@ -1270,11 +1421,24 @@ class get_config_reply(ofp_switch_config):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
 
-        binary_string = ofp_switch_config.unpack(self, binary_string)
+        """
+        offset = self.header.unpack_from(buffer, offset)
+
+        offset = ofp_switch_config.unpack_from(self, buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -1340,6 +1504,7 @@ class get_config_request(object):
 
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         self.header = ofp_header()
@@ -1367,10 +1532,23 @@ class get_config_request(object):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
 
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -1438,6 +1616,7 @@ class group_mod(ofp_group_mod):
     @arg buckets: Object of type bucket_list
 
     """
+    __slots__ = ['header', 'buckets']
 
     def __init__(self):
         ofp_group_mod.__init__(self)
@@ -1469,12 +1648,27 @@ class group_mod(ofp_group_mod):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
 
-        binary_string = ofp_group_mod.unpack(self, binary_string)
-        binary_string = self.buckets.unpack(binary_string)
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+
+        offset = ofp_group_mod.unpack_from(self, buffer, offset)
+        offset = self.buckets.unpack_from(buffer, offset, end - offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -1545,6 +1739,7 @@ class hello(object):
     @arg data: Binary string following message members
 
     """
+    __slots__ = ['header', 'data']
 
     def __init__(self):
         self.header = ofp_header()
@@ -1574,11 +1769,26 @@ class hello(object):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
 
-        self.data = binary_string
-        binary_string = ''
-        return binary_string
+        self.data = buffer_bytes(buffer, offset, end)
+        offset = max(offset, end)
+        return offset
 
     def __len__(self):
         """
@@ -1658,6 +1868,7 @@ class packet_in(ofp_packet_in):
     @arg data: Binary string following message members
 
     """
+    __slots__ = ['header', 'match_fields', 'data']
 
     def __init__(self):
         ofp_packet_in.__init__(self)
@@ -1701,16 +1912,30 @@ class packet_in(ofp_packet_in):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_packet_in.unpack(self, binary_string)
-        binary_string = self.match_fields.unpack(binary_string, bytes = self.match.length - 4)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_packet_in.unpack_from(self, buffer, offset)
+        offset = self.match_fields.unpack_from(buffer, offset, bytes = self.match.length - 4)
         padding = roundup(OFP_PACKET_IN_BYTES + len(self.match_fields),8) - (OFP_PACKET_IN_BYTES + len(self.match_fields))
-        if padding:
-            binary_string = binary_string[padding:]
-        binary_string = binary_string[2:]
-        self.data = binary_string
-        binary_string = ''
-        return binary_string
+        offset += padding
+        offset += 2
+        self.data = buffer_bytes(buffer, offset, end)
+        offset = max(offset, end)
+        return offset
 
     def __len__(self):
         """
@@ -1792,6 +2017,7 @@ class packet_out(ofp_packet_out):
     @arg data: Binary string following message members
 
     """
+    __slots__ = ['header', 'actions', 'data']
 
     def __init__(self):
         ofp_packet_out.__init__(self)
@@ -1826,13 +2052,28 @@ class packet_out(ofp_packet_out):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
 
-        binary_string = ofp_packet_out.unpack(self, binary_string)
-        binary_string = self.actions.unpack(binary_string, bytes=self.actions_len)
-        self.data = binary_string
-        binary_string = ''
-        return binary_string
+        offset = ofp_packet_out.unpack_from(self, buffer, offset)
+        offset = self.actions.unpack_from(buffer, offset, bytes=self.actions_len)
+        self.data = buffer_bytes(buffer, offset, end)
+        offset = max(offset, end)
+        return offset
 
     def __len__(self):
         """
@@ -1918,6 +2159,7 @@ class port_mod(ofp_port_mod):
     @arg advertise
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         ofp_port_mod.__init__(self)
@@ -1947,11 +2189,24 @@ class port_mod(ofp_port_mod):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
 
-        binary_string = ofp_port_mod.unpack(self, binary_string)
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
+
+        offset = ofp_port_mod.unpack_from(self, buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -2020,6 +2275,7 @@ class port_status(ofp_port_status):
     @arg desc
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         ofp_port_status.__init__(self)
@@ -2049,11 +2305,24 @@ class port_status(ofp_port_status):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
 
-        binary_string = ofp_port_status.unpack(self, binary_string)
+        """
+        offset = self.header.unpack_from(buffer, offset)
+
+        offset = ofp_port_status.unpack_from(self, buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -2122,6 +2391,7 @@ class queue_get_config_reply(ofp_queue_get_config_reply):
     @arg queues: Variable length array of TBD
 
     """
+    __slots__ = ['header', 'queues']
 
     def __init__(self):
         ofp_queue_get_config_reply.__init__(self)
@@ -2154,13 +2424,26 @@ class queue_get_config_reply(ofp_queue_get_config_reply):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
 
-        binary_string = ofp_queue_get_config_reply.unpack(self, binary_string)
+        """
+        offset = self.header.unpack_from(buffer, offset)
+
+        offset = ofp_queue_get_config_reply.unpack_from(self, buffer, offset)
         for obj in self.queues:
-            binary_string = obj.unpack(binary_string)
+            offset = obj.unpack_from(buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -2234,6 +2517,7 @@ class queue_get_config_request(ofp_queue_get_config_request):
     @arg port
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         ofp_queue_get_config_request.__init__(self)
@@ -2263,11 +2547,24 @@ class queue_get_config_request(ofp_queue_get_config_request):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
 
-        binary_string = ofp_queue_get_config_request.unpack(self, binary_string)
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
+
+        offset = ofp_queue_get_config_request.unpack_from(self, buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -2336,6 +2633,7 @@ class set_config(ofp_switch_config):
     @arg miss_send_len
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         ofp_switch_config.__init__(self)
@@ -2365,11 +2663,24 @@ class set_config(ofp_switch_config):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
 
-        binary_string = ofp_switch_config.unpack(self, binary_string)
+        offset = ofp_switch_config.unpack_from(self, buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -2438,6 +2749,7 @@ class stats_reply(ofp_stats_reply):
     @arg flags
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         ofp_stats_reply.__init__(self)
@@ -2467,11 +2779,24 @@ class stats_reply(ofp_stats_reply):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
 
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
+
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -2540,6 +2865,7 @@ class stats_request(ofp_stats_request):
     @arg flags
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         ofp_stats_request.__init__(self)
@@ -2569,11 +2895,24 @@ class stats_request(ofp_stats_request):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
 
-        binary_string = ofp_stats_request.unpack(self, binary_string)
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -2642,6 +2981,7 @@ class table_mod(ofp_table_mod):
     @arg config
 
     """
+    __slots__ = ['header']
 
     def __init__(self):
         ofp_table_mod.__init__(self)
@@ -2671,11 +3011,24 @@ class table_mod(ofp_table_mod):
         @return The remainder of binary_string that was not parsed.
 
         """
-        binary_string = self.header.unpack(binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        """
+        Unpack object from a buffer at an offset without copying it
 
-        binary_string = ofp_table_mod.unpack(self, binary_string)
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        """
+        offset = self.header.unpack_from(buffer, offset)
+
+        offset = ofp_table_mod.unpack_from(self, buffer, offset)
         # Fixme: If no self.data, add check for data remaining
-        return binary_string
+        return offset
 
     def __len__(self):
         """
@@ -2749,7 +3102,9 @@ class ofp_desc_stats_request(object):
     def pack(self, assertstruct=True):
         return ""
     def unpack(self, binary_string):
-        return binary_string
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        return offset
     def __len__(self):
         return 0
     def show(self, prefix=''):
@@ -2770,7 +3125,9 @@ class ofp_table_stats_request(object):
     def pack(self, assertstruct=True):
         return ""
     def unpack(self, binary_string):
-        return binary_string
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        return offset
     def __len__(self):
         return 0
     def show(self, prefix=''):
@@ -2791,7 +3148,9 @@ class ofp_group_desc_stats_request(object):
     def pack(self, assertstruct=True):
         return ""
     def unpack(self, binary_string):
-        return binary_string
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        return offset
     def __len__(self):
         return 0
     def show(self, prefix=''):
@@ -2826,6 +3185,8 @@ class flow_stats_entry(ofp_flow_stats):
     """
     Special case flow stats entry to handle action list object
     """
+    __slots__ = ['match_fields', 'instructions']
+
     def __init__(self):
         ofp_flow_stats.__init__(self)
         self.match_fields = match_list()
@@ -2853,17 +3214,19 @@ class flow_stats_entry(ofp_flow_stats):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = ofp_flow_stats.unpack(self, binary_string)
-        binary_string = self.match_fields.unpack(binary_string, bytes = self.match.length - 4)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        offset = ofp_flow_stats.unpack_from(self, buffer, offset)
+        offset = self.match_fields.unpack_from(buffer, offset, bytes = self.match.length - 4)
         padding = roundup((OFP_FLOW_STATS_BYTES -4) + self.match.length,8) - ((OFP_FLOW_STATS_BYTES - 4) + self.match.length)
-        if padding:
-            binary_string = binary_string[padding:]
+        offset += padding
         ai_len = self.length - roundup(OFP_FLOW_STATS_BYTES + len(self.match_fields),8)
         if ai_len < 0:
             print("ERROR: flow_stats_entry unpack length too small",
                   self.length)
-        binary_string = self.instructions.unpack(binary_string, bytes=ai_len)
-        return binary_string
+        offset = self.instructions.unpack_from(buffer, offset, bytes=ai_len)
+        return offset
 
     def __len__(self):
         return roundup(OFP_FLOW_STATS_BYTES + len(self.match_fields),8) + len(self.instructions)
@@ -2916,16 +3279,20 @@ class aggregate_stats_request(ofp_stats_request, ofp_aggregate_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_aggregate_stats_request.unpack(self, binary_string)
-        binary_string = self.match_fields.unpack(binary_string, bytes = self.match.length - 4)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_aggregate_stats_request.unpack_from(self, buffer, offset)
+        offset = self.match_fields.unpack_from(buffer, offset, bytes = self.match.length - 4)
         padding = roundup(OFP_AGGREGATE_STATS_REQUEST_BYTES + len(self.match_fields),8) - (OFP_AGGREGATE_STATS_REQUEST_BYTES + len(self.match_fields))
-        if padding:
-            binary_string = binary_string[padding:]
-        if len(binary_string) != 0:
+        offset += padding
+        if offset != end:
             print "ERROR unpacking flow: extra data"
-        return binary_string
+        return offset
     
     
     def __len__(self):
@@ -2957,6 +3324,8 @@ class aggregate_stats_reply(ofp_stats_reply):
     """
     Wrapper class for aggregate stats reply
     """
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -2974,16 +3343,21 @@ class aggregate_stats_reply(ofp_stats_reply):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
         dummy = aggregate_stats_entry()
-        while len(binary_string) >= len(dummy):
+        while end - offset >= len(dummy):
             obj = aggregate_stats_entry()
-            binary_string = obj.unpack(binary_string)
+            offset = obj.unpack_from(buffer, offset)
             self.stats.append(obj)
-        if len(binary_string) != 0:
+        if offset != end:
             print "ERROR unpacking aggregate stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -3029,12 +3403,17 @@ class desc_stats_request(ofp_stats_request, ofp_desc_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_desc_stats_request.unpack(self, binary_string)
-        if len(binary_string) != 0:
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_desc_stats_request.unpack_from(self, buffer, offset)
+        if offset != end:
             print "ERROR unpacking desc: extra data"
-        return binary_string
+        return offset
 
     def __len__(self):
         return len(self.header) + OFP_STATS_REQUEST_BYTES + \
@@ -3061,6 +3440,8 @@ class desc_stats_reply(ofp_stats_reply):
     """
     Wrapper class for desc stats reply
     """
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -3078,16 +3459,21 @@ class desc_stats_reply(ofp_stats_reply):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
         dummy = desc_stats_entry()
-        while len(binary_string) >= len(dummy):
+        while end - offset >= len(dummy):
             obj = desc_stats_entry()
-            binary_string = obj.unpack(binary_string)
+            offset = obj.unpack_from(buffer, offset)
             self.stats.append(obj)
-        if len(binary_string) != 0:
+        if offset != end:
             print "ERROR unpacking desc stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -3146,16 +3532,20 @@ class flow_stats_request(ofp_stats_request, ofp_flow_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_flow_stats_request.unpack(self, binary_string)
-        binary_string = self.match_fields.unpack(binary_string, bytes = self.match.length - 4)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_flow_stats_request.unpack_from(self, buffer, offset)
+        offset = self.match_fields.unpack_from(buffer, offset, bytes = self.match.length - 4)
         padding = roundup(OFP_FLOW_STATS_REQUEST_BYTES + len(self.match_fields),8) - (OFP_FLOW_STATS_REQUEST_BYTES + len(self.match_fields))
-        if padding:
-            binary_string = binary_string[padding:]
-        if len(binary_string) != 0:
+        offset += padding
+        if offset != end:
             print "ERROR unpacking flow: extra data"
-        return binary_string
+        return offset
 
     def __len__(self):
             length = len(self.header) + OFP_STATS_REQUEST_BYTES + \
@@ -3188,6 +3578,8 @@ class flow_stats_reply(ofp_stats_reply):
     """
     Wrapper class for flow stats reply
     """
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -3204,17 +3596,27 @@ class flow_stats_reply(ofp_stats_reply):
             packed += obj.pack()
         return packed
 
-    def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
-        dummy = flow_stats_entry()
-        while len(binary_string) >= len(dummy):
-            obj = flow_stats_entry()
-            binary_string = obj.unpack(binary_string)
-            self.stats.append(obj)
-        if len(binary_string) != 0:
+    def unpack(self, binary_string, lazy=False):
+        return binary_string[self.unpack_from(binary_string, lazy=lazy):]
+
+    def unpack_from(self, buffer, offset=0, lazy=False):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
+        if lazy:
+            # Keep the entries packed in a lazy_stats_list
+            self.stats = lazy_stats_list(flow_stats_entry, FLOW_STATS_FIELDS)
+            offset = self.stats.unpack_from(buffer, offset, end - offset)
+        else:
+            dummy = flow_stats_entry()
+            while end - offset >= len(dummy):
+                obj = flow_stats_entry()
+                offset = obj.unpack_from(buffer, offset)
+                self.stats.append(obj)
+        if offset != end:
             print "ERROR unpacking flow stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -3260,12 +3662,17 @@ class port_stats_request(ofp_stats_request, ofp_port_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_port_stats_request.unpack(self, binary_string)
-        if len(binary_string) != 0:
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_port_stats_request.unpack_from(self, buffer, offset)
+        if offset != end:
             print "ERROR unpacking port: extra data"
-        return binary_string
+        return offset
 
     def __len__(self):
         return len(self.header) + OFP_STATS_REQUEST_BYTES + \
@@ -3292,6 +3699,8 @@ class port_stats_reply(ofp_stats_reply):
     """
     Wrapper class for port stats reply
     """
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -3309,16 +3718,21 @@ class port_stats_reply(ofp_stats_reply):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
         dummy = port_stats_entry()
-        while len(binary_string) >= len(dummy):
+        while end - offset >= len(dummy):
             obj = port_stats_entry()
-            binary_string = obj.unpack(binary_string)
+            offset = obj.unpack_from(buffer, offset)
             self.stats.append(obj)
-        if len(binary_string) != 0:
+        if offset != end:
             print "ERROR unpacking port stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -3364,12 +3778,17 @@ class queue_stats_request(ofp_stats_request, ofp_queue_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_queue_stats_request.unpack(self, binary_string)
-        if len(binary_string) != 0:
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_queue_stats_request.unpack_from(self, buffer, offset)
+        if offset != end:
             print "ERROR unpacking queue: extra data"
-        return binary_string
+        return offset
 
     def __len__(self):
         return len(self.header) + OFP_STATS_REQUEST_BYTES + \
@@ -3396,6 +3815,8 @@ class queue_stats_reply(ofp_stats_reply):
     """
     Wrapper class for queue stats reply
     """
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -3413,16 +3834,21 @@ class queue_stats_reply(ofp_stats_reply):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
         dummy = queue_stats_entry()
-        while len(binary_string) >= len(dummy):
+        while end - offset >= len(dummy):
             obj = queue_stats_entry()
-            binary_string = obj.unpack(binary_string)
+            offset = obj.unpack_from(buffer, offset)
             self.stats.append(obj)
-        if len(binary_string) != 0:
+        if offset != end:
             print "ERROR unpacking queue stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -3468,12 +3894,17 @@ class group_stats_request(ofp_stats_request, ofp_group_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_group_stats_request.unpack(self, binary_string)
-        if len(binary_string) != 0:
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_group_stats_request.unpack_from(self, buffer, offset)
+        if offset != end:
             print "ERROR unpacking group: extra data"
-        return binary_string
+        return offset
 
     def __len__(self):
         return len(self.header) + OFP_STATS_REQUEST_BYTES + \
@@ -3500,6 +3931,8 @@ class group_stats_reply(ofp_stats_reply):
     """
     Wrapper class for group stats reply
     """
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -3517,16 +3950,21 @@ class group_stats_reply(ofp_stats_reply):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
         dummy = group_stats_entry()
-        while len(binary_string) >= len(dummy):
+        while end - offset >= len(dummy):
             obj = group_stats_entry()
-            binary_string = obj.unpack(binary_string)
+            offset = obj.unpack_from(buffer, offset)
             self.stats.append(obj)
-        if len(binary_string) != 0:
+        if offset != end:
             print "ERROR unpacking group stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -3572,12 +4010,17 @@ class group_desc_stats_request(ofp_stats_request, ofp_group_desc_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_group_desc_stats_request.unpack(self, binary_string)
-        if len(binary_string) != 0:
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_group_desc_stats_request.unpack_from(self, buffer, offset)
+        if offset != end:
             print "ERROR unpacking group_desc: extra data"
-        return binary_string
+        return offset
 
     def __len__(self):
         return len(self.header) + OFP_STATS_REQUEST_BYTES + \
@@ -3604,6 +4047,8 @@ class group_desc_stats_reply(ofp_stats_reply):
     """
     Wrapper class for group_desc stats reply
     """
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -3621,16 +4066,21 @@ class group_desc_stats_reply(ofp_stats_reply):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
         dummy = group_desc_stats_entry()
-        while len(binary_string) >= len(dummy):
+        while end - offset >= len(dummy):
             obj = group_desc_stats_entry()
-            binary_string = obj.unpack(binary_string)
+            offset = obj.unpack_from(buffer, offset)
             self.stats.append(obj)
-        if len(binary_string) != 0:
+        if offset != end:
             print "ERROR unpacking group_desc stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -3676,12 +4126,17 @@ class table_stats_request(ofp_stats_request, ofp_table_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_table_stats_request.unpack(self, binary_string)
-        if len(binary_string) != 0:
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_table_stats_request.unpack_from(self, buffer, offset)
+        if offset != end:
             print "ERROR unpacking table: extra data"
-        return binary_string
+        return offset
 
     def __len__(self):
         return len(self.header) + OFP_STATS_REQUEST_BYTES + \
@@ -3708,6 +4163,8 @@ class table_stats_reply(ofp_stats_reply):
     """
     Wrapper class for table stats reply
     """
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -3725,16 +4182,21 @@ class table_stats_reply(ofp_stats_reply):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
         dummy = table_stats_entry()
-        while len(binary_string) >= len(dummy):
+        while end - offset >= len(dummy):
             obj = table_stats_entry()
-            binary_string = obj.unpack(binary_string)
+            offset = obj.unpack_from(buffer, offset)
             self.stats.append(obj)
-        if len(binary_string) != 0:
+        if offset != end:
             print "ERROR unpacking table stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -5,6 +5,11 @@ from oftest import message
 from oftest import action
 from oftest import instruction
 from oftest import cstruct as ofp
+from oftest import match as match_
+from oftest import bucket
+from oftest import parse
+from oftest.match_list import match_list
+import ipaddr
 
 class flow_stats_pack(unittest.TestCase):
     def runTest(self):
@@ -35,6 +40,241 @@ class match_pack(unittest.TestCase):
         match = ofp.ofp_match()
         self.assertEqual(len(match.pack()), 88)
         
-        
+class unpack_from_buffer(unittest.TestCase):
+    def runTest(self):
+        # Several messages back to back in one buffer, decoded in place
+        pin = message.packet_in()
+        pin.match_fields.add(match_.in_port(3))
+        pin.data = "abcdefgh" * 4
+        echo = message.echo_request()
+        echo.data = "hello"
+        rep = message.flow_stats_reply()
+        for idx in range(3):
+            entry = message.flow_stats_entry()
+            entry.priority = idx
+            entry.match_fields.add(match_.in_port(idx + 1))
+            inst = instruction.instruction_apply_actions()
+            act = action.action_output()
+            act.port = idx
+            inst.actions.add(act)
+            entry.instructions.add(inst)
+            rep.stats.append(entry)
+        packed = [pin.pack(), echo.pack(), rep.pack()]
+        view = memoryview(bytearray("".join(packed)))
+        offset = 0
+        for pkt in packed:
+            obj = parse.of_message_parse(view, offset=offset)
+            ref = parse.of_message_parse(pkt)
+            self.assertEqual(obj.show(), ref.show())
+            end = type(obj)().unpack_from(view, offset)
+            self.assertEqual(end, offset + len(pkt))
+            offset = end
+        obj = parse.of_message_parse(view, offset=len(packed[0]))
+        self.assertEqual(obj.data, "hello")
+        obj = parse.of_message_parse(view, offset=len(packed[0]) +
+                                     len(packed[1]))
+        self.assertEqual(len(obj.stats), 3)
+        self.assertEqual(obj.stats[2].priority, 2)
+        self.assertEqual(obj.stats[2].instructions.instructions[0].
+                         actions.actions[0].port, 2)
+
+class group_mod_buckets_unpack(unittest.TestCase):
+    def runTest(self):
+        msg = message.group_mod()
+        for port in [1, 2]:
+            b = bucket.bucket()
+            act = action.action_output()
+            act.port = port
+            b.actions.add(act)
+            msg.buckets.add(b)
+        obj = message.group_mod()
+        self.assertEqual(obj.unpack(msg.pack()), "")
+        self.assertEqual(len(obj.buckets.buckets), 2)
+        self.assertEqual(obj.buckets.buckets[1].actions.actions[0].port, 2)
+
+class flow_stats_reply_lazy(unittest.TestCase):
+    def runTest(self):
+        rep = message.flow_stats_reply()
+        for idx in range(4):
+            entry = message.flow_stats_entry()
+            entry.priority = idx
+            entry.packet_count = idx * 10
+            entry.byte_count = idx * 640
+            entry.match_fields.add(match_.in_port(idx + 1))
+            rep.stats.append(entry)
+        packed = rep.pack()
+        eager = message.flow_stats_reply()
+        eager.unpack(packed)
+        self.assertEqual(type(eager.stats), list)
+        lazy = message.flow_stats_reply()
+        self.assertEqual(lazy.unpack(packed, lazy=True), "")
+        other = parse.of_message_parse(memoryview(packed), lazy=True)
+        self.assertEqual(len(lazy.stats), 4)
+        self.assertEqual(lazy.stats.packet_count(3), 30)
+        self.assertEqual(lazy.stats.byte_count(-1), 1920)
+        self.assertEqual(lazy.stats.field(2, "priority"), 2)
+        self.assertEqual(lazy.stats, eager.stats)
+        self.assertEqual(lazy.show(), eager.show())
+        self.assertEqual([e.priority for e in lazy.stats[1:3]], [1, 2])
+        lazy.stats[0].packet_count = 5
+        self.assertEqual(lazy.stats.packet_count(0), 5)
+        lazy.stats.extend(other.stats)
+        self.assertEqual(len(lazy.stats), 8)
+        self.assertEqual(lazy.stats.packet_count(7), 30)
+        self.assertEqual(lazy.stats[6], eager.stats[2])
+        self.assertRaises(IndexError, lazy.stats.__getitem__, 8)
+
+class parse_dispatch(unittest.TestCase):
+    def runTest(self):
+        class acme_experimenter(message.experimenter):
+            pass
+        msg = message.experimenter()
+        msg.experimenter = 0x2320
+        msg.data = "acme"
+        pkt = msg.pack()
+        self.assertEqual(type(parse.of_message_parse(pkt)),
+                         message.experimenter)
+        self.assertTrue(parse.of_message_register(ofp.OFPT_EXPERIMENTER,
+                                                  0x2320, acme_experimenter))
+        try:
+            obj = parse.of_message_parse(pkt)
+            self.assertEqual(type(obj), acme_experimenter)
+            self.assertEqual(obj.data, "acme")
+        finally:
+            del parse.msg_class_map[(ofp.OFPT_EXPERIMENTER, 0x2320)]
+        self.assertFalse(parse.of_message_register(ofp.OFPT_HELLO, 1,
+                                                   message.hello))
+        msg = message.bad_match_error_msg()
+        self.assertEqual(type(parse.of_message_parse(msg.pack())),
+                         message.bad_match_error_msg)
+        msg = message.port_stats_reply()
+        msg.type = 0x1234
+        self.assertTrue(parse.of_message_parse(msg.pack()) is None)
+        self.assertTrue(parse.of_message_parse(pkt[:1]) is None)
+        self.assertEqual(parse.of_header_unpack(pkt),
+                         (ofp.OFP_VERSION, ofp.OFPT_EXPERIMENTER, len(pkt), 0))
+
+class packet_in_view(unittest.TestCase):
+    def runTest(self):
+        msg = message.packet_in()
+        msg.header.xid = 9
+        msg.buffer_id = 0x1234
+        msg.reason = ofp.OFPR_ACTION
+        msg.table_id = 3
+        msg.match_fields.add(match_.eth_type(0x800))
+        msg.match_fields.add(match_.in_port(7))
+        msg.data = "".join([chr(idx) for idx in range(100)])
+        pkt = msg.pack()
+        full = parse.of_message_parse(pkt)
+        buf = memoryview(bytearray("x" * 5 + pkt))
+        view = parse.of_packet_in_parse(buf, offset=5)
+        self.assertEqual((view.xid, view.buffer_id, view.reason,
+                          view.table_id, view.in_port),
+                         (9, 0x1234, ofp.OFPR_ACTION, 3, 7))
+        self.assertEqual(view.data.tobytes(), full.data)
+        self.assertEqual(view.match_fields().show(), full.match_fields.show())
+        self.assertEqual(view.message().show(), full.show())
+        self.assertTrue(parse.of_packet_in_parse(pkt[:10]) is None)
+        self.assertTrue(parse.of_packet_in_parse(
+                message.echo_request().pack()) is None)
+
+class oxm_codec_roundtrip(unittest.TestCase):
+    def runTest(self):
+        mac = [0, 1, 2, 3, 4, 5]
+        ipv6 = ipaddr.IPv6Address("fe80::2420:52ff:fe8f:5189")
+        fields = match_list()
+        for (cls, field, kind, width) in match_.oxm_field_formats:
+            if kind == match_.OXM_MAC:
+                value = mac
+            elif kind == match_.OXM_IPV6:
+                value = ipv6
+            else:
+                value = (1 << (8 * width)) - 2
+            self.assertTrue(fields.add(cls(value)))
+        fields.add(match_.metadata(0x1122, 0xff00))
+        fields.add(match_.eth_dst(mac, [0xff] * 3 + [0] * 3))
+        # Unknown experimenter field is kept raw
+        fields.tlvs.append(match_.oxm_tlv(1, False, 2, "ab", class_=0xffff))
+        packed = fields.pack()
+        decoded = match_list()
+        decoded.unpack_from(packed, 0, len(packed))
+        self.assertEqual([type(tlv) for tlv in decoded],
+                         [type(tlv) for tlv in fields])
+        self.assertEqual(decoded, fields)
+        self.assertEqual(decoded.pack(), packed)
+        self.assertEqual(decoded.tlvs[3].value, mac)
+        self.assertEqual(decoded.tlvs[-2].mask, [0xff] * 3 + [0] * 3)
+        self.assertEqual(decoded.tlvs[-1].value, "ab")
+        self.assertEqual(len(set(decoded.tlvs + fields.tlvs)),
+                         len(fields.tlvs))
+
+class match_canonical_key(unittest.TestCase):
+    def runTest(self):
+        mac = [0, 1, 2, 3, 4, 5]
+        first = match_list()
+        first.add(match_.in_port(1))
+        first.add(match_.eth_dst(mac, [0xff] * 3 + [0] * 3))
+        first.add(match_.metadata(0x1122, 0xff00))
+        second = match_list()
+        second.add(match_.metadata(0x1100, 0xff00))
+        second.add(match_.eth_dst([0, 1, 2, 9, 9, 9], [0xff] * 3 + [0] * 3))
+        second.add(match_.in_port(1))
+        self.assertNotEqual(first, second)
+        self.assertEqual(first.canonical_key(), second.canonical_key())
+        # A mask with all bits set is no mask
+        exact = match_list()
+        exact.add(match_.metadata(0x1122))
+        full = match_list()
+        full.add(match_.metadata(0x1122, 0xffffffffffffffff))
+        self.assertEqual(exact.canonical_key(), full.canonical_key())
+        self.assertNotEqual(exact.canonical_key(), first.canonical_key())
+
+        # Flows are found from a parsed flow_removed through the key
+        flows = {}
+        for port in range(1, 100):
+            request = message.flow_mod()
+            request.match_fields.add(match_.in_port(port))
+            request.match_fields.add(match_.eth_type(0x800))
+            flows[request.match_fields.canonical_key()] = port
+        removed = message.flow_removed()
+        removed.match_fields.add(match_.eth_type(0x800))
+        removed.match_fields.add(match_.in_port(42))
+        removed = parse.of_message_parse(removed.pack())
+        self.assertEqual(flows[removed.match_fields.canonical_key()], 42)
+
+class list_ownership(unittest.TestCase):
+    def runTest(self):
+        act = action.action_output()
+        act.port = 1
+        inst = instruction.instruction_apply_actions()
+        self.assertTrue(inst.actions.add(act))
+        act.port = 2
+        self.assertEqual(inst.actions.items[0].port, 1)
+        self.assertTrue(inst.actions.add(act, owned=True))
+        self.assertTrue(inst.actions.items[1] is act)
+        self.assertFalse(inst.actions.add(instruction.instruction_goto_table()))
+
+        # Bulk extend copies the items once, or not at all if owned
+        group = message.group_mod()
+        buckets = []
+        for port in range(4):
+            b = bucket.bucket()
+            b.actions.add(act)
+            buckets.append(b)
+        self.assertTrue(group.buckets.extend(buckets))
+        self.assertFalse(group.buckets.items[0] is buckets[0])
+        self.assertEqual(group.buckets.items, buckets)
+        owned = []
+        for port in range(4):
+            b = bucket.bucket()
+            b.actions.add(act)
+            owned.append(b)
+        self.assertTrue(group.buckets.extend(owned, owned=True))
+        self.assertEqual(len(group.buckets.items), 8)
+        for idx in range(4):
+            self.assertTrue(group.buckets.items[4 + idx] is owned[idx])
+        self.assertFalse(group.buckets.extend([act]))
+        self.assertEqual(len(group.buckets.items), 8)
+
 if __name__ == '__main__':
     unittest.main()
@@ -71,4 +71,18 @@ def str2mac(mac):
     """ 
     Takes a binary string as input and returns an array of bytes
     """
-    return struct.unpack('%dB' % (len(mac)), mac)
\ No newline at end of file
+    return struct.unpack('%dB' % (len(mac)), mac)
+
+def get_if_counters(iff):
+    """
+    Return the pair (rx_packets, tx_packets) of an interface
+    @raise EnvironmentError if the counters cannot be read
+    """
+    counters = []
+    for name in ["rx_packets", "tx_packets"]:
+        f = open("/sys/class/net/%s/statistics/%s" % (iff, name))
+        try:
+            counters.append(int(f.read()))
+        finally:
+            f.close()
+    return tuple(counters)
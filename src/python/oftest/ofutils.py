@@ -26,3 +26,25 @@ def of_error_msg_make(type, code, data):
     else:
         err.data = data.pack()
     return err
+
+def percentile(samples, pct):
+    """
+    Return the pct percentile of a sorted, non-empty list of samples
+    """
+    idx = int(round((len(samples) - 1) * pct / 100.0))
+    return samples[idx]
+
+def latency_summary(samples):
+    """
+    Summarize latency samples in seconds as a dict of microseconds
+    """
+    if not samples:
+        return {"count" : 0}
+    samples = sorted(samples)
+    return {"count" : len(samples),
+            "min_us" : samples[0] * 1e6,
+            "avg_us" : sum(samples) / len(samples) * 1e6,
+            "p50_us" : percentile(samples, 50) * 1e6,
+            "p90_us" : percentile(samples, 90) * 1e6,
+            "p99_us" : percentile(samples, 99) * 1e6,
+            "max_us" : samples[-1] * 1e6}
@@ -3,6 +3,7 @@ OpenFlow message parsing functions
 """
 
 import sys
+import struct
 import logging
 from oftest import message
 from match_list import match_list
@@ -108,51 +109,109 @@ msg_type_to_class_map = {
     ofp.OFPT_QUEUE_GET_CONFIG_REPLY     : message.queue_get_config_reply,
 }
 
-def _of_message_to_object(binary_string):
+# Offset in the message and codec of the field giving the subtype of
+# the message types whose class depends on it
+msg_subtype_fields = {
+    ofp.OFPT_STATS_REQUEST              : (ofp.OFP_HEADER_BYTES,
+                                           struct.Struct("!H")),
+    ofp.OFPT_STATS_REPLY                : (ofp.OFP_HEADER_BYTES,
+                                           struct.Struct("!H")),
+    ofp.OFPT_ERROR                      : (ofp.OFP_HEADER_BYTES,
+                                           struct.Struct("!H")),
+    ofp.OFPT_EXPERIMENTER               : (ofp.OFP_HEADER_BYTES,
+                                           struct.Struct("!L"))
+}
+
+# Flat dispatch table from (header type, subtype) to message class.
+# The subtype is None for types not in msg_subtype_fields; a (type, None)
+# entry for one of those types is used for subtypes with no entry of
+# their own.  Add entries with of_message_register.
+msg_class_map = {}
+for (_type, _cls) in msg_type_to_class_map.items():
+    if _type not in msg_subtype_fields or _type == ofp.OFPT_EXPERIMENTER:
+        msg_class_map[(_type, None)] = _cls
+for (_sub_map, _type) in [(stats_request_to_class_map, ofp.OFPT_STATS_REQUEST),
+                          (stats_reply_to_class_map, ofp.OFPT_STATS_REPLY),
+                          (error_to_class_map, ofp.OFPT_ERROR)]:
+    for (_subtype, _cls) in _sub_map.items():
+        msg_class_map[(_type, _subtype)] = _cls
+
+OFP_HEADER = struct.Struct("!BBHL")
+OFP_HEADER_TYPE = struct.Struct("!B")
+
+# Fixed part of a packet_in after the header, up to the match length
+PACKET_IN_FIXED = struct.Struct("!LHBBHH")
+PACKET_IN_MATCH_OFFSET = ofp.OFP_HEADER_BYTES + ofp.OFP_PACKET_IN_BYTES - \
+    ofp.OFP_MATCH_BYTES
+# The match is followed by 2 bytes of padding before the data
+PACKET_IN_DATA_PAD = 2
+OXM_HEADER = struct.Struct("!L")
+OXM_IN_PORT_HEADER = (ofp.OFPXMC_OPENFLOW_BASIC << 16 |
+                      ofp.OFPXMT_OFB_IN_PORT << 9 | 4)
+
+def of_message_register(msg_type, subtype, cls):
+    """
+    Register the class used to parse messages of a type and subtype
+
+    Allows experimenter messages, or experimenter stats, to be parsed
+    into their own classes.
+
+    @param msg_type The ofp_header type of the message
+    @param subtype The subtype: the stats type for stats messages, the
+    error type for errors and the experimenter ID for experimenter
+    messages; None for other types, or for the default class of a type
+    @param cls The class to instantiate; objects must support unpack_from
+    @return True if registered, False if msg_type has no subtype
+    """
+    if subtype is not None and msg_type not in msg_subtype_fields:
+        parse_logger.error("Message type " + str(msg_type) +
+                           " has no subtype")
+        return False
+    msg_class_map[(msg_type, subtype)] = cls
+    return True
+
+def _of_message_to_object(binary_string, offset=0):
     """
     Map a binary string to the corresponding class.
 
-    Appropriately resolves subclasses
+    Reads the type and, if needed, the subtype straight from the buffer
+    and looks the class up in msg_class_map.
+
+    @return A new object of the class, or None if there is none
     """
-    hdr = ofp.ofp_header()
-    hdr.unpack(binary_string)
-    # FIXME: Add error detection
-    if not hdr.type in msg_type_subclassed:
-        return msg_type_to_class_map[hdr.type]()
-    if hdr.type == ofp.OFPT_STATS_REQUEST:
-        sub_hdr = ofp.ofp_stats_request()
-        sub_hdr.unpack(binary_string[ofp.OFP_HEADER_BYTES:])
-        try:
-            obj = stats_request_to_class_map[sub_hdr.type]()
-        except LookupError:
-            obj = None
-        return obj
-    elif hdr.type == ofp.OFPT_STATS_REPLY:
-        sub_hdr = ofp.ofp_stats_reply()
-        sub_hdr.unpack(binary_string[ofp.OFP_HEADER_BYTES:])
-        try:
-            obj = stats_reply_to_class_map[sub_hdr.type]()
-        except LookupError:
-            obj = None
-        return obj
-    elif hdr.type == ofp.OFPT_ERROR:
-        sub_hdr = ofp.ofp_error_msg()
-        sub_hdr.unpack(binary_string[ofp.OFP_HEADER_BYTES:])
-        return error_to_class_map[sub_hdr.type]()
-    else:
-        parse_logger.error("Cannot parse pkt to message")
+    try:
+        (msg_type,) = OFP_HEADER_TYPE.unpack_from(binary_string, offset + 1)
+        subtype = None
+        if msg_type in msg_subtype_fields:
+            (sub_offset, codec) = msg_subtype_fields[msg_type]
+            (subtype,) = codec.unpack_from(binary_string, offset + sub_offset)
+    except struct.error:
+        parse_logger.error("Message too short to parse")
+        return None
+    cls = msg_class_map.get((msg_type, subtype))
+    if cls is None:
+        cls = msg_class_map.get((msg_type, None))
+    if cls is None:
+        parse_logger.error("Cannot parse pkt to message: type " +
+                           str(msg_type) + " subtype " + str(subtype))
         return None
+    return cls()
 
-def of_message_parse(binary_string, raw=False):
+def of_message_parse(binary_string, raw=False, offset=0, lazy=False):
     """
     Parse an OpenFlow packet
 
     Parses a raw OpenFlow packet into a Python class, with class
     members fully populated.
 
-    @param binary_string The packet (string) to be parsed
+    @param binary_string The packet (string) to be parsed; any object
+    supporting the buffer interface, such as a memoryview of a receive
+    buffer, may be given and is parsed without being copied
     @param raw If true, interpret the packet as an L2 packet.  Not
     yet supported.
+    @param offset The offset of the packet in binary_string
+    @param lazy If true, a flow stats reply keeps its entries packed in
+    a lazy_stats_list and decodes them when accessed
     @return An object of some message class or None if fails
     Note that any data beyond that parsed is not returned
 
@@ -162,12 +221,54 @@ def of_message_parse(binary_string, raw=False):
         parse_logger.error("raw packet message parsing not supported")
         return None
 
-    obj = _of_message_to_object(binary_string)
+    obj = _of_message_to_object(binary_string, offset)
     if obj:
-        obj.unpack(binary_string)
+        if lazy and isinstance(obj, message.flow_stats_reply):
+            obj.unpack_from(binary_string, offset, lazy=True)
+        else:
+            obj.unpack_from(binary_string, offset)
     return obj
 
 
+def of_message_split(buf):
+    """
+    Split the complete OpenFlow messages off the front of a stream buffer
+
+    Messages are framed on ofp_header.length.  The bytes of complete
+    messages are removed from buf in one step; a trailing partial
+    message is left in place to be completed by later reads.
+
+    @param buf A bytearray holding the bytes received on a connection
+    @return A list of raw message strings, or None if a header holds an
+    invalid length.  The stream cannot be resynchronized in that case,
+    so buf is cleared.
+
+    """
+
+    msgs = []
+    offset = 0
+    while len(buf) - offset >= ofp.OFP_HEADER_BYTES:
+        (length,) = struct.unpack_from("!H", buf, offset + 2)
+        if length < ofp.OFP_HEADER_BYTES:
+            del buf[:]
+            return None
+        if len(buf) - offset < length:
+            break   # Partial message; wait for the rest
+        msgs.append(str(buffer(buf, offset, length)))
+        offset += length
+    del buf[:offset]
+    return msgs
+
+def of_header_unpack(binary_string, offset=0):
+    """
+    Read the header fields of an OpenFlow packet without building objects
+
+    @param binary_string The packet (string or other buffer) to be read
+    @param offset The offset of the packet in binary_string
+    @return The tuple (version, type, length, xid)
+    """
+    return OFP_HEADER.unpack_from(binary_string, offset)
+
 def of_header_parse(binary_string, raw=False):
     """
     Parse only the header from an OpenFlow packet
@@ -191,6 +292,96 @@ def of_header_parse(binary_string, raw=False):
 
     return hdr
 
+class packet_in_view(object):
+    """
+    Fields of a packet_in read straight from the raw message
+
+    Built by of_packet_in_parse.  The data offset is computed from the
+    match length, so the OXM match fields are not decoded and the data
+    is not copied.  The match fields are decoded only by match_fields(),
+    and message() returns the fully parsed packet_in.
+
+    @var xid The transaction ID
+    @var buffer_id As in ofp_packet_in
+    @var total_len As in ofp_packet_in
+    @var reason As in ofp_packet_in
+    @var table_id As in ofp_packet_in
+    @var match_length The length of the match, excluding padding
+    @var data A memoryview of the packet data
+    @var in_port The value of the in_port match field, or None
+    """
+    __slots__ = ['buffer', 'offset', 'xid', 'buffer_id', 'total_len',
+                 'reason', 'table_id', 'match_length', 'data']
+
+    @property
+    def in_port(self):
+        # Walk the OXM headers only, stopping at in_port
+        offset = self.offset + PACKET_IN_MATCH_OFFSET + ofp.OFP_MATCH_BYTES
+        end = self.offset + PACKET_IN_MATCH_OFFSET + self.match_length
+        while end - offset >= 4:
+            (oxm_header,) = OXM_HEADER.unpack_from(self.buffer, offset)
+            if oxm_header == OXM_IN_PORT_HEADER and end - offset >= 8:
+                return OXM_HEADER.unpack_from(self.buffer, offset + 4)[0]
+            offset += 4 + (oxm_header & 0xff)
+        return None
+
+    def match_fields(self):
+        """
+        Decode the match fields
+        @return A match_list
+        """
+        fields = match_list()
+        fields.unpack_from(self.buffer,
+                           self.offset + PACKET_IN_MATCH_OFFSET +
+                           ofp.OFP_MATCH_BYTES,
+                           self.match_length - ofp.OFP_MATCH_BYTES)
+        return fields
+
+    def message(self):
+        """
+        Return the fully parsed packet_in message object
+        """
+        return of_message_parse(self.buffer, offset=self.offset)
+
+def of_packet_in_parse(binary_string, offset=0):
+    """
+    Decode the fixed fields of a packet_in without parsing its match
+
+    May be passed as the decode argument of Controller.poll.
+
+    @param binary_string The packet (string or other buffer) to be read
+    @param offset The offset of the packet in binary_string
+    @return A packet_in_view or None if binary_string does not hold a
+    packet_in
+    """
+    try:
+        (version, msg_type, length, xid) = \
+            OFP_HEADER.unpack_from(binary_string, offset)
+        (buffer_id, total_len, reason, table_id, match_type,
+         match_length) = PACKET_IN_FIXED.unpack_from(
+            binary_string, offset + ofp.OFP_HEADER_BYTES)
+    except struct.error:
+        parse_logger.error("Message too short for a packet_in")
+        return None
+    if msg_type != ofp.OFPT_PACKET_IN:
+        parse_logger.error("Message type " + str(msg_type) +
+                           " is not a packet_in")
+        return None
+    view = packet_in_view()
+    view.buffer = binary_string
+    view.offset = offset
+    view.xid = xid
+    view.buffer_id = buffer_id
+    view.total_len = total_len
+    view.reason = reason
+    view.table_id = table_id
+    view.match_length = match_length
+    start = offset + PACKET_IN_MATCH_OFFSET + \
+        match.roundup(match_length, 8) + PACKET_IN_DATA_PAD
+    end = min(offset + length, len(binary_string))
+    view.data = memoryview(binary_string)[start:max(start, end)]
+    return view
+
 map_wc_field_to_match_member = {
     'OFPFW_DL_VLAN'                 : 'dl_vlan',
     'OFPFW_DL_SRC'                  : 'dl_src',
@@ -261,9 +452,9 @@ def packet_to_flow_match(packet):
         eth_type = match.eth_type(ether.type)
         eth_dst = match.eth_dst(parse_mac(ether.dst))
         eth_src = match.eth_src(parse_mac(ether.src))
-        match_ls.add(eth_type)
-        match_ls.add(eth_dst)
-        match_ls.add(eth_src)
+        match_ls.add(eth_type, owned=True)
+        match_ls.add(eth_dst, owned=True)
+        match_ls.add(eth_src, owned=True)
     else:
         return match_ls
 
@@ -272,8 +463,8 @@ def packet_to_flow_match(packet):
         vlan = packet[Dot1Q:0]
         vlan_vid = match.vlan_vid(vlan.vlan)
         vlan_pcp = match.vlan_pcp(vlan.prio)
-        match_ls.add(vlan_vid)
-        match_ls.add(vlan_pcp)
+        match_ls.add(vlan_vid, owned=True)
+        match_ls.add(vlan_pcp, owned=True)
         vlan_pl = vlan.payload
         while vlan_pl is not None and vlan_pl.name == Dot1Q.name:
             vlan = vlan_pl
@@ -289,8 +480,8 @@ def packet_to_flow_match(packet):
         mpls = packet[MPLS:0]
         mpls_label = match.mpls_label(mpls.label)
         mpls_tc =  match.mpls_tc(mpls.cos)
-        match_ls.add(mpls_label)
-        match_ls.add(mpls_tc)
+        match_ls.add(mpls_label, owned=True)
+        match_ls.add(mpls_tc, owned=True)
         return match_ls
 
     if IP in packet:
@@ -299,10 +490,10 @@ def packet_to_flow_match(packet):
         ipv4_dst = match.ipv4_dst(parse_ip(ip.dst))
         ip_dscp =  match.ip_dscp(ip.tos >> 2) 
         ip_ecn =   match.ip_ecn(ip.tos & 0x03)
-        match_ls.add(ipv4_src)
-        match_ls.add(ipv4_dst)
-        match_ls.add(ip_dscp)
-        match_ls.add(ip_ecn)
+        match_ls.add(ipv4_src, owned=True)
+        match_ls.add(ipv4_dst, owned=True)
+        match_ls.add(ip_dscp, owned=True)
+        match_ls.add(ip_ecn, owned=True)
     else:
         return match_ls
     
@@ -311,9 +502,9 @@ def packet_to_flow_match(packet):
         ip_proto = match.ip_proto(6)
         tcp_src = match.tcp_src(tcp.sport)
         tcp_dst = match.tcp_dst(tcp.dport)
-        match_ls.add(ip_proto)
-        match_ls.add(tcp_src)
-        match_ls.add(tcp_dst)
+        match_ls.add(ip_proto, owned=True)
+        match_ls.add(tcp_src, owned=True)
+        match_ls.add(tcp_dst, owned=True)
         return match_ls
 
     if UDP in packet:
@@ -321,9 +512,9 @@ def packet_to_flow_match(packet):
         ip_proto = match.ip_proto(17)
         udp_src = match.tcp_src(udp.sport)
         udp_dst = match.tcp_dst(udp.dport)
-        match_ls.add(ip_proto)
-        match_ls.add(udp_src)
-        match_ls.add(udp_dst)        
+        match_ls.add(ip_proto, owned=True)
+        match_ls.add(udp_src, owned=True)
+        match_ls.add(udp_dst, owned=True)        
         returnmatch_ls
 
     if ICMP in packet:
@@ -331,8 +522,8 @@ def packet_to_flow_match(packet):
         ip_proto = match.ip_proto(1)
         icmp_type = match.icmp_type(icmp.type)
         icmp_code = match.icmp_code(icmp.code)
-        match_ls.add(icmp_type)
-        match_ls.add(icmp_code)        
+        match_ls.add(icmp_type, owned=True)
+        match_ls.add(icmp_code, owned=True)        
         return match_ls
 
     return match_ls
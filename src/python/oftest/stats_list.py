@@ -0,0 +1,184 @@
+"""
+Stats entry list decoded on demand.
+
+A stats reply such as a full flow table dump can carry a very large
+number of entries.  The lazy_stats_list keeps the packed entries in a
+single buffer with the offset of each one, so that scanning the reply
+for counts or a few fields does not build an object per entry.
+"""
+
+import struct
+from array import array
+from itertools import izip
+
+# Entries start with their 16 bit length
+ENTRY_LENGTH = struct.Struct("!H")
+
+# Fixed fields of ofp_flow_stats: name -> (offset, struct format)
+FLOW_STATS_FIELDS = {
+    "length"        : (0, "!H"),
+    "table_id"      : (2, "!B"),
+    "duration_sec"  : (4, "!L"),
+    "duration_nsec" : (8, "!L"),
+    "priority"      : (12, "!H"),
+    "idle_timeout"  : (14, "!H"),
+    "hard_timeout"  : (16, "!H"),
+    "cookie"        : (24, "!Q"),
+    "packet_count"  : (32, "!Q"),
+    "byte_count"    : (40, "!Q"),
+}
+
+class lazy_stats_list(object):
+    """
+    Sequence of stats entries decoded only when accessed
+
+    Supports len, indexing, slicing, iteration, append, extend and
+    comparison like the list of entries it replaces.  An entry is
+    decoded when first indexed and then kept, so changes made to it
+    are seen by later accesses.  Iteration decodes the entries that
+    have not been indexed without keeping them.
+
+    Fields of the fixed part of an entry are read straight from the
+    buffer with field() or the packet_count() and byte_count()
+    shortcuts, without decoding the entry.
+
+    Data members:
+    @arg entry_class The class of the entries, such as flow_stats_entry
+    @arg fields Dict of field name to (offset, struct.Struct) in an entry
+    @arg buffer A bytearray holding the packed entries
+    @arg offsets An array of the offset of each entry in buffer; -1 for
+    entries added as objects with append or extend
+    @arg entries Dict of index to entry objects already decoded or added
+    """
+    __slots__ = ['entry_class', 'fields', 'buffer', 'offsets', 'entries']
+
+    def __init__(self, entry_class, fields=None):
+        self.entry_class = entry_class
+        self.fields = {}
+        if fields:
+            for (name, (offset, fmt)) in fields.items():
+                self.fields[name] = (offset, struct.Struct(fmt))
+        self.buffer = bytearray()
+        self.offsets = array('l')
+        self.entries = {}
+
+    def unpack_from(self, buffer, offset=0, bytes=None):
+        """
+        Index the entries in a buffer at an offset and keep a copy of them
+
+        @param buffer A string or other object supporting the buffer
+        interface, such as a memoryview, holding the entries
+
+        @param offset The offset of the first entry in buffer
+
+        @param bytes The total length of the entries in bytes.
+        If None, the entries are assumed to extend through the entire buffer.
+
+        @return The offset in buffer just past the last whole entry
+        """
+        if bytes is None:
+            end = len(buffer)
+        else:
+            end = offset + bytes
+        min_len = len(self.entry_class())
+        base = len(self.buffer) - offset
+        start = offset
+        while end - offset >= min_len:
+            length = ENTRY_LENGTH.unpack_from(buffer, offset)[0]
+            if length < min_len or offset + length > end:
+                print "ERROR unpacking stats entry: bad length", length
+                break
+            self.offsets.append(base + offset)
+            offset += length
+        self.buffer += buffer[start:offset]
+        return offset
+
+    def _decode(self, index):
+        entry = self.entry_class()
+        entry.unpack_from(self.buffer, self.offsets[index])
+        return entry
+
+    def _index(self, index):
+        if index < 0:
+            index += len(self.offsets)
+        if index < 0 or index >= len(self.offsets):
+            raise IndexError("stats entry index out of range")
+        return index
+
+    def field(self, index, name):
+        """
+        Return a fixed field of an entry without decoding the entry
+
+        @param index The index of the entry
+        @param name The name of the field, a key of fields
+        """
+        index = self._index(index)
+        entry = self.entries.get(index)
+        if entry is not None:
+            return getattr(entry, name)
+        (offset, codec) = self.fields[name]
+        return codec.unpack_from(self.buffer, self.offsets[index] + offset)[0]
+
+    def packet_count(self, index):
+        return self.field(index, "packet_count")
+
+    def byte_count(self, index):
+        return self.field(index, "byte_count")
+
+    def append(self, entry):
+        """
+        Add an entry object to the end of the list
+        """
+        self.entries[len(self.offsets)] = entry
+        self.offsets.append(-1)
+
+    def extend(self, other):
+        """
+        Add the entries of other to the end of the list
+
+        @param other Another lazy_stats_list, whose packed entries are
+        copied without decoding them, or any sequence of entry objects
+        """
+        if not isinstance(other, lazy_stats_list):
+            for entry in other:
+                self.append(entry)
+            return
+        count = len(self.offsets)
+        base = len(self.buffer)
+        for offset in other.offsets:
+            if offset >= 0:
+                offset += base
+            self.offsets.append(offset)
+        for (index, entry) in other.entries.items():
+            self.entries[count + index] = entry
+        self.buffer += other.buffer
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in xrange(*index.indices(len(self)))]
+        index = self._index(index)
+        entry = self.entries.get(index)
+        if entry is None:
+            entry = self._decode(index)
+            self.entries[index] = entry
+        return entry
+
+    def __iter__(self):
+        for index in xrange(len(self.offsets)):
+            entry = self.entries.get(index)
+            if entry is None:
+                entry = self._decode(index)
+            yield entry
+
+    def __eq__(self, other):
+        if not hasattr(other, "__len__") or len(self) != len(other):
+            return False
+        for (entry, other_entry) in izip(self, other):
+            if entry != other_entry:
+                return False
+        return True
+
+    def __ne__(self, other): return not self.__eq__(other)
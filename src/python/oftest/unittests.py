@@ -4,6 +4,8 @@ import unittest
 import logging
 
 from message_unittests import *
+from controller_unittests import *
+from dataplane_unittests import *
 from instruction import *
 from instruction_list import *
 from packet import *
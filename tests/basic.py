@@ -115,7 +115,10 @@ class SimpleDataPlane(SimpleProtocol):
     """
     def setUp(self):
         SimpleProtocol.setUp(self)
-        self.dataplane = dataplane.DataPlane()
+        self.dataplane = dataplane.DataPlane(
+            capture=basic_config["capture"],
+            reactor=basic_config["dataplane_reactor"],
+            capture_filter=basic_config["capture_filter"])
         for of_port, ifname in basic_port_map.items():
             self.dataplane.port_add(ifname, of_port)
 
@@ -149,7 +152,10 @@ class DataPlaneOnly(unittest.TestCase):
         self.config = basic_config
         #signal.signal(signal.SIGINT, self.sig_handler)
         basic_logger.info("** START DataPlaneOnly CASE " + str(self))
-        self.dataplane = dataplane.DataPlane()
+        self.dataplane = dataplane.DataPlane(
+            capture=basic_config["capture"],
+            reactor=basic_config["dataplane_reactor"],
+            capture_filter=basic_config["capture_filter"])
         for of_port, ifname in basic_port_map.items():
             self.dataplane.port_add(ifname, of_port)
 
@@ -219,19 +225,21 @@ class PacketIn(SimpleDataPlane):
             pkt = testutils.simple_tcp_packet()
             self.dataplane.send(of_port, str(pkt))
             #@todo Check for unexpected messages?
-            (response, _) = self.controller.poll(ofp.OFPT_PACKET_IN, 2)
+            (response, _) = self.controller.poll(ofp.OFPT_PACKET_IN, 2,
+                                         decode=parse.of_packet_in_parse)
 
             self.assertTrue(response is not None, 
                             'Packet in message not received on port ' + 
                             str(of_port))
-            if str(pkt) != response.data:
+            data = response.data.tobytes()
+            if str(pkt) != data:
                 basic_logger.debug("pkt  len " + str(len(str(pkt))) +
                                    ": " + str(pkt))
                 basic_logger.debug("resp len " + 
-                                   str(len(str(response.data))) + 
-                                   ": " + str(response.data))
+                                   str(len(data)) + 
+                                   ": " + data)
 
-            self.assertEqual(str(pkt), response.data,
+            self.assertEqual(str(pkt), data,
                              'Response packet does not match send packet' +
                              ' for port ' + str(of_port))
 
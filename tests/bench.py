@@ -0,0 +1,239 @@
+"""
+Control plane performance benchmarks
+
+Measure how fast the switch under test installs flows, how long a
+table miss takes to reach the controller as a packet in and how long
+a barrier round trip takes.  In the spirit of cbench, but driven by
+the test harness against a real switch and dataplane.
+
+These tests are not run by default; select them with
+--test-spec=bench.
+
+Results are logged and, if test-params include bench_out, appended to
+that file for tracking across firmware releases, as JSON (one object
+per line) or CSV (time,label,test,metric,value rows) according to
+bench_format.  The test-params below are accepted (defaults shown):
+
+    bench_out=None          Results file
+    bench_format='json'     'json' or 'csv'
+    bench_label=''          Tag for the results, e.g. the firmware version
+    flow_count=10000        Flows installed by FlowModRate
+    flow_window=256         Flow mods per barrier in FlowModRate
+    pktin_count=1000        Packets sent by PacketInLatency
+    barrier_count=1000      Barriers sent by BarrierLatency
+
+"""
+
+import logging
+import time
+import json
+import struct
+
+import unittest
+
+import oftest.cstruct as ofp
+import oftest.message as message
+import oftest.parse as parse
+import oftest.match as match
+import oftest.action as action
+import oftest.instruction as instruction
+from oftest.ofutils import latency_summary
+
+import basic
+import testutils
+
+#@var bench_port_map Local copy of the configuration map from OF port
+# numbers to OS interfaces
+bench_port_map = None
+#@var bench_logger Local logger object
+bench_logger = None
+#@var bench_config Local copy of global configuration data
+bench_config = None
+
+test_prio = {}
+
+# Base address of the IPv4 destinations matched by FlowModRate: 10.0.0.0
+FLOW_IPV4_DST_BASE = 0x0a000000
+
+def test_set_init(config):
+    """
+    Set up function for bench test classes
+
+    @param config The configuration dictionary; see oft
+    """
+
+    global bench_port_map
+    global bench_logger
+    global bench_config
+
+    bench_logger = logging.getLogger("bench")
+    bench_logger.info("Initializing test set")
+    bench_port_map = config["port_map"]
+    bench_config = config
+
+def bench_report(test, results):
+    """
+    Log benchmark results and append them to the bench_out file
+
+    @param test The name of the benchmark
+    @param results A flat dict from metric name to value
+    """
+    label = testutils.test_param_get(bench_config, "bench_label", "")
+    for key in sorted(results.keys()):
+        bench_logger.info("%s %s: %s" % (test, key, str(results[key])))
+
+    out = testutils.test_param_get(bench_config, "bench_out")
+    if not out:
+        return
+    fmt = testutils.test_param_get(bench_config, "bench_format", "json")
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    f = open(out, "a")
+    if fmt == "csv":
+        for key in sorted(results.keys()):
+            f.write("%s,%s,%s,%s,%s\n" % (stamp, label, test, key,
+                                          str(results[key])))
+    else:
+        record = {"time" : stamp, "label" : label, "test" : test}
+        record.update(results)
+        f.write(json.dumps(record, sort_keys=True) + "\n")
+    f.close()
+
+def flow_mod_generate(count, out_port):
+    """
+    Generate count flow mods matching distinct IPv4 destinations
+
+    @param count The number of flow mods
+    @param out_port The port the flows output to
+    """
+    for idx in range(count):
+        request = message.flow_mod()
+        request.match_fields.add(match.eth_type(testutils.IP_ETHERTYPE),
+                                 owned=True)
+        request.match_fields.add(match.ipv4_dst(FLOW_IPV4_DST_BASE + idx),
+                                 owned=True)
+        request.buffer_id = 0xffffffff
+        inst = instruction.instruction_apply_actions()
+        act = action.action_output()
+        act.port = out_port
+        inst.actions.add(act, owned=True)
+        request.instructions.add(inst, owned=True)
+        yield request
+
+class FlowModRate(basic.SimpleProtocol):
+    """
+    Measure the rate at which the switch installs flows
+
+    Install flow_count flows with testutils.flow_msg_install_bulk, a
+    barrier every flow_window flow mods, and report flows per second
+    as seen from the controller including the final barrier.
+    """
+    def runTest(self):
+        count = testutils.test_param_get(self.config, "flow_count", 10000)
+        window = testutils.test_param_get(self.config, "flow_window", 256)
+        out_port = bench_port_map.keys()[0]
+
+        rc = testutils.delete_all_flows(self.controller, self.logger)
+        self.assertEqual(rc, 0, "Failed to delete all flows")
+        testutils.do_barrier(self.controller)
+
+        result = testutils.flow_msg_install_bulk(
+            self, flow_mod_generate(count, out_port), window=window)
+        bench_report("FlowModRate",
+                     {"flows" : result["flows"],
+                      "window" : window,
+                      "errors" : len(result["errors"]),
+                      "elapsed_s" : result["elapsed"],
+                      "flows_per_s" : result["rate"]})
+
+        testutils.delete_all_flows(self.controller, self.logger)
+        testutils.do_barrier(self.controller)
+        self.assertEqual(len(result["errors"]), 0,
+                         "Switch rejected %d flow mods" %
+                         len(result["errors"]))
+
+test_prio["FlowModRate"] = -1
+
+class PacketInLatency(basic.SimpleDataPlane):
+    """
+    Measure table miss to packet in latency
+
+    With an empty flow table sending misses to the controller, send
+    pktin_count packets one at a time on the first port and time the
+    arrival of each as a packet in.  Each packet carries its sequence
+    number in the TCP source port.
+    """
+    def runTest(self):
+        count = testutils.test_param_get(self.config, "pktin_count", 1000)
+        of_port = bench_port_map.keys()[0]
+
+        rc = testutils.delete_all_flows(self.controller, self.logger)
+        self.assertEqual(rc, 0, "Failed to delete all flows")
+        rc = testutils.initialize_table_config(self.controller, self.logger)
+        self.assertEqual(rc, 0, "Failed to initialize table config")
+        testutils.do_barrier(self.controller)
+        drain = parse.of_packet_in_parse
+        while self.controller.poll(ofp.OFPT_PACKET_IN,
+                                   decode=drain)[0] is not None:
+            pass
+
+        samples = []
+        lost = 0
+        for seq in range(count):
+            pkt = str(testutils.simple_tcp_packet(tcp_sport=seq & 0xffff))
+            start = time.time()
+            self.dataplane.send(of_port, pkt)
+            while True:
+                (response, raw) = self.controller.poll(
+                    ofp.OFPT_PACKET_IN, 1, decode=parse.of_packet_in_parse)
+                now = time.time()
+                if response is None:
+                    lost += 1
+                    break
+                if self._seq_get(response.data) == seq & 0xffff:
+                    samples.append(now - start)
+                    break
+
+        results = latency_summary(samples)
+        results["lost"] = lost
+        bench_report("PacketInLatency", results)
+        self.assertTrue(len(samples) > 0, "No packet ins received")
+
+    def _seq_get(self, data):
+        # TCP source port of an untagged IPv4 frame without IP options
+        if len(data) < 36:
+            return None
+        return struct.unpack("!H", data[34:36])[0]
+
+test_prio["PacketInLatency"] = -1
+
+class BarrierLatency(basic.SimpleProtocol):
+    """
+    Measure barrier request to reply round trip time
+
+    Send barrier_count barriers one at a time, each after the reply
+    to the previous one.
+    """
+    def runTest(self):
+        count = testutils.test_param_get(self.config, "barrier_count", 1000)
+
+        samples = []
+        lost = 0
+        for idx in range(count):
+            request = message.barrier_request()
+            start = time.time()
+            (response, raw) = self.controller.transact(request, timeout=2)
+            now = time.time()
+            if response is None:
+                lost += 1
+            else:
+                samples.append(now - start)
+
+        results = latency_summary(samples)
+        results["lost"] = lost
+        bench_report("BarrierLatency", results)
+        self.assertTrue(len(samples) > 0, "No barrier replies received")
+
+test_prio["BarrierLatency"] = -1
+
+if __name__ == "__main__":
+    print "Please run through oft script:  ./oft --test_spec=bench"
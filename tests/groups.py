@@ -144,29 +144,21 @@ class GroupTest(basic.SimpleDataPlane):
     def send_ctrl_exp_noerror(self, msg, log = ''):
         group_logger.info('Sending message ' + log)
 #        group_logger.debug(msg.show())
-        rv = self.controller.message_send(msg)
-        self.assertTrue(rv != -1, 'Error sending!')
-
-        group_logger.info('Waiting for error messages...')
-        (response, raw) = self.controller.poll(ofp.OFPT_ERROR, 1)
-
-        self.assertTrue(response is None, 'Unexpected error message received')
+        errors = self.controller.message_confirm(msg)
+        self.assertTrue(errors is not None, 'Error sending!')
 
-        testutils.do_barrier(self.controller);
+        self.assertTrue(not errors, 'Unexpected error message received')
 
 
 
     def send_ctrl_exp_error(self, msg, log = '', type = 0, code = 0):
         group_logger.info('Sending message ' + log)
         group_logger.debug(msg.show())
-        rv = self.controller.message_send(msg)
-        self.assertTrue(rv != -1, 'Error sending!')
+        errors = self.controller.message_confirm(msg)
+        self.assertTrue(errors is not None, 'Error sending!')
 
-        group_logger.info('Waiting for error messages...')
-        (response, raw) = self.controller.poll(ofp.OFPT_ERROR, 1)
-
-        self.assertTrue(response is not None, 
-                        'Did not receive an error message')
+        self.assertTrue(errors, 'Did not receive an error message')
+        response = errors[0]
 
         self.assertEqual(response.header.type, ofp.OFPT_ERROR,
                          'Did not receive an error message')
@@ -178,8 +170,6 @@ class GroupTest(basic.SimpleDataPlane):
         if code != 0:
             self.assertEqual(response.code, code,
                              'Did not receive a ' + str(code) + ' code error message')
-        
-        testutils.do_barrier(self.controller);
 
 
 
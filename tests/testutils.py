@@ -1,6 +1,8 @@
 
 import sys
+import time
 import logging
+from collections import deque
 from cStringIO import StringIO
 #import types
 
@@ -11,6 +13,7 @@ import oftest.message as message
 #import oftest.dataplane as dataplane
 import oftest.action as action
 import oftest.parse as parse
+import oftest.ofutils as ofutils
 from oftest import instruction
 from oftest.packet import Packet
 
@@ -60,13 +63,13 @@ def initialize_table_config(ctrl, logger):
     @param ctrl The controller object for the test
     """
     logger.info("Initializing all table configs")
-    request = message.table_mod()  
-    request.config = ofp.OFPTC_TABLE_MISS_CONTROLLER
-    rv = 0
+    requests = []
     for table_id in [0, 1, 2, 3, 4, 5, 6, 7]:
+        request = message.table_mod()
+        request.config = ofp.OFPTC_TABLE_MISS_CONTROLLER
         request.table_id = table_id
-        rv |= ctrl.message_send(request)
-    return rv
+        requests.append(request)
+    return ctrl.message_send_many(requests)
 
 def delete_all_flows(ctrl, logger):
     """
@@ -494,15 +497,17 @@ def packetin_verify(parent, exp_pkt):
     """
     Receive packet_in and verify it matches an expected value
     """
-    (response, _) = parent.controller.poll(ofp.OFPT_PACKET_IN, 2)
+    (response, _) = parent.controller.poll(ofp.OFPT_PACKET_IN, 2,
+                                           decode=parse.of_packet_in_parse)
 
     parent.assertTrue(response is not None, 'Packet in message not received')
-    if str(exp_pkt) != response.data:
+    data = response.data.tobytes()
+    if str(exp_pkt) != data:
         parent.logger.debug("pkt  len " + str(len(str(exp_pkt))) + ": "
                             + str(exp_pkt).encode('hex'))
-        parent.logger.debug("resp len " + str(len(str(response.data))) + ": "
-                            + str(response.data).encode('hex'))
-    parent.assertEqual(str(exp_pkt), response.data,
+        parent.logger.debug("resp len " + str(len(data)) + ": "
+                            + data.encode('hex'))
+    parent.assertEqual(str(exp_pkt), data,
                      'PACKET_IN packet does not match send packet')
 
 def match_verify(parent, req_match, res_match):
@@ -510,58 +515,18 @@ def match_verify(parent, req_match, res_match):
     Verify flow matches agree; if they disagree, report where
 
     parent must implement assertEqual
-    Use str() to ensure content is compared and not pointers
-    """
-
-    parent.assertEqual(req_match.wildcards, res_match.wildcards,
-                       'Match failed: wildcards: ' + hex(req_match.wildcards) +
-                       " != " + hex(res_match.wildcards))
-    parent.assertEqual(req_match.in_port, res_match.in_port,
-                       'Match failed: in_port: ' + str(req_match.in_port) +
-                       " != " + str(res_match.in_port))
-    parent.assertEqual(str(req_match.dl_src), str(res_match.dl_src),
-                       'Match failed: dl_src: ' + str(req_match.dl_src) +
-                       " != " + str(res_match.dl_src))
-    parent.assertEqual(str(req_match.dl_dst), str(res_match.dl_dst),
-                       'Match failed: dl_dst: ' + str(req_match.dl_dst) +
-                       " != " + str(res_match.dl_dst))
-    parent.assertEqual(req_match.dl_vlan, res_match.dl_vlan,
-                       'Match failed: dl_vlan: ' + str(req_match.dl_vlan) +
-                       " != " + str(res_match.dl_vlan))
-    parent.assertEqual(req_match.dl_vlan_pcp, res_match.dl_vlan_pcp,
-                       'Match failed: dl_vlan_pcp: ' + 
-                       str(req_match.dl_vlan_pcp) + " != " + 
-                       str(res_match.dl_vlan_pcp))
-    parent.assertEqual(req_match.dl_type, res_match.dl_type,
-                       'Match failed: dl_type: ' + str(req_match.dl_type) +
-                       " != " + str(res_match.dl_type))
-
-    if (not(req_match.wildcards & ofp.OFPFW_DL_TYPE)
-        and (req_match.dl_type == IP_ETHERTYPE)):
-        parent.assertEqual(req_match.nw_tos, res_match.nw_tos,
-                           'Match failed: nw_tos: ' + str(req_match.nw_tos) +
-                           " != " + str(res_match.nw_tos))
-        parent.assertEqual(req_match.nw_proto, res_match.nw_proto,
-                           'Match failed: nw_proto: ' + str(req_match.nw_proto) +
-                           " != " + str(res_match.nw_proto))
-        parent.assertEqual(req_match.nw_src, res_match.nw_src,
-                           'Match failed: nw_src: ' + str(req_match.nw_src) +
-                           " != " + str(res_match.nw_src))
-        parent.assertEqual(req_match.nw_dst, res_match.nw_dst,
-                           'Match failed: nw_dst: ' + str(req_match.nw_dst) +
-                           " != " + str(res_match.nw_dst))
-
-        if (not(req_match.wildcards & ofp.OFPFW_NW_PROTO)
-            and ((req_match.nw_proto == TCP_PROTOCOL)
-                 or (req_match.nw_proto == UDP_PROTOCOL))):
-            parent.assertEqual(req_match.tp_src, res_match.tp_src,
-                               'Match failed: tp_src: ' + 
-                               str(req_match.tp_src) +
-                               " != " + str(res_match.tp_src))
-            parent.assertEqual(req_match.tp_dst, res_match.tp_dst,
-                               'Match failed: tp_dst: ' + 
-                               str(req_match.tp_dst) +
-                               " != " + str(res_match.tp_dst))
+    The match lists are compared by their canonical keys, so the order
+    of the TLVs and the value bits outside of masks do not matter
+    """
+    req_key = req_match.canonical_key()
+    res_key = res_match.canonical_key()
+    if req_key == res_key:
+        return
+    parent.assertEqual(req_key, res_key,
+                       'Match failed: missing ' +
+                       str(sorted(set(req_key) - set(res_key))) +
+                       ", unexpected " +
+                       str(sorted(set(res_key) - set(req_key))))
 
 def flow_removed_verify(parent, request=None, pkt_count=-1, byte_count=-1):
     """
@@ -581,28 +546,53 @@ def flow_removed_verify(parent, request=None, pkt_count=-1, byte_count=-1):
                        "Flow removed cookie error: " +
                        hex(request.cookie) + " != " + hex(response.cookie))
 
-    req_match = request.match
-    res_match = response.match
-    verifyMatchField(req_match, res_match)
-
-    if (req_match.wildcards != 0):
-        parent.assertEqual(request.priority, response.priority,
-                           'Flow remove prio mismatch: ' + 
-                           str(request.priority) + " != " + 
-                           str(response.priority))
-        parent.assertEqual(response.reason, ofp.OFPRR_HARD_TIMEOUT,
-                           'Flow remove reason is not HARD TIMEOUT:' +
-                           str(response.reason))
-        if pkt_count >= 0:
-            parent.assertEqual(response.packet_count, pkt_count,
-                               'Flow removed failed, packet count: ' + 
-                               str(response.packet_count) + " != " +
-                               str(pkt_count))
-        if byte_count >= 0:
-            parent.assertEqual(response.byte_count, byte_count,
-                               'Flow removed failed, byte count: ' + 
-                               str(response.byte_count) + " != " + 
-                               str(byte_count))
+    match_verify(parent, request.match_fields, response.match_fields)
+
+    parent.assertEqual(request.priority, response.priority,
+                       'Flow remove prio mismatch: ' + 
+                       str(request.priority) + " != " + 
+                       str(response.priority))
+    parent.assertEqual(response.reason, ofp.OFPRR_HARD_TIMEOUT,
+                       'Flow remove reason is not HARD TIMEOUT:' +
+                       str(response.reason))
+    if pkt_count >= 0:
+        parent.assertEqual(response.packet_count, pkt_count,
+                           'Flow removed failed, packet count: ' + 
+                           str(response.packet_count) + " != " +
+                           str(pkt_count))
+    if byte_count >= 0:
+        parent.assertEqual(response.byte_count, byte_count,
+                           'Flow removed failed, byte count: ' + 
+                           str(response.byte_count) + " != " + 
+                           str(byte_count))
+
+def flow_key(msg):
+    """
+    Return the key identifying the flow of a flow_mod, flow_removed or
+    flow stats entry: its table id, priority and canonical match key
+    """
+    return (msg.table_id, msg.priority, msg.match_fields.canonical_key())
+
+def flow_removed_correlate(requests, removed):
+    """
+    Pair flow_removed messages with the flow_mods of the removed flows
+
+    @param requests The flow_mod messages that installed the flows
+    @param removed The flow_removed messages received
+    @return (pairs, unmatched): the list of (flow_mod, flow_removed)
+    pairs and the list of flow_removed messages matching no flow_mod
+    """
+    installed = dict([(flow_key(request), request) for request in requests])
+    pairs = []
+    unmatched = []
+    for msg in removed:
+        request = installed.get(flow_key(msg))
+        if request is None:
+            unmatched.append(msg)
+        else:
+            pairs.append((request, msg))
+    return (pairs, unmatched)
+
 def flow_msg_create(parent, pkt, ing_port=0, match_fields=None, instruction_list=None, 
                     action_list=None,wildcards=0, egr_port=None, 
                     egr_queue=None, table_id=0, check_expire=False):
@@ -628,7 +618,7 @@ def flow_msg_create(parent, pkt, ing_port=0, match_fields=None, instruction_list
         match_fields = parse.packet_to_flow_match(pkt)
     parent.assertTrue(match_fields is not None, "Flow match from pkt failed")
     in_port = oxm_field.in_port(ing_port)
-    match_fields.add(in_port) 
+    match_fields.add(in_port, owned=True)
     request = message.flow_mod()
     request.match_fields = match_fields
     request.buffer_id = 0xffffffff
@@ -708,15 +698,109 @@ def flow_msg_install(parent, request, clear_table=True):
     parent.assertTrue(rv != -1, "Error installing flow mod")
     do_barrier(parent.controller)
 
+def flow_msg_install_bulk(parent, requests, window=256, max_windows=4,
+                          timeout=5):
+    """
+    Install many flow mod messages, pipelined behind barriers
+
+    The flow mods are sent in windows of up to window messages, each
+    written at once and closed by a barrier request.  Up to max_windows
+    windows are in flight; before sending another, wait for the barrier
+    of the oldest.  Once a barrier reply arrives the switch has
+    reported any errors for the flow mods before it, so errors are
+    collected per window.
+
+    @param parent Must implement controller, logger, assertTrue
+    @param requests An iterable of flow mod messages, all set to go;
+    a generator avoids building all of them at once
+    @param window The number of flow mods per barrier
+    @param max_windows The number of windows in flight
+    @param timeout The timeout in seconds for each barrier reply
+    @return A dict with keys flows (number of flow mods sent), windows
+    (number of windows), errors (list of (window index, error message,
+    request) for the flow mods rejected, in order of arrival), elapsed
+    (seconds) and rate (flows per second)
+    """
+    ctrl = parent.controller
+    in_flight = deque()      # (window index, barrier xid, flow mod xids)
+    pending = {}             # flow mod xid -> (window index, request)
+    result = {'flows' : 0, 'windows' : 0, 'errors' : []}
+
+    def errors_collect():
+        while True:
+            (response, raw) = ctrl.poll(ofp.OFPT_ERROR)
+            if response is None:
+                return
+            (idx, request) = pending.get(response.header.xid, (None, None))
+            result['errors'].append((idx, response, request))
+
+    def window_wait():
+        (idx, barrier_xid, xids) = in_flight.popleft()
+        (reply, _) = ctrl.transact_wait(barrier_xid, timeout=timeout)
+        parent.assertTrue(reply is not None,
+                          "No barrier reply for flow window " + str(idx))
+        errors_collect()
+        for xid in xids:
+            del pending[xid]
+
+    def window_send(batch):
+        if len(in_flight) >= max_windows:
+            window_wait()
+        idx = result['windows']
+        xids = []
+        for request in batch:
+            if request.header.xid == 0:
+                request.header.xid = ofutils.gen_xid()
+            pending[request.header.xid] = (idx, request)
+            xids.append(request.header.xid)
+        rv = ctrl.message_send_many(batch)
+        parent.assertTrue(rv != -1, "Error installing flow mods")
+        barrier_xid = ctrl.transact_start(message.barrier_request())
+        parent.assertTrue(barrier_xid is not None, "Error sending barrier")
+        in_flight.append((idx, barrier_xid, xids))
+        result['flows'] += len(batch)
+        result['windows'] += 1
+
+    start = time.time()
+    batch = []
+    for request in requests:
+        batch.append(request)
+        if len(batch) >= window:
+            window_send(batch)
+            batch = []
+    if batch:
+        window_send(batch)
+    while in_flight:
+        window_wait()
+    result['elapsed'] = time.time() - start
+
+    result['rate'] = 0
+    if result['elapsed'] > 0:
+        result['rate'] = result['flows'] / result['elapsed']
+    parent.logger.info("Installed %d flows in %d windows in %.3f sec "
+                       "(%.0f flows/sec), %d errors" %
+                       (result['flows'], result['windows'], result['elapsed'],
+                        result['rate'], len(result['errors'])))
+    return result
+
 def error_verify(parent, exp_type, exp_code):
     """
     Receive an error msg and verify if it is as expected
 
+    A barrier fences the messages sent before, so the error is looked
+    for as soon as the barrier reply arrives rather than after a fixed
+    wait; if the barrier is not answered, wait for the error as before.
+
     @param parent Must implement controller, assertEqual
     @param exp_type Expected error type
     @param exp_code Expected error code
     """
-    (response, raw) = parent.controller.poll(ofp.OFPT_ERROR, 2)
+    (reply, _) = parent.controller.transact(message.barrier_request(),
+                                            timeout=2)
+    if reply is not None:
+        (response, raw) = parent.controller.poll(ofp.OFPT_ERROR)
+    else:
+        (response, raw) = parent.controller.poll(ofp.OFPT_ERROR, 2)
     parent.assertTrue(response is not None, 'No error message received')
 
     if (exp_type is None) or (exp_code is None):
@@ -1502,9 +1586,11 @@ def flow_match_test_mpls(parent, port_map, wildcards=0,
                 parent.logger.info("Ran " + str(test_count) + " tests; exiting")
                 return
 
-def flow_stats_get(parent, match_fields = None):
+def flow_stats_get(parent, match_fields = None, lazy=False):
     """ Get the flow_stats from the switch
     Test the response to make sure it's really a flow_stats object
+    @param lazy If True, keep the entries packed until accessed; see
+    Controller.transact_wait
     """
     request = message.flow_stats_request()
     request.out_port = ofp.OFPP_ANY
@@ -1512,8 +1598,29 @@ def flow_stats_get(parent, match_fields = None):
     request.table_id = 0xff
     if match_fields != None:
         request.match_fields = match_fields
-    response, _ = parent.controller.transact(request, timeout=2)
+    response, _ = parent.controller.transact(request, timeout=2, lazy=lazy)
     parent.assertTrue(response is not None, "Did not get response")
     parent.assertTrue(isinstance(response,message.flow_stats_reply),
                       "Expected a flow_stats_reply, but didn't get it")
     return response
+
+def flow_stats_diff(old_stats, new_stats):
+    """
+    Compare two flow stats dumps, such as the stats of two flow_stats_get
+    replies, matching their entries by flow_key
+
+    @return (added, removed, changed): the lists of entries only in
+    new_stats, of entries only in old_stats and of (old, new) entry
+    pairs whose packet or byte counts differ
+    """
+    old_flows = dict([(flow_key(entry), entry) for entry in old_stats])
+    added = []
+    changed = []
+    for entry in new_stats:
+        old = old_flows.pop(flow_key(entry), None)
+        if old is None:
+            added.append(entry)
+        elif (old.packet_count != entry.packet_count or
+              old.byte_count != entry.byte_count):
+            changed.append((old, entry))
+    return (added, old_flows.values(), changed)
@@ -0,0 +1,69 @@
+#!/usr/bin/python
+
+import logging
+import threading
+import unittest
+from oftest import message
+from oftest import cstruct as ofp
+from oftest import parse
+from oftest.controller_unittests import connected_controller, recv_msg
+import testutils
+
+class flow_msg_install_bulk(unittest.TestCase):
+    def runTest(self):
+        (self.controller, peer) = connected_controller()
+        self.logger = logging.getLogger("testutils_unittests")
+        requests = [message.flow_mod() for idx in range(10)]
+        rejected = requests[5]
+        # Per barrier, the flow mods before it and the barriers in
+        # flight when it arrived
+        barriers = []
+        state = {'flow_mods' : 0, 'in_flight' : 0}
+        lock = threading.Lock()
+        def barrier_reply(xid):
+            lock.acquire()
+            state['in_flight'] -= 1
+            lock.release()
+            reply = message.barrier_reply()
+            reply.header.xid = xid
+            self.controller._pkt_handle(reply.pack())
+        def switch():
+            while len(barriers) < 3:
+                hdr = parse.of_header_parse(recv_msg(peer))
+                if hdr.type == ofp.OFPT_FLOW_MOD:
+                    state['flow_mods'] += 1
+                    if hdr.xid == rejected.header.xid:
+                        error = message.flow_mod_failed_error_msg()
+                        error.header.xid = hdr.xid
+                        error.code = ofp.OFPFMFC_OVERLAP
+                        self.controller._pkt_handle(error.pack())
+                elif hdr.type == ofp.OFPT_BARRIER_REQUEST:
+                    lock.acquire()
+                    state['in_flight'] += 1
+                    barriers.append((state['flow_mods'], state['in_flight']))
+                    lock.release()
+                    # Answer late so the next windows are sent meanwhile
+                    threading.Timer(0.05, barrier_reply, [hdr.xid]).start()
+        responder = threading.Thread(target=switch)
+        responder.start()
+        result = testutils.flow_msg_install_bulk(self, iter(requests),
+                                                 window=4, max_windows=2,
+                                                 timeout=2)
+        responder.join()
+        self.assertEqual(result['flows'], 10)
+        self.assertEqual(result['windows'], 3)
+        self.assertEqual(len(result['errors']), 1)
+        (idx, error, request) = result['errors'][0]
+        self.assertEqual(idx, 1)
+        self.assertEqual(error.code, ofp.OFPFMFC_OVERLAP)
+        self.assertTrue(request is rejected)
+        # One barrier closes each window, and no more than max_windows
+        # are in flight
+        self.assertEqual([flow_mods for (flow_mods, _) in barriers],
+                         [4, 8, 10])
+        self.assertEqual(max([in_flight for (_, in_flight) in barriers]), 2)
+        self.assertEqual(len(self.controller.xid_pending), 0)
+        self.assertEqual(self.controller.poll(ofp.OFPT_ERROR), (None, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Measure the controller receive path under a packet_in storm
+
+Feeds --messages packet_in messages, in socket-sized chunks, through
+Controller._pkt_handle with the default receive queue bound, so that
+most of them are evicted unread, then polls what is left.  Reports
+the messages received per second.  Given a baseline git revision, the
+same measurement is made with the oftest package from that revision:
+
+    ./controller_rx.py --baseline-rev=HEAD~1
+
+Run with src/python in PYTHONPATH.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+from optparse import OptionParser
+
+import oftest.message as message
+import oftest.match as match
+import oftest.controller as controller
+import oftest.cstruct as ofp
+
+def stream_create(count):
+    """
+    Return the packet_in stream as a list of 32KB chunks
+    """
+    msg = message.packet_in()
+    msg.match_fields.add(match.in_port(1))
+    msg.data = "x" * 128
+    stream = msg.pack() * count
+    size = controller.RCV_SIZE_DEFAULT
+    return [stream[start:start + size]
+            for start in range(0, len(stream), size)]
+
+def rx_rate(count):
+    """
+    Return the messages received per second over count messages
+    """
+    chunks = stream_create(count)
+    ctrl = controller.Controller()
+    start = time.time()
+    for chunk in chunks:
+        ctrl._pkt_handle(chunk)
+    while ctrl.poll(ofp.OFPT_PACKET_IN)[0] is not None:
+        pass
+    return count / (time.time() - start)
+
+def baseline_rate(rev, count):
+    """
+    Run the measurement against the oftest package at git revision rev
+    """
+    top = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..")
+    tmpdir = tempfile.mkdtemp()
+    try:
+        archive = subprocess.Popen(["git", "archive", rev, "src/python"],
+                                   cwd=top, stdout=subprocess.PIPE)
+        subprocess.check_call(["tar", "-x", "-C", tmpdir],
+                              stdin=archive.stdout)
+        archive.wait()
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.join(tmpdir, "src", "python")
+        out = subprocess.check_output([sys.executable,
+                                       os.path.abspath(__file__),
+                                       "--raw", "-n", str(count)],
+                                      cwd=tmpdir, env=env)
+    finally:
+        shutil.rmtree(tmpdir)
+    return float(out.split()[-1])
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-n", "--messages", type="int", default=100000,
+                      help="packet_in messages received")
+    parser.add_option("--baseline-rev",
+                      help="Git revision of the baseline oftest package")
+    parser.add_option("--raw", action="store_true",
+                      help="Print only the messages per second")
+    (opts, args) = parser.parse_args()
+
+    current = rx_rate(opts.messages)
+    if opts.raw:
+        print "%.0f" % current
+        return
+    print "%-24s %12s" % ("oftest", "msgs/sec")
+    print "%-24s %12.0f" % ("current", current)
+    if opts.baseline_rev:
+        base = baseline_rate(opts.baseline_rev, opts.messages)
+        print "%-24s %12.0f" % (opts.baseline_rev, base)
+        print "%-24s %11.2fx" % ("speedup", current / base)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Measure pack and unpack speed of the generated cstruct classes
+
+Times pack() and unpack() of every ofp_* class in oftest.cstruct and,
+given a baseline version of cstruct.py, the same classes from the
+baseline, reporting the speedup per class:
+
+    ./cstruct_codec.py --baseline-rev=HEAD~1
+    ./cstruct_codec.py --baseline=/path/to/old/cstruct.py
+
+Run with src/python in PYTHONPATH.
+"""
+
+import os
+import sys
+import imp
+import timeit
+import inspect
+import subprocess
+import tempfile
+from optparse import OptionParser
+
+import oftest.cstruct as cstruct
+
+def baseline_load(path=None, rev=None):
+    """
+    Load a baseline cstruct module from a file or a git revision
+    """
+    if rev is not None:
+        top = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "..", "..")
+        src = subprocess.check_output(
+            ["git", "show", rev + ":src/python/oftest/cstruct.py"], cwd=top)
+        (fd, path) = tempfile.mkstemp(suffix=".py")
+        os.write(fd, src)
+        os.close(fd)
+    return imp.load_source("cstruct_baseline", path)
+
+def classes(mod):
+    """
+    Return the (name, class) pairs of the ofp_* classes in mod that pack
+    """
+    result = []
+    for (name, cls) in inspect.getmembers(mod, inspect.isclass):
+        if not name.startswith("ofp_"):
+            continue
+        obj = cls()
+        try:
+            binary = obj.pack()
+            if binary is None:
+                continue
+            obj.unpack(binary)
+        except StandardError:
+            continue   # Broken in this version
+        result.append((name, cls))
+    return result
+
+def codec_time(cls, number, repeat):
+    """
+    Return the best time in seconds per pack and per unpack call
+    """
+    obj = cls()
+    binary = obj.pack()
+    pack = min(timeit.repeat(obj.pack, number=number, repeat=repeat))
+    unpack = min(timeit.repeat(lambda: obj.unpack(binary), number=number,
+                               repeat=repeat))
+    return (pack / number, unpack / number)
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("--baseline", help="Baseline cstruct.py to compare")
+    parser.add_option("--baseline-rev",
+                      help="Git revision of the baseline cstruct.py")
+    parser.add_option("-n", "--number", type="int", default=20000,
+                      help="Calls per timing")
+    parser.add_option("-r", "--repeat", type="int", default=3,
+                      help="Timings per measurement; the best is kept")
+    (opts, args) = parser.parse_args()
+
+    baseline = None
+    if opts.baseline or opts.baseline_rev:
+        baseline = baseline_load(opts.baseline, opts.baseline_rev)
+
+    print "%-32s %10s %10s" % ("class (ns/call)", "pack", "unpack"),
+    if baseline:
+        print "%10s %10s %8s %8s" % ("base pack", "base unp", "x pack",
+                                     "x unpack"),
+    print
+    totals = [0.0, 0.0, 0.0, 0.0]
+    for (name, cls) in classes(cstruct):
+        (pack, unpack) = codec_time(cls, opts.number, opts.repeat)
+        print "%-32s %10.0f %10.0f" % (name, pack * 1e9, unpack * 1e9),
+        if baseline and name in dict(classes(baseline)):
+            (bpack, bunpack) = codec_time(getattr(baseline, name),
+                                          opts.number, opts.repeat)
+            print "%10.0f %10.0f %7.2fx %7.2fx" % (bpack * 1e9, bunpack * 1e9,
+                                                   bpack / pack,
+                                                   bunpack / unpack),
+            totals = [totals[0] + pack, totals[1] + unpack,
+                      totals[2] + bpack, totals[3] + bunpack]
+        print
+    if baseline and totals[0]:
+        print "%-32s %10.0f %10.0f %10.0f %10.0f %7.2fx %7.2fx" % \
+            ("total", totals[0] * 1e9, totals[1] * 1e9, totals[2] * 1e9,
+             totals[3] * 1e9, totals[2] / totals[0], totals[3] / totals[1])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Measure how much of a frame burst dataplane ports capture
+
+Sends --count frames back to back out of one end of veth pairs with
+raw sockets, round robin over the pairs, while DataPlane ports poll
+the other ends, and reports how many frames the ports queued and how
+long it took to drain them.  Run once per capture backend, or with
+and without --reactor, to compare them:
+
+    sudo ip link add veth0 type veth peer name veth1
+    sudo ip link set veth0 up
+    sudo ip link set veth1 up
+    sudo ./dataplane_burst.py --send-if=veth0 --recv-if=veth1 --capture=ring
+    sudo ./dataplane_burst.py --send-if=veth0 --recv-if=veth1 --capture=pcap
+    # With a second pair, veth2 and veth3, set up likewise
+    sudo ./dataplane_burst.py --send-if=veth0,veth2 --recv-if=veth1,veth3 \
+        --reactor
+
+Requires root.  Run with src/python in PYTHONPATH.
+"""
+
+import time
+import socket
+import logging
+from optparse import OptionParser
+
+import oftest.dataplane as dataplane
+
+from dataplane_poll_latency import bench_frame, bench_seq
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("--send-if", default="veth0",
+                      help="Comma separated interfaces to transmit on")
+    parser.add_option("--recv-if", default="veth1",
+                      help="Comma separated interfaces to capture on "
+                      "(peers of --send-if)")
+    parser.add_option("-n", "--count", type="int", default=100000,
+                      help="Number of frames in the burst")
+    parser.add_option("--capture", default="auto",
+                      help="Capture backend: ring, pcap or auto")
+    parser.add_option("--reactor", action="store_true",
+                      help="Receive on all ports from one thread")
+    (opts, args) = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    dp = dataplane.DataPlane(capture=opts.capture, reactor=opts.reactor)
+    recv_ifs = opts.recv_if.split(",")
+    for (idx, recv_if) in enumerate(recv_ifs):
+        dp.port_add(recv_if, idx + 1)
+        dp.port_list[idx + 1].max_pkts = opts.count
+    # All ports open with the same backend
+    capture_name = dp.port_list[1].capture.name
+    time.sleep(1)
+    for port in dp.port_list.values():
+        port.flush()
+
+    frames = [bench_frame(seq) for seq in range(opts.count)]
+    socks = []
+    for send_if in opts.send_if.split(","):
+        sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW)
+        sock.bind((send_if, 0))
+        socks.append(sock)
+    start = time.time()
+    for (seq, frame) in enumerate(frames):
+        socks[seq % len(socks)].send(frame)
+    sent = time.time() - start
+
+    received = 0
+    while True:
+        (port_number, pkt, pkt_time) = dp.poll(timeout=1)
+        if pkt is None:
+            break
+        if bench_seq(pkt) is not None:
+            received += 1
+            last = time.time()
+    dp.kill()
+
+    print "capture          %s" % capture_name
+    print "threads          %s" % ["per port", "reactor"][bool(opts.reactor)]
+    print "sent             %d in %.3fs" % (opts.count, sent)
+    print "received         %d (%.1f%%)" % (received,
+                                            100.0 * received / opts.count)
+    if received:
+        print "drained in       %.3fs" % (last - start)
+    print "capture drops    %d" % sum([port.capture.dropped()
+                                       for port in dp.port_list.values()])
+
+if __name__ == "__main__":
+    main()
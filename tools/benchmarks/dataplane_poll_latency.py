@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Measure DataPlane.poll wakeup latency
+
+Sends frames out of one end of a veth pair and polls for them on the
+other end, reporting how long after arrival each blocked poll returns
+(poll-to-arrival latency) as well as the send-to-poll round trip.
+
+Requires root and a veth pair, as set up for the local platform:
+
+    sudo ip link add veth0 type veth peer name veth1
+    sudo ip link set veth0 up
+    sudo ip link set veth1 up
+    sudo ./dataplane_poll_latency.py --send-if=veth0 --recv-if=veth1
+"""
+
+import sys
+import time
+import struct
+import logging
+from optparse import OptionParser
+
+import oftest.dataplane as dataplane
+from oftest.ofutils import latency_summary
+
+# IEEE 802 local experimental ethertype; keeps the host stack out of it
+BENCH_ETHERTYPE = 0x88b5
+SEND_PORT = 1
+RECV_PORT = 2
+
+def bench_frame(seq, length=64):
+    """
+    Build a broadcast frame carrying a sequence number
+    """
+    frame = struct.pack("!6s6sHL", "\xff" * 6, "\x02\x00\x00\x00\x00\x01",
+                        BENCH_ETHERTYPE, seq)
+    return frame + "\x00" * (length - len(frame))
+
+def bench_seq(frame):
+    """
+    Return the sequence number of a benchmark frame or None
+    """
+    if len(frame) < 18:
+        return None
+    (ethertype, seq) = struct.unpack("!HL", frame[12:18])
+    if ethertype != BENCH_ETHERTYPE:
+        return None
+    return seq
+
+def report(name, samples):
+    summary = latency_summary(samples)
+    print ("%-16s n=%d min=%.1fus avg=%.1fus p50=%.1fus p99=%.1fus "
+           "max=%.1fus" % (name, summary["count"], summary["min_us"],
+                           summary["avg_us"], summary["p50_us"],
+                           summary["p99_us"], summary["max_us"]))
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("--send-if", default="veth0",
+                      help="Interface to transmit on")
+    parser.add_option("--recv-if", default="veth1",
+                      help="Interface to poll on (peer of --send-if)")
+    parser.add_option("-n", "--count", type="int", default=1000,
+                      help="Number of frames to send")
+    parser.add_option("--timeout", type="float", default=1.0,
+                      help="Poll timeout in seconds")
+    (opts, args) = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    dp = dataplane.DataPlane()
+    dp.port_add(opts.send_if, SEND_PORT)
+    dp.port_add(opts.recv_if, RECV_PORT)
+    # Let the port threads get into select before measuring
+    time.sleep(1)
+    dp.port_list[RECV_PORT].flush()
+
+    wakeup = []
+    round_trip = []
+    lost = 0
+    for seq in range(opts.count):
+        start = time.time()
+        dp.send(SEND_PORT, bench_frame(seq))
+        while True:
+            (port, pkt, pkt_time) = dp.poll(port_number=RECV_PORT,
+                                            timeout=opts.timeout)
+            now = time.time()
+            if pkt is None:
+                lost += 1
+                break
+            if bench_seq(pkt) == seq:
+                wakeup.append(now - pkt_time)
+                round_trip.append(now - start)
+                break
+
+    dp.kill()
+    if not wakeup:
+        print "No frames received on " + opts.recv_if
+        sys.exit(1)
+    report("poll-to-arrival", wakeup)
+    report("send-to-poll", round_trip)
+    print "lost             %d" % lost
+
+if __name__ == "__main__":
+    main()
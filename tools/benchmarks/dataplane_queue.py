@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Measure DataPlane queueing and any-port polling with many ports
+
+Adds --ports dataplane ports on one interface, stops capturing, then
+queues --count packets round robin over the ports and times polling
+them all back with poll() for any port, and flushing full queues.
+
+Requires root for the capture sockets:
+
+    sudo ./dataplane_queue.py --ports=64
+
+Run with src/python in PYTHONPATH.
+"""
+
+import time
+import logging
+from optparse import OptionParser
+
+import oftest.dataplane as dataplane
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-i", "--interface", default="lo",
+                      help="Interface to open the ports on")
+    parser.add_option("-p", "--ports", type="int", default=64,
+                      help="Number of ports")
+    parser.add_option("-n", "--count", type="int", default=100000,
+                      help="Number of packets queued")
+    (opts, args) = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    dp = dataplane.DataPlane(reactor=True)
+    for port_number in range(1, opts.ports + 1):
+        dp.port_add(opts.interface, port_number)
+    dp.kill()
+    ports = dp.port_list.values()
+    for port in ports:
+        port.flush()
+        port.max_pkts = opts.count
+
+    start = time.time()
+    for seq in range(opts.count):
+        ports[seq % len(ports)].enqueue([("pkt", start + seq * 1e-6)])
+    queued = time.time() - start
+
+    start = time.time()
+    polled = 0
+    while dp.poll()[1] is not None:
+        polled += 1
+    poll_time = time.time() - start
+
+    for seq in range(opts.count):
+        ports[seq % len(ports)].enqueue([("pkt", seq)])
+    start = time.time()
+    for port in ports:
+        port.flush()
+    flush_time = time.time() - start
+
+    print "ports            %d" % len(ports)
+    print "queued           %d in %.3fs" % (opts.count, queued)
+    print "any-port polls   %d in %.3fs (%.1fus each)" % \
+        (polled, poll_time, poll_time * 1e6 / max(polled, 1))
+    print "flushed          %d in %.3fs" % (opts.count, flush_time)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Compare eager and lazy decoding of a large flow stats dump
+
+Packs --entries flow stats entries into flow stats reply segments of
+at most 64KB, as a switch sends a full table dump, then for each
+decoding mode parses the segments, merges them into one reply and
+sums the packet counts of all entries.  Reports the time taken and
+the bytes held by the merged entries:
+
+    ./flow_stats_lazy.py -n 100000
+
+Run with src/python in PYTHONPATH.
+"""
+
+import sys
+import time
+from optparse import OptionParser
+
+import oftest.message as message
+import oftest.parse as parse
+
+from flow_stats_memory import entry_create, deep_size
+
+def segments_create(count):
+    """
+    Return the packed reply segments holding count entries
+    """
+    segments = []
+    entry_len = len(entry_create(0).pack())
+    per_segment = (0xffff - 16) / entry_len
+    for first in range(0, count, per_segment):
+        reply = message.flow_stats_reply()
+        for idx in range(first, min(first + per_segment, count)):
+            reply.stats.append(entry_create(idx))
+        segments.append(reply.pack())
+    return segments
+
+def dump_scan(segments, lazy):
+    """
+    Parse and merge the segments and sum the packet counts
+
+    @param lazy If True, keep the entries packed
+    @return (merged reply, total packet count)
+    """
+    reply = parse.of_message_parse(segments[0], lazy=lazy)
+    for seg in segments[1:]:
+        reply.stats.extend(parse.of_message_parse(seg, lazy=lazy).stats)
+    if lazy:
+        total = sum(reply.stats.packet_count(idx)
+                    for idx in xrange(len(reply.stats)))
+    else:
+        total = sum(entry.packet_count for entry in reply.stats)
+    return (reply, total)
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-n", "--entries", type="int", default=100000,
+                      help="Flow stats entries in the dump")
+    (opts, args) = parser.parse_args()
+
+    segments = segments_create(opts.entries)
+    print "%d entries in %d segments" % (opts.entries, len(segments))
+    print "%-8s %10s %14s %12s" % ("mode", "seconds", "MB held",
+                                  "packets")
+    for lazy in [False, True]:
+        start = time.time()
+        (reply, total) = dump_scan(segments, lazy)
+        elapsed = time.time() - start
+        size = deep_size(reply.stats)
+        print "%-8s %10.3f %14.1f %12d" % (["eager", "lazy"][lazy], elapsed,
+                                          float(size) / 2**20, total)
+
+if __name__ == "__main__":
+    main()
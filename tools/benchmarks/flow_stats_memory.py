@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+Measure the memory held by decoded flow stats entries
+
+Decodes a flow stats reply of --entries flow_stats_entry objects, each
+with a few match fields and an apply actions instruction, and reports
+the bytes held per entry: every object reachable from the entry, its
+match and instruction lists and their items, counted once with
+sys.getsizeof.  Given a baseline git revision, the same measurement is
+made with the oftest package from that revision:
+
+    ./flow_stats_memory.py --baseline-rev=HEAD~1
+
+Run with src/python in PYTHONPATH.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+from optparse import OptionParser
+
+import oftest.message as message
+import oftest.match as match
+import oftest.action as action
+import oftest.instruction as instruction
+
+def entry_create(idx):
+    """
+    Return a flow stats entry for the idx'th flow of the reply
+    """
+    entry = message.flow_stats_entry()
+    entry.priority = idx & 0xffff
+    entry.packet_count = idx
+    entry.byte_count = idx * 64
+    entry.match_fields.add(match.in_port(1 + idx % 48))
+    entry.match_fields.add(match.eth_type(0x800))
+    entry.match_fields.add(match.ipv4_dst(0x0a000000 + idx))
+    inst = instruction.instruction_apply_actions()
+    act = action.action_output()
+    act.port = 1 + (idx + 1) % 48
+    inst.actions.add(act)
+    entry.instructions.add(inst)
+    return entry
+
+def reply_decode(count):
+    """
+    Return a flow_stats_reply holding count decoded entries
+
+    Entries are decoded one at a time from their own packed string
+    rather than from one packed reply, which slices quadratically.
+    """
+    reply = message.flow_stats_reply()
+    for idx in range(count):
+        obj = message.flow_stats_entry()
+        obj.unpack(entry_create(idx).pack())
+        reply.stats.append(obj)
+    return reply
+
+def deep_size(obj):
+    """
+    Return the bytes held by obj and every object reachable from it
+
+    Each object is counted once; classes are not followed.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        if hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+        for cls in type(obj).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+    return total
+
+def entry_bytes(count):
+    """
+    Return the bytes held per decoded entry of a count entry reply
+    """
+    empty = deep_size(reply_decode(0).stats)
+    reply = reply_decode(count)
+    return float(deep_size(reply.stats) - empty) / count
+
+def baseline_bytes(rev, count):
+    """
+    Run the measurement against the oftest package at git revision rev
+    """
+    top = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..")
+    tmpdir = tempfile.mkdtemp()
+    try:
+        archive = subprocess.Popen(["git", "archive", rev, "src/python"],
+                                   cwd=top, stdout=subprocess.PIPE)
+        subprocess.check_call(["tar", "-x", "-C", tmpdir],
+                              stdin=archive.stdout)
+        archive.wait()
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.join(tmpdir, "src", "python")
+        out = subprocess.check_output([sys.executable,
+                                       os.path.abspath(__file__),
+                                       "--raw", "-n", str(count)],
+                                      cwd=tmpdir, env=env)
+    finally:
+        shutil.rmtree(tmpdir)
+    return float(out.split()[-1])
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-n", "--entries", type="int", default=10000,
+                      help="Flow stats entries decoded")
+    parser.add_option("--baseline-rev",
+                      help="Git revision of the baseline oftest package")
+    parser.add_option("--raw", action="store_true",
+                      help="Print only the bytes per entry")
+    (opts, args) = parser.parse_args()
+
+    current = entry_bytes(opts.entries)
+    if opts.raw:
+        print "%.1f" % current
+        return
+    print "%-24s %12s %14s" % ("oftest", "bytes/entry", "MB/50k entries")
+    print "%-24s %12.1f %14.1f" % ("current", current, current * 50000 / 2**20)
+    if opts.baseline_rev:
+        base = baseline_bytes(opts.baseline_rev, opts.entries)
+        print "%-24s %12.1f %14.1f" % (opts.baseline_rev, base,
+                                       base * 50000 / 2**20)
+        print "%-24s %11.2fx" % ("reduction", base / current)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Compare the ways of adding items to action, instruction and bucket lists
+
+Builds --messages flow mods, each with an apply actions instruction of
+--actions set field and output actions, and as many group mods of
+--actions buckets, then packs them.  Items are added in three ways:
+one at a time as copies (add), as copies in one deep copy per list
+(extend), and handed over to the lists without copies (owned).
+Reports the time taken by each:
+
+    ./list_build.py -n 1000 -a 16
+
+Run with src/python in PYTHONPATH.
+"""
+
+import time
+from optparse import OptionParser
+
+import oftest.message as message
+import oftest.match as match
+import oftest.action as action
+import oftest.instruction as instruction
+import oftest.bucket as bucket
+
+def actions_create(count):
+    """
+    Return a list of count actions, alternating set field and output
+    """
+    actions = []
+    for idx in range(count):
+        if idx % 2:
+            act = action.action_output()
+            act.port = idx
+        else:
+            act = action.action_set_field()
+            act.field = match.tcp_src(idx)
+        actions.append(act)
+    return actions
+
+def items_add(item_list, items, mode):
+    """
+    Add items to item_list as given by mode
+    """
+    if mode == "add":
+        for item in items:
+            item_list.add(item)
+    elif mode == "extend":
+        item_list.extend(items)
+    else:
+        item_list.extend(items, owned=True)
+
+def build(count, action_count, mode):
+    """
+    Build and pack count flow mods and group mods
+    """
+    for idx in range(count):
+        request = message.flow_mod()
+        inst = instruction.instruction_apply_actions()
+        items_add(inst.actions, actions_create(action_count), mode)
+        items_add(request.instructions, [inst], mode)
+        request.pack()
+
+        group = message.group_mod()
+        buckets = []
+        for bucket_idx in range(action_count):
+            b = bucket.bucket()
+            items_add(b.actions, actions_create(2), mode)
+            buckets.append(b)
+        items_add(group.buckets, buckets, mode)
+        group.pack()
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-n", "--messages", type="int", default=1000,
+                      help="Flow mods and group mods built")
+    parser.add_option("-a", "--actions", type="int", default=16,
+                      help="Actions per flow mod and buckets per group mod")
+    (opts, args) = parser.parse_args()
+
+    print "%-8s %10s" % ("mode", "seconds")
+    for mode in ["add", "extend", "owned"]:
+        start = time.time()
+        build(opts.messages, opts.actions, mode)
+        print "%-8s %10.3f" % (mode, time.time() - start)
+
+if __name__ == "__main__":
+    main()
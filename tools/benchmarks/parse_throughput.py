@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Measure OpenFlow message parse throughput
+
+Reads the header of and parses a mix of packed messages (echo,
+packet_in, port status, error, barrier and stats replies) as the
+controller does for each received message, and reports the messages
+parsed per second.  Given a baseline git revision, the same
+measurement is made with the oftest package from that revision:
+
+    ./parse_throughput.py --baseline-rev=HEAD~1
+
+Run with src/python in PYTHONPATH.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+from optparse import OptionParser
+
+import oftest.message as message
+import oftest.parse as parse
+import oftest.match as match
+
+def messages_create():
+    """
+    Return a list of packed messages of commonly received types
+    """
+    msgs = []
+    msg = message.echo_request()
+    msg.data = "ping"
+    msgs.append(msg)
+    msg = message.packet_in()
+    msg.match_fields.add(match.in_port(1))
+    msg.data = "x" * 64
+    msgs.append(msg)
+    msgs.append(message.port_status())
+    msgs.append(message.bad_request_error_msg())
+    msgs.append(message.barrier_reply())
+    msg = message.port_stats_reply()
+    msg.stats.append(message.port_stats_entry())
+    msgs.append(msg)
+    msgs.append(message.desc_stats_reply())
+    return [msg.pack() for msg in msgs]
+
+def parse_rate(count):
+    """
+    Return the messages parsed per second over count messages
+    """
+    pkts = messages_create()
+    pkts = (pkts * (count / len(pkts) + 1))[:count]
+    # Older trees build a header object instead
+    header_read = getattr(parse, "of_header_unpack", parse.of_header_parse)
+    start = time.time()
+    for pkt in pkts:
+        header_read(pkt)
+        parse.of_message_parse(pkt)
+    return count / (time.time() - start)
+
+def baseline_rate(rev, count):
+    """
+    Run the measurement against the oftest package at git revision rev
+    """
+    top = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..")
+    tmpdir = tempfile.mkdtemp()
+    try:
+        archive = subprocess.Popen(["git", "archive", rev, "src/python"],
+                                   cwd=top, stdout=subprocess.PIPE)
+        subprocess.check_call(["tar", "-x", "-C", tmpdir],
+                              stdin=archive.stdout)
+        archive.wait()
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.join(tmpdir, "src", "python")
+        out = subprocess.check_output([sys.executable,
+                                       os.path.abspath(__file__),
+                                       "--raw", "-n", str(count)],
+                                      cwd=tmpdir, env=env)
+    finally:
+        shutil.rmtree(tmpdir)
+    return float(out.split()[-1])
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-n", "--messages", type="int", default=100000,
+                      help="Messages parsed")
+    parser.add_option("--baseline-rev",
+                      help="Git revision of the baseline oftest package")
+    parser.add_option("--raw", action="store_true",
+                      help="Print only the messages per second")
+    (opts, args) = parser.parse_args()
+
+    current = parse_rate(opts.messages)
+    if opts.raw:
+        print "%.0f" % current
+        return
+    print "%-24s %12s" % ("oftest", "msgs/sec")
+    print "%-24s %12.0f" % ("current", current)
+    if opts.baseline_rev:
+        base = baseline_rate(opts.baseline_rev, opts.messages)
+        print "%-24s %12.0f" % (opts.baseline_rev, base)
+        print "%-24s %11.2fx" % ("speedup", current / base)
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,8 @@ class --OBJ_TYPE--_--TYPE--(--PARENT_TYPE--):
 
     --DOC_INFO--
     \"""
+    __slots__ = ()
+
     def __init__(self):
         --PARENT_TYPE--.__init__(self)
         self.type = --ACT_INST_NAME--
@@ -13,6 +13,7 @@ print """
 # Python OpenFlow error wrapper classes
 
 from cstruct import *
+from base_list import buffer_bytes
 
 """
 
@@ -35,6 +36,8 @@ class --TYPE--_error_msg(ofp_error_msg):
     @arg data: Binary string following message members
     
     \"""
+    __slots__ = ['header', 'data']
+
     def __init__(self):
         ofp_error_msg.__init__(self)
         self.header = ofp_header()
@@ -50,10 +53,15 @@ class --TYPE--_error_msg(ofp_error_msg):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_error_msg.unpack(self, binary_string)
-        self.data = binary_string
-        return ""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        offset = ofp_error_msg.unpack_from(self, buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        self.data = buffer_bytes(buffer, offset, end)
+        return max(offset, end)
 
     def __len__(self):
         return OFP_HEADER_BYTES + OFP_ERROR_MSG_BYTES + len(self.data)
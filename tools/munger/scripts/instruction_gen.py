@@ -25,6 +25,8 @@ class --OBJ_TYPE--_--TYPE--(--PARENT_TYPE--):
 
     --DOC_INFO--
     \"""
+    __slots__ = ['actions']
+
     def __init__(self):
         --PARENT_TYPE--.__init__(self)
         self.type = --ACT_INST_NAME--
@@ -36,11 +38,12 @@ class --OBJ_TYPE--_--TYPE--(--PARENT_TYPE--):
         outstr += self.actions.show(prefix)
         return outstr
     def unpack(self, binary_string):
-        binary_string = --PARENT_TYPE--.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        offset = --PARENT_TYPE--.unpack_from(self, buffer, offset)
         bytes = self.len - OFP_INSTRUCTION_ACTIONS_BYTES
         self.actions = action_list()
-        binary_string = self.actions.unpack(binary_string, bytes=bytes)
-        return binary_string
+        return self.actions.unpack_from(buffer, offset, bytes=bytes)
     def pack(self):
         self.len = self.__len__()
         packed = ""
@@ -91,6 +91,8 @@ from cstruct import *
 from match import oxm_tlv
 from match import roundup
 from match_list import match_list
+from base_list import buffer_bytes
+from stats_list import lazy_stats_list, FLOW_STATS_FIELDS
 from action_list import action_list
 from instruction_list import instruction_list
 from bucket_list import bucket_list
@@ -305,6 +307,16 @@ def gen_message_wrapper(msg):
     print
     _p1('"""')
 
+    # Members beyond those of the (slotted) parent structure
+    slots = ["'header'"]
+    if has_match:
+        slots.append("'match_fields'")
+    if has_list:
+        slots.append("'" + list_var + "'")
+    if has_string:
+        slots.append("'data'")
+    _p1("__slots__ = [" + ", ".join(slots) + "]")
+
     print
     _p1("def __init__(self):")
     if has_core_members:
@@ -362,31 +374,54 @@ def gen_message_wrapper(msg):
         @return The remainder of binary_string that was not parsed.
 
         \"""
-        binary_string = self.header.unpack(binary_string)
-"""
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        \"""
+        Unpack object from a buffer at an offset without copying it
+
+        @param buffer The wire protocol bytes holding the object: a
+        string or other object supporting the buffer interface, such
+        as a memoryview.
+        @param offset The offset of the object in buffer
+        @return The offset in buffer just past the object.
+
+        \"""
+""",
+    # Trailing data and lists without their own length end with the
+    # message, as given by the header
+    uses_end = has_string or (has_list and list_type != None and
+                              msg != "packet_out") or msg == "features_reply"
+    if uses_end:
+        _p2("start = offset")
+    _p2("offset = self.header.unpack_from(buffer, offset)")
+    if uses_end:
+        _p2("end = min(start + self.header.length, len(buffer))")
+    print
     if has_core_members:
-        _p2("binary_string = " + parent + ".unpack(self, binary_string)")
+        _p2("offset = " + parent + ".unpack_from(self, buffer, offset)")
     if has_list:
         if msg == "features_reply":  # Special case port parsing
             # For now, cheat and assume the rest of the message is port list
-            _p2("while len(binary_string) >= OFP_PORT_BYTES:")
+            _p2("while end - offset >= OFP_PORT_BYTES:")
             _p3("new_port = ofp_port()")
-            _p3("binary_string = new_port.unpack(binary_string)")
+            _p3("offset = new_port.unpack_from(buffer, offset)")
             _p3("self.ports.append(new_port)")
         elif list_type == None:
             _p2("for obj in self." + list_var + ":")
-            _p3("binary_string = obj.unpack(binary_string)")
+            _p3("offset = obj.unpack_from(buffer, offset)")
         elif msg == "packet_out":  # Special case this
-            _p2('binary_string = self.actions.unpack(' + 
-                'binary_string, bytes=self.actions_len)')
+            _p2('offset = self.actions.unpack_from(' + 
+                'buffer, offset, bytes=self.actions_len)')
         else:
-            _p2("binary_string = self." + list_var + ".unpack(binary_string)")
+            _p2("offset = self." + list_var + ".unpack_from(buffer, offset, " +
+                "end - offset)")
     if has_string:
-        _p2("self.data = binary_string")
-        _p2("binary_string = ''")
+        _p2("self.data = buffer_bytes(buffer, offset, end)")
+        _p2("offset = max(offset, end)")
     else:
         _p2("# Fixme: If no self.data, add check for data remaining")
-    _p2("return binary_string")
+    _p2("return offset")
 
     print """
     def __len__(self):
@@ -498,7 +533,9 @@ class ofp_desc_stats_request(object):
     def pack(self, assertstruct=True):
         return ""
     def unpack(self, binary_string):
-        return binary_string
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        return offset
     def __len__(self):
         return 0
     def show(self, prefix=''):
@@ -519,7 +556,9 @@ class ofp_table_stats_request(object):
     def pack(self, assertstruct=True):
         return ""
     def unpack(self, binary_string):
-        return binary_string
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        return offset
     def __len__(self):
         return 0
     def show(self, prefix=''):
@@ -540,7 +579,9 @@ class ofp_group_desc_stats_request(object):
     def pack(self, assertstruct=True):
         return ""
     def unpack(self, binary_string):
-        return binary_string
+        return binary_string[self.unpack_from(binary_string):]
+    def unpack_from(self, buffer, offset=0):
+        return offset
     def __len__(self):
         return 0
     def show(self, prefix=''):
@@ -574,12 +615,17 @@ class --TYPE--_stats_request(ofp_stats_request, ofp_--TYPE--_stats_request):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_request.unpack(self, binary_string)
-        binary_string = ofp_--TYPE--_stats_request.unpack(self, binary_string)
-        if len(binary_string) != 0:
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_request.unpack_from(self, buffer, offset)
+        offset = ofp_--TYPE--_stats_request.unpack_from(self, buffer, offset)
+        if offset != end:
             print "ERROR unpacking --TYPE--: extra data"
-        return binary_string
+        return offset
 
     def __len__(self):
         return len(self.header) + OFP_STATS_REQUEST_BYTES + \\
@@ -611,12 +657,37 @@ class --TYPE--_stats_request(ofp_stats_request, ofp_--TYPE--_stats_request):
 ################################################################
 
 
+# Unpacking of the entries of stats reply messages
+stats_entries_unpack = """        dummy = --TYPE--_stats_entry()
+        while end - offset >= len(dummy):
+            obj = --TYPE--_stats_entry()
+            offset = obj.unpack_from(buffer, offset)
+            self.stats.append(obj)"""
+
+# Flow stats replies may keep their entries packed until accessed;
+# unpack takes a lazy argument for that
+flow_stats_unpack_args = ", lazy=False"
+flow_stats_unpack_pass = ", lazy=lazy"
+
+flow_stats_entries_unpack = """        if lazy:
+            # Keep the entries packed in a lazy_stats_list
+            self.stats = lazy_stats_list(flow_stats_entry, FLOW_STATS_FIELDS)
+            offset = self.stats.unpack_from(buffer, offset, end - offset)
+        else:
+            dummy = flow_stats_entry()
+            while end - offset >= len(dummy):
+                obj = flow_stats_entry()
+                offset = obj.unpack_from(buffer, offset)
+                self.stats.append(obj)"""
+
 # Template for objects stats reply messages
 stats_reply_template = """
 class --TYPE--_stats_reply(ofp_stats_reply):
     \"""
     Wrapper class for --TYPE-- stats reply
     \"""
+    __slots__ = ['header', 'stats']
+
     def __init__(self):
         self.header = ofp_header()
         ofp_stats_reply.__init__(self)
@@ -633,17 +704,18 @@ class --TYPE--_stats_reply(ofp_stats_reply):
             packed += obj.pack()
         return packed
 
-    def unpack(self, binary_string):
-        binary_string = self.header.unpack(binary_string)
-        binary_string = ofp_stats_reply.unpack(self, binary_string)
-        dummy = --TYPE--_stats_entry()
-        while len(binary_string) >= len(dummy):
-            obj = --TYPE--_stats_entry()
-            binary_string = obj.unpack(binary_string)
-            self.stats.append(obj)
-        if len(binary_string) != 0:
+    def unpack(self, binary_string--UNPACK_ARGS--):
+        return binary_string[self.unpack_from(binary_string--UNPACK_PASS--):]
+
+    def unpack_from(self, buffer, offset=0--UNPACK_ARGS--):
+        start = offset
+        offset = self.header.unpack_from(buffer, offset)
+        end = min(start + self.header.length, len(buffer))
+        offset = ofp_stats_reply.unpack_from(self, buffer, offset)
+--UNPACK_ENTRIES--
+        if offset != end:
             print "ERROR unpacking --TYPE-- stats string: extra bytes"
-        return binary_string
+        return offset
 
     def __len__(self):
         length = len(self.header) + OFP_STATS_REPLY_BYTES
@@ -700,6 +772,8 @@ class flow_stats_entry(ofp_flow_stats):
     \"""
     Special case flow stats entry to handle action list object
     \"""
+    __slots__ = ['match_fields', 'instructions']
+
     def __init__(self):
         ofp_flow_stats.__init__(self)
         self.match_fields = match_list()
@@ -716,13 +790,15 @@ class flow_stats_entry(ofp_flow_stats):
         return packed
 
     def unpack(self, binary_string):
-        binary_string = ofp_flow_stats.unpack(self, binary_string)
+        return binary_string[self.unpack_from(binary_string):]
+
+    def unpack_from(self, buffer, offset=0):
+        offset = ofp_flow_stats.unpack_from(self, buffer, offset)
         ai_len = self.length - OFP_FLOW_STATS_BYTES
         if ai_len < 0:
             print("ERROR: flow_stats_entry unpack length too small",
                   self.length)
-        binary_string = self.instructions.unpack(binary_string, bytes=ai_len)
-        return binary_string
+        return self.instructions.unpack_from(buffer, offset, bytes=ai_len)
 
     def __len__(self):
         return OFP_FLOW_STATS_BYTES + len(self.match_fields) + len(self.instructions)
@@ -792,6 +868,19 @@ if __name__ == '__main__':
         print to_print
         to_print = re.sub('--TYPE--', t, stats_reply_template)
         to_print = re.sub('--STATS_NAME--', stats_name, to_print)
+        if t == "flow":
+            to_print = to_print.replace('--UNPACK_ARGS--',
+                                        flow_stats_unpack_args)
+            to_print = to_print.replace('--UNPACK_PASS--',
+                                        flow_stats_unpack_pass)
+            to_print = to_print.replace('--UNPACK_ENTRIES--',
+                                        flow_stats_entries_unpack)
+        else:
+            to_print = to_print.replace('--UNPACK_ARGS--', '')
+            to_print = to_print.replace('--UNPACK_PASS--', '')
+            to_print = to_print.replace('--UNPACK_ENTRIES--',
+                                        stats_entries_unpack)
+            to_print = re.sub('--TYPE--', t, to_print)
         print to_print
 
     # Lastly, generate a tuple containing all the message classes
@@ -17,6 +17,10 @@ GEN_OBJ_EQUALITY = True
 # Generate object show functions
 GEN_OBJ_SHOW = True
 
+# Generate __slots__ for the struct members so objects carry no
+# per-instance __dict__
+GEN_OBJ_SLOTS = True
+
 # Generate lists of enum values
 GEN_ENUM_VALUES_LIST = False
 
@@ -40,6 +40,8 @@ class rules:
         self.excluded_macros = []
         ##Enforce mapping
         self.enforced_maps = {}
+        ##Structs whose classes keep a per-instance __dict__
+        self.unslotted_structs = []
 
     def get_enforced_map(self, structname):
         """Get code to enforce mapping
@@ -76,6 +78,11 @@ class rules:
         """
         return not (name in self.excluded_macros)
 
+    def use_slots(self, structname):
+        """Check if struct's class should declare __slots__
+        """
+        return not (structname in self.unslotted_structs)
+
 class pythonizer:
     """Class that pythonize C structures
 
@@ -203,6 +210,7 @@ class pythonizer:
 
         code=[]
         self.__assertcode = []
+        code.extend(self.codestructs(struct_in))
         code.extend(self.codeheader(struct_in))
         code.extend(self.codeinit(struct_in))
         code.append("")
@@ -236,8 +244,18 @@ class pythonizer:
         if IGNORE_ZERO_ARRAYS:
             code.append(self.tab+"Does not include var-length arrays")
         code.append(self.tab+"\"\"\"")
+        if GEN_OBJ_SLOTS and self.rules.use_slots(struct_in.typename):
+            code.append(self.tab+"__slots__ = "+self.codeslots(struct_in))
         return code
 
+    def codeslots(self, struct_in):
+        """Return Python code for the tuple of member names
+        """
+        names = ["'"+member.name+"'" for member in struct_in.members]
+        if (len(names) == 1):
+            return "("+names[0]+",)"
+        return "("+", ".join(names)+")"
+
     def codeinit(self, struct_in):
         """Return Python code for init function
         """
@@ -349,9 +367,87 @@ class pythonizer:
         code.append(self.tab*2+"return (True, None)")
         return code
 
+    def __layout(self, struct_in, prefix="!"):
+        """Return the layout of the fixed part of struct
+
+        Runs of consecutive primitives, primitive arrays and strings are
+        merged so each is coded by a single precompiled struct.Struct.
+        Returns a list of tuples, in member order:
+            ("prim", pattern, member names, offset, string member names)
+            ("struct", member name, offset)
+            ("structarr", member name, element count, element size, offset)
+            ("var", member) for empty arrays used as placeholder
+        """
+        layout = []
+        offset = 0
+        run = None
+        for member in struct_in.members:
+            if (isinstance(member, cheader.cprimitive)):
+                #Primitives
+                pattern = self.__c2py.structmap[member.typename]
+                names = ["self."+member.name]
+                strings = []
+            elif (isinstance(member, cheader.carray) and member.size != 0 and
+                  member.typename == "char"):
+                #String
+                pattern = str(member.size)+"s"
+                names = ["self."+member.name]
+                strings = names
+            elif (isinstance(member, cheader.carray) and member.size != 0 and
+                  isinstance(member.object, cheader.cprimitive)):
+                #Array of Primitives
+                pattern = self.__c2py.structmap[member.object.typename]*member.size
+                names = ["self."+member.name+"["+str(x)+"]"
+                         for x in range(0, member.size)]
+                strings = []
+            else:
+                run = None
+                if (isinstance(member, cheader.cstruct)):
+                    #Struct
+                    layout.append(("struct", member.name, offset))
+                    offset += self.__c2py.get_size(member, prefix)
+                elif (isinstance(member, cheader.carray) and member.size != 0 and
+                      isinstance(member.object, cheader.cstruct)):
+                    #Array of struct
+                    size = self.__c2py.get_size(member.object, prefix)
+                    layout.append(("structarr", member.name, member.size,
+                                   size, offset))
+                    offset += size * member.size
+                elif (isinstance(member, cheader.carray)):
+                    #Empty array used as placeholder
+                    layout.append(("var", member))
+                continue
+            if (run == None):
+                run = ["prim", "", [], offset, []]
+                layout.append(run)
+            run[1] += pattern
+            run[2].extend(names)
+            run[4].extend(strings)
+            offset += struct.calcsize(prefix+pattern)
+        return [tuple(item) for item in layout]
+
+    def __structname(self, struct_in, idx):
+        """Return name of the precompiled struct.Struct for a run
+        """
+        return "_"+struct_in.typename+"_s"+str(idx)
+
+    def codestructs(self, struct_in, prefix="!"):
+        """Return code declaring the precompiled struct.Struct objects
+        """
+        code = []
+        idx = 0
+        for item in self.__layout(struct_in, prefix):
+            if (item[0] == "prim"):
+                code.append(self.__structname(struct_in, idx)+\
+                            " = struct.Struct(\""+prefix+item[1]+"\")")
+                idx += 1
+        return code
+
     def codepack(self, struct_in, prefix="!"):
         """Return code that pack struct
         """
+        layout = self.__layout(struct_in, prefix)
+        structlen = self.__c2py.get_size(struct_in, prefix)
         code = []
         code.append(self.tab+"def pack(self, assertstruct=True):")
         code.append(self.tab*2+"\"\"\"Pack message")
@@ -359,67 +455,74 @@ class pythonizer:
         code.append(self.tab*2+"\"\"\"")
         code.append(self.tab*2+"if(assertstruct):")
         code.extend(self.__addassert(self.tab*3))
-        code.append(self.tab*2+"packed = \"\"")
-        primPattern = ""
-        primMemberNames = []
-        for member in struct_in.members:
-            if (isinstance(member, cheader.cprimitive)):
-                #Primitives
-                primPattern += self.__c2py.structmap[member.typename]
-                primMemberNames.append("self."+member.name)
+        fixed = [item for item in layout if item[0] != "var"]
+        var = [item[1] for item in layout if item[0] == "var"]
+        #Concatenating a few strings is cheaper than packing into a
+        #buffer and copying it out; pack_into serves callers composing
+        #a larger buffer
+        parts = []
+        idx = 0
+        for item in fixed:
+            if (item[0] == "prim"):
+                parts.append(self.__structname(struct_in, idx)+".pack("+\
+                             ", ".join(item[2])+")")
+                idx += 1
+            elif (item[0] == "struct"):
+                parts.append("self."+item[1]+".pack()")
+            elif (item[0] == "structarr"):
+                for x in range(0, item[2]):
+                    parts.append("self."+item[1]+"["+str(x)+"].pack()")
+        if (len(parts) == 0):
+            packed = "\"\""
+        else:
+            packed = " + ".join(parts)
+        if (len(var) == 0):
+            code.append(self.tab*2+"return "+packed)
+        else:
+            code.append(self.tab*2+"packed = "+packed)
+        for member in var:
+            code.append(self.tab*2+"for i in self."+member.name+":")
+            if (isinstance(member.object, cheader.cprimitive)):
+                code.append(self.tab*3+"packed += struct.pack(\""+\
+                            prefix+self.__c2py.get_pattern(member.object)+\
+                            "\",i)")
             else:
-                (primPattern, primMemberNames) = \
-                              self.__codepackprimitive(code, primPattern,
-                                                       primMemberNames, prefix)
-                if (isinstance(member, cheader.cstruct)):
-                    #Struct
-                    code.append(self.tab*2+"packed += self."+member.name+".pack()")
-                elif (isinstance(member, cheader.carray) and member.typename == "char"):
-                    #String
-                    code.append(self.tab*2+"packed += self."+member.name+".ljust("+\
-                                str(member.size)+",'\\0')")
-                elif (isinstance(member, cheader.carray) and \
-                      isinstance(member.object, cheader.cprimitive)):
-                    #Array of Primitives
-                    expandedarr = ""
-                    if (member.size != 0):
-                        for x in range(0, member.size):
-                            expandedarr += ", self."+member.name+"["+\
-                                           str(x).strip()+"]"
-                        code.append(self.tab*2+"packed += struct.pack(\""+prefix+\
-                                    self.__c2py.structmap[member.object.typename]*member.size+\
-                                    "\""+expandedarr+")")
-                    else:
-                        code.append(self.tab*2+"for i in self."+member.name+":")
-                        code.append(self.tab*3+"packed += struct.pack(\""+\
-                                    prefix+self.__c2py.get_pattern(member.object)+\
-                                    "\",i)")
-                elif (isinstance(member, cheader.carray) and \
-                      isinstance(member.object, cheader.cstruct)):
-                    #Array of struct
-                    if (member.size != 0):
-                        for x in range(0, member.size):
-                            code.append(self.tab*2+"packed += self."+member.name+"["+\
-                                        str(x).strip()+"].pack()")
-                    else:
-                        code.append(self.tab*2+"for i in self."+member.name+":")
-                        code.append(self.tab*3+"packed += i.pack(assertstruct)")
-        #Clear remaining fields
-        (primPattern, primMemberNames) = \
-                      self.__codepackprimitive(code, primPattern,
-                                               primMemberNames, prefix)
-        code.append(self.tab*2+"return packed")
+                code.append(self.tab*3+"packed += i.pack(assertstruct)")
+        if (len(var) != 0):
+            code.append(self.tab*2+"return packed")
+        code.append("")
+        code.append(self.tab+"def pack_into(self, buffer, offset=0):")
+        code.append(self.tab*2+"\"\"\"Pack message into buffer at offset")
+        code.append(self.tab*2+"Does not pack empty array used as placeholder")
+        code.append(self.tab*2+"Return the offset following the structure")
+        code.append(self.tab*2+"\"\"\"")
+        idx = 0
+        for item in fixed:
+            if (item[0] == "prim"):
+                code.append(self.tab*2+self.__structname(struct_in, idx)+\
+                            ".pack_into(buffer, "+self.__offset(item[3])+", "+\
+                            ", ".join(item[2])+")")
+                idx += 1
+            elif (item[0] == "struct"):
+                code.append(self.tab*2+"self."+item[1]+".pack_into(buffer, "+\
+                            self.__offset(item[2])+")")
+            elif (item[0] == "structarr"):
+                for x in range(0, item[2]):
+                    code.append(self.tab*2+"self."+item[1]+"["+str(x)+"]"+\
+                                ".pack_into(buffer, "+\
+                                self.__offset(item[4]+x*item[3])+")")
+        code.append(self.tab*2+"return offset + "+str(structlen))
         return code
 
-    def __codepackprimitive(self, code, primPattern, primMemberNames, prefix):
-        """Return code for packing primitives
+    def __offset(self, offset, base=None):
+        """Return code for offset, a constant if base is 0, else
+        relative to the offset argument
         """
-        if (primPattern != ""):
-            #Clear prior primitives
-            code.append(self.tab*2+"packed += struct.pack(\""+\
-                        prefix+primPattern+"\", "+\
-                        str(primMemberNames).replace("'","")[1:-1]+")")
-        return ("",[])
+        if (base == 0):
+            return str(offset)
+        if (offset == 0):
+            return "offset"
+        return "offset + "+str(offset)
 
     def codelen(self, struct_in):
         """Return code to return length
@@ -490,85 +593,60 @@ class pythonizer:
     def codeunpack(self, struct_in, prefix="!"):
         """Return code that unpack struct
         """
-        pattern = self.__c2py.get_pattern(struct_in)
-        structlen = self.__c2py.get_size(prefix + pattern)
+        layout = self.__layout(struct_in, prefix)
+        structlen = self.__c2py.get_size(struct_in, prefix)
         code = []
         code.append(self.tab+"def unpack(self, binaryString):")
         code.append(self.tab*2+"\"\"\"Unpack message")
         code.append(self.tab*2+"Do not unpack empty array used as placeholder")
         code.append(self.tab*2+"since they can contain heterogeneous type")
         code.append(self.tab*2+"\"\"\"")
-        code.append(self.tab*2+"if (len(binaryString) < "+str(structlen)+"):")
-        code.append(self.tab*3+"return binaryString")
-        offset = 0
-        primPattern = ""
-        primMemberNames = []
-        for member in struct_in.members:
-            if (isinstance(member, cheader.cprimitive)):
-                #Primitives
-                primPattern += self.__c2py.structmap[member.typename]
-                primMemberNames.append("self."+member.name)
-            else:
-                (primPattern, primMemberNames, offset) = \
-                              self.__codeunpackprimitive(code, offset, primPattern,
-                                                         primMemberNames, prefix)
-                if (isinstance(member, cheader.cstruct)):
-                    #Struct
-                    code.append(self.tab*2+"self."+member.name+\
-                                ".unpack(binaryString["+str(offset)+":])")
-                    pattern = self.__c2py.get_pattern(member)
-                    offset += self.__c2py.get_size(prefix+pattern)
-                elif (isinstance(member, cheader.carray) and member.typename == "char"):
-                    #String
-                    code.append(self.tab*2+"self."+member.name+\
-                                " = binaryString["+str(offset)+":"+\
-                                str(offset+member.size)+"].replace(\"\\0\",\"\")")
-                    offset += member.size
-                elif (isinstance(member, cheader.carray) and \
-                      isinstance(member.object, cheader.cprimitive)):
-                    #Array of Primitives
-                    expandedarr = ""
-                    if (member.size != 0):
-                        arrpattern = self.__c2py.structmap[member.object.typename]*member.size
-                        for x in range(0, member.size):
-                            expandedarr += "self."+member.name+"["+\
-                                           str(x).strip()+"], "
-                        code.append(self.tab*2 + "fmt = '" + prefix+arrpattern + "'")
-                        code.append(self.tab*2 + "start = " + str(offset))
-                        code.append(self.tab*2 + "end = start + struct.calcsize(fmt)")
-                        code.append(self.tab*2 + "("+expandedarr[:-2] + 
-                                    ") = struct.unpack(fmt, binaryString[start:end])")
-                        offset += struct.calcsize(prefix + arrpattern)
-                elif (isinstance(member, cheader.carray) and \
-                      isinstance(member.object, cheader.cstruct)):
-                    #Array of struct
-                    astructlen = self.__c2py.get_size("!"+self.__c2py.get_pattern(member.object))
-                    for x in range(0, member.size):
-                        code.append(self.tab*2+"self."+member.name+"["+str(x)+"]"+\
-                                ".unpack(binaryString["+str(offset)+":])")
-                        offset += astructlen
-        #Clear remaining fields
-        (primPattern, primMemberNames, offset) = \
-                      self.__codeunpackprimitive(code, offset, primPattern,
-                                                 primMemberNames, prefix)
-        code.append(self.tab*2+"return binaryString["+str(structlen)+":]");
+        if (structlen != 0):
+            code.append(self.tab*2+"if (len(binaryString) < "+str(structlen)+"):")
+            code.append(self.tab*3+"return binaryString")
+        code.extend(self.__codeunpackbody(struct_in, layout, "binaryString", 0))
+        code.append(self.tab*2+"return binaryString["+str(structlen)+":]")
+        code.append("")
+        code.append(self.tab+"def unpack_from(self, buffer, offset=0):")
+        code.append(self.tab*2+"\"\"\"Unpack message from buffer at offset")
+        code.append(self.tab*2+"Do not unpack empty array used as placeholder")
+        code.append(self.tab*2+"Return the offset following the structure,")
+        code.append(self.tab*2+"unchanged if buffer is too short")
+        code.append(self.tab*2+"\"\"\"")
+        if (structlen != 0):
+            code.append(self.tab*2+"if (len(buffer) - offset < "+str(structlen)+"):")
+            code.append(self.tab*3+"return offset")
+        code.extend(self.__codeunpackbody(struct_in, layout, "buffer", None))
+        code.append(self.tab*2+"return offset + "+str(structlen))
         return code
 
-    def __codeunpackprimitive(self, code, offset, primPattern,
-                              primMemberNames, prefix):
-        """Return code for unpacking primitives
-        """
-        if (primPattern != ""):
-            #Clear prior primitives
-            code.append(self.tab*2 + "fmt = '" + prefix + primPattern + "'")
-            code.append(self.tab*2 + "start = " + str(offset))
-            code.append(self.tab*2 + "end = start + struct.calcsize(fmt)")
-            if len(primMemberNames) == 1:
-                code.append(self.tab*2 + "(" + str(primMemberNames[0]) + 
-                            ",) = struct.unpack(fmt, binaryString[start:end])")
-            else:
-                code.append(self.tab*2+"("+str(primMemberNames).replace("'","")[1:-1]+
-                            ") = struct.unpack(fmt,  binaryString[start:end])")
-
-        return ("",[], offset+struct.calcsize(prefix+primPattern))
+    def __codeunpackbody(self, struct_in, layout, bufname, base):
+        """Return code unpacking the fixed part of struct from bufname
 
+        Offsets are constants if base is 0, else relative to offset.
+        """
+        code = []
+        idx = 0
+        for item in layout:
+            if (item[0] == "prim"):
+                if len(item[2]) == 1:
+                    targets = item[2][0]+","
+                else:
+                    targets = ", ".join(item[2])
+                code.append(self.tab*2+"("+targets+") = "+\
+                            self.__structname(struct_in, idx)+\
+                            ".unpack_from("+bufname+", "+\
+                            self.__offset(item[3], base)+")")
+                for name in item[4]:
+                    code.append(self.tab*2+name+" = "+name+\
+                                ".replace(\"\\0\",\"\")")
+                idx += 1
+            elif (item[0] == "struct"):
+                code.append(self.tab*2+"self."+item[1]+".unpack_from("+\
+                            bufname+", "+self.__offset(item[2], base)+")")
+            elif (item[0] == "structarr"):
+                for x in range(0, item[2]):
+                    code.append(self.tab*2+"self."+item[1]+"["+str(x)+"]"+\
+                                ".unpack_from("+bufname+", "+\
+                                self.__offset(item[4]+x*item[3], base)+")")
+        return code
@@ -35,6 +35,14 @@ class rules(cpythonize.rules):
         self.excluded_macros = ['OFP_ASSERT(EXPR)','OFP_ASSERT(_EXPR)','OFP_ASSERT',
                                 'icmp_type','icmp_code','OFP_PACKED',
                                 'OPENFLOW_OPENFLOW_H']
+        ##Stats request bodies are mixed into the stats request
+        ##message classes alongside ofp_stats_request; only one base
+        ##of a class can have a non-empty __slots__ layout
+        self.unslotted_structs = ['ofp_aggregate_stats_request',
+                                  'ofp_flow_stats_request',
+                                  'ofp_port_stats_request',
+                                  'ofp_queue_stats_request',
+                                  'ofp_group_stats_request']
         ##Enforce mapping
         if GEN_ENUM_VALUES_LIST:
             self.enforced_maps['ofp_header'] = [ ('type','ofp_type_values') ]